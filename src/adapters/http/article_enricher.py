@@ -0,0 +1,177 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Dict, List, Optional
+import requests
+from lxml import etree, html
+from adapters.http.http_cache import HttpCache
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+from adapters.http.session import build_session, is_retryable
+from core.domain.batch import NewsBatch, NewsRecords
+from core.domain.interfaces import Enricher
+from core.domain.tracing import get_tracer
+
+DESCRIPTION_XPATHS = (
+    "//meta[@name='description']/@content",
+    "//meta[@property='og:description']/@content",
+    "//meta[@name='twitter:description']/@content",
+    "//article//p[normalize-space()][1]",
+)
+
+
+def extract_description(page: html.HtmlElement) -> str:
+    """
+    Extracts the lead of an article page: its meta description, or its first paragraph.
+
+    Args:
+        page (html.HtmlElement): The parsed article page.
+
+    Returns:
+        str: The description, or an empty string if the page has none.
+    """
+    for xpath in DESCRIPTION_XPATHS:
+        for value in page.xpath(xpath):
+            text = value.text_content() if isinstance(value, html.HtmlElement) else str(value)
+            text = " ".join(text.split())
+            if text:
+                return text
+    return ""
+
+
+class HttpArticleEnricher(Enricher):
+    """
+    Fills in `NewsArticle.description` by fetching the article pages over pooled HTTP connections,
+    with bounded concurrency, instead of navigating to each of them in the browser.
+
+    Articles that already have a description, like those replayed from a checkpoint, are skipped,
+    and each URL is fetched once per call. Fresh cache hits are served without waiting for the limiter.
+
+    Attributes:
+        workers (int): Maximum number of concurrent page fetches.
+        timeout (float): Timeout, in seconds, for each page request.
+        limiter (Optional[AdaptiveRateLimiter]): The limiter pacing the fetches, shared with the scraper.
+        cache (Optional[HttpCache]): The on-disk cache of article pages, shared with the scraper.
+        _session (Optional[requests.Session]): The pooled HTTP session, initialized lazily.
+        _executor (Optional[ThreadPoolExecutor]): The fetch thread pool, initialized lazily.
+
+    Methods:
+        session: Property to initialize and get the pooled HTTP session.
+        executor: Property to initialize and get the fetch thread pool.
+        enrich: Fills in the descriptions of a list or a NewsBatch of articles.
+        close: Releases the thread pool and the HTTP session.
+    """
+
+    def __init__(
+        self,
+        workers: int = 16,
+        timeout: float = 15,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[HttpCache] = None,
+    ) -> None:
+        self.workers = workers
+        self.timeout = timeout
+        self.limiter = limiter
+        self.cache = cache
+        self._session = session
+        self._executor = None
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Initializes and returns the pooled HTTP session if not already initialized.
+
+        Returns:
+            requests.Session: The session shared by all fetch workers.
+        """
+        if self._session is None:
+            self._session = build_session(
+                pool_size=self.workers, retries=0 if self.limiter else 3, cache=self.cache
+            )
+        return self._session
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Initializes and returns the fetch thread pool if not already initialized.
+
+        Returns:
+            ThreadPoolExecutor: The bounded thread pool running the fetches.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="enricher")
+        return self._executor
+
+    def enrich(self, news_list: NewsRecords) -> int:
+        """
+        Fetches the pages of the articles without a description concurrently and fills in their leads.
+        Failed fetches and pages that cannot be parsed are logged and leave the description empty.
+
+        Args:
+            news_list (NewsRecords): The articles to enrich, as a list or a NewsBatch.
+
+        Returns:
+            int: The number of articles whose description was filled in.
+        """
+        if isinstance(news_list, NewsBatch):
+            urls, descriptions = news_list.urls, news_list.descriptions
+        else:
+            urls = [article.url for article in news_list]
+            descriptions = [article.description for article in news_list]
+        pending: Dict[str, List[int]] = {}
+        for index, (url, description) in enumerate(zip(urls, descriptions)):
+            if not description and url:
+                pending.setdefault(url, []).append(index)
+        if not pending:
+            return 0
+
+        start = perf_counter()
+        with get_tracer().span("enrich", articles=len(pending)):
+            fetched = list(self.executor.map(self._fetch_description, pending))
+        enriched = 0
+        for indexes, description in zip(pending.values(), fetched):
+            if description:
+                for index in indexes:
+                    if isinstance(news_list, NewsBatch):
+                        news_list.descriptions[index] = description
+                    else:
+                        news_list[index].description = description
+                enriched += len(indexes)
+        get_tracer().count("descriptions", enriched)
+        logging.info(f"Enriched {enriched}/{len(news_list)} articles in {perf_counter() - start:.2f}s.")
+        return enriched
+
+    def _fetch_description(self, url: str) -> str:
+        try:
+            if self.limiter is not None and not (self.cache is not None and self.cache.is_fresh(url)):
+                response = self.limiter.call(url, lambda: self._get(url), is_retryable)
+            else:
+                response = self._get(url)
+        except requests.RequestException as error:
+            logging.warning(f"Article fetch failed for {url}: {error}")
+            return ""
+        try:
+            page = html.fromstring(response.content, base_url=url)
+        except (etree.ParserError, ValueError) as error:
+            logging.warning(f"Article page could not be parsed for {url}: {error}")
+            return ""
+        return extract_description(page)
+
+    def _get(self, url: str) -> requests.Response:
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def close(self):
+        """
+        Releases the thread pool and the HTTP session.
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
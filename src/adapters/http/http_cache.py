@@ -0,0 +1,274 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from core.domain.tracing import get_tracer
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+
+class HttpCache:
+    """
+    An on-disk cache of HTTP responses shared by every session of the process and across runs. Bodies
+    are files named by the hash of their URL, indexed in SQLite with their validators, expiry, size and
+    last access, and the least recently used entries are evicted once the cache exceeds its size.
+
+    Attributes:
+        directory (Path): The directory holding the index and the bodies.
+        max_bytes (int): The size above which the least recently used bodies are evicted.
+        default_max_age (int): Seconds a response without `Cache-Control: max-age` is served without
+            revalidation.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 512 * 2**20, default_max_age: int = 0) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_max_age = default_max_age
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._stats = {"fresh": 0, "revalidated": 0, "misses": 0, "stored": 0, "evicted": 0}
+        self._connection = sqlite3.connect(self.directory / "index.sqlite3", check_same_thread=False)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+            """
+        )
+        self._total_bytes = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def lookup(self, url: str) -> Optional[Tuple[bytes, Dict[str, str], bool]]:
+        """
+        Gets the cached response of a URL and marks it as recently used.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            Optional[Tuple[bytes, Dict[str, str], bool]]: The body, the stored headers and whether the response
+                is still fresh, or None if the URL is not cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, headers, expires_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            body_file, headers, expires_at = row
+            try:
+                body = (self.directory / body_file).read_bytes()
+            except FileNotFoundError:
+                self._delete(url)
+                return None
+            now = time()
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+            self._connection.commit()
+        return body, json.loads(headers), expires_at > now
+
+    def is_fresh(self, url: str) -> bool:
+        """
+        Tells if a URL is cached and can be served without a request, so callers can skip pacing it.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            bool: True if the cached response has not expired, False if it is stale or not cached.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT expires_at FROM responses WHERE url = ?", (url,)).fetchone()
+        return row is not None and row[0] > time()
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str]):
+        """
+        Stores a response, unless it forbids caching or has neither validators nor a max-age, then evicts
+        the least recently used responses while the cache exceeds its size.
+
+        Args:
+            url (str): The requested URL.
+            body (bytes): The response body.
+            headers (Dict[str, str]): The response headers.
+
+        Returns:
+            None
+        """
+        cache_control = headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return
+        max_age = self._max_age(cache_control)
+        if not max_age and "ETag" not in headers and "Last-Modified" not in headers:
+            return
+
+        body_file = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        stored_headers = {name: headers[name] for name in STORED_HEADERS if name in headers}
+        now = time()
+        with self._lock:
+            (self.directory / body_file).write_bytes(body)
+            previous = self._connection.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (url, body, size, headers, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, body_file, len(body), json.dumps(stored_headers), now + max_age, now),
+            )
+            self._stats["stored"] += 1
+            self._evict()
+            self._connection.commit()
+
+    def refresh(self, url: str, headers: Dict[str, str]):
+        """
+        Extends the expiry of a response revalidated with a 304, taking the new validators if any.
+
+        Args:
+            url (str): The requested URL.
+            headers (Dict[str, str]): The headers of the 304 response.
+
+        Returns:
+            None
+        """
+        max_age = self._max_age(headers.get("Cache-Control", "").lower())
+        with self._lock:
+            row = self._connection.execute("SELECT headers FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            stored_headers = json.loads(row[0])
+            stored_headers.update({name: headers[name] for name in STORED_HEADERS if name in headers})
+            self._connection.execute(
+                "UPDATE responses SET headers = ?, expires_at = ? WHERE url = ?",
+                (json.dumps(stored_headers), time() + max_age, url),
+            )
+            self._connection.commit()
+
+    def record(self, outcome: str):
+        """
+        Counts the outcome of a request: "fresh", "revalidated" or "misses".
+
+        Args:
+            outcome (str): The outcome.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._stats[outcome] += 1
+        get_tracer().count(f"http_cache_{outcome}")
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the counters of the cache and its hit rate, the share of requests served from disk
+        either fresh or after a 304.
+
+        Returns:
+            Dict[str, float]: The counters, the hit rate and the size of the cache in bytes.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            total_bytes = self._total_bytes
+        requests_count = stats["fresh"] + stats["revalidated"] + stats["misses"]
+        hits = stats["fresh"] + stats["revalidated"]
+        return {**stats, "hit_rate": round(hits / requests_count, 3) if requests_count else 0.0, "bytes": total_bytes}
+
+    def close(self):
+        """
+        Logs the hit rate and closes the index.
+
+        Returns:
+            None
+        """
+        logging.info(f"HTTP cache: {self.stats()}")
+        self._connection.close()
+
+    def _max_age(self, cache_control: str) -> int:
+        if "no-cache" in cache_control:
+            return 0
+        match = MAX_AGE_PATTERN.search(cache_control)
+        return int(match.group(1)) if match else self.default_max_age
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes:
+            row = self._connection.execute(
+                "SELECT url FROM responses ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._delete(row[0])
+            self._stats["evicted"] += 1
+
+    def _delete(self, url: str):
+        row = self._connection.execute("SELECT body, size FROM responses WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return
+        (self.directory / row[0]).unlink(missing_ok=True)
+        self._connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+        self._total_bytes -= row[1]
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    A requests transport adapter that serves GET requests from an HttpCache: fresh responses come from
+    disk without a request, stale ones are revalidated with If-None-Match and If-Modified-Since, and
+    successful responses are stored.
+
+    Attributes:
+        cache (HttpCache): The cache shared by the sessions.
+    """
+
+    def __init__(self, cache: HttpCache, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        cached = self.cache.lookup(request.url)
+        if cached is not None:
+            body, headers, fresh = cached
+            if fresh:
+                self.cache.record("fresh")
+                return self._cached_response(request, body, headers)
+            if "ETag" in headers:
+                request.headers["If-None-Match"] = headers["ETag"]
+            if "Last-Modified" in headers:
+                request.headers["If-Modified-Since"] = headers["Last-Modified"]
+
+        response = super().send(request, **kwargs)
+        if cached is not None and response.status_code == 304:
+            self.cache.record("revalidated")
+            self.cache.refresh(request.url, response.headers)
+            response.close()
+            return self._cached_response(request, cached[0], {**cached[1], **response.headers})
+
+        self.cache.record("misses")
+        if response.status_code == 200:
+            self.cache.store(request.url, response.content, response.headers)
+        return response
+
+    @staticmethod
+    def _cached_response(request: requests.PreparedRequest, body: bytes, headers: Dict[str, str]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
@@ -0,0 +1,237 @@
+import logging
+import random
+from contextlib import contextmanager
+from threading import Condition
+from time import monotonic, sleep
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+from urllib.parse import urlsplit
+
+T = TypeVar("T")
+
+
+class _HostState:
+    def __init__(self, rate: float, burst: float, concurrency: float, now: float) -> None:
+        self.rate = rate
+        self.tokens = burst
+        self.refilled_at = now
+        self.concurrency = concurrency
+        self.active = 0
+        self.latency: Optional[float] = None
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+
+
+class AdaptiveRateLimiter:
+    """
+    Paces the requests sent to each host with a token bucket and a concurrency limit, both adapted
+    to what the host tolerates: additive increase while requests succeed under the target latency,
+    multiplicative decrease on timeouts and throttling errors. Failed requests are retried after an
+    exponential backoff with full jitter.
+
+    One limiter is shared by page loads and thumbnail downloads, so every host has a single budget.
+
+    Attributes:
+        burst (float): Maximum number of tokens a host bucket holds.
+        min_rate (float): Lowest request rate, in requests per second, a host is slowed down to.
+        max_rate (float): Highest request rate, in requests per second, a host is sped up to.
+        max_concurrency (int): Highest number of concurrent requests per host.
+        target_latency (float): Latency, in seconds, above which a host is considered saturated.
+        max_retries (int): Number of retries of a failed request.
+        backoff_base (float): Backoff, in seconds, before the first retry.
+        backoff_max (float): Maximum backoff, in seconds, before a retry.
+        clock (Callable[[], float]): The monotonic clock, in seconds, refilling the buckets and timing the requests.
+        sleep (Callable[[float], None]): Waits for a number of seconds, before a token or a retry.
+        rng (random.Random): The source of the backoff jitter.
+
+    Methods:
+        acquire: Blocks until the host bucket grants a request.
+        slot: Context manager holding a concurrency slot and a token of the host.
+        record: Adapts the pace of the host to the outcome of a request.
+        backoff: Returns the jittered delay before a retry.
+        call: Runs a request in a slot, retrying it on retryable errors.
+        stats: Returns the current pace and counters of every host.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: float = 4,
+        min_rate: float = 0.2,
+        max_rate: float = 20.0,
+        concurrency: int = 2,
+        max_concurrency: int = 8,
+        target_latency: float = 5.0,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        clock: Callable[[], float] = monotonic,
+        sleep: Callable[[float], None] = sleep,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency = concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self._hosts: Dict[str, _HostState] = {}
+        self._condition = Condition()
+
+    def _host(self, url: str) -> _HostState:
+        host = urlsplit(url).netloc
+        if host not in self._hosts:
+            self._hosts[host] = _HostState(self.rate, self.burst, self.concurrency, self.clock())
+        return self._hosts[host]
+
+    def acquire(self, url: str):
+        """
+        Blocks until the token bucket of the URL host grants a request.
+
+        Args:
+            url (str): The URL about to be requested.
+
+        Returns:
+            None
+        """
+        while True:
+            with self._condition:
+                state = self._host(url)
+                now = self.clock()
+                state.tokens = min(self.burst, state.tokens + (now - state.refilled_at) * state.rate)
+                state.refilled_at = now
+                if state.tokens >= 1:
+                    state.tokens -= 1
+                    return
+                delay = (1 - state.tokens) / state.rate
+            self.sleep(delay)
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """
+        Holds one of the concurrent requests allowed to the URL host, and a token of its bucket.
+
+        Args:
+            url (str): The URL about to be requested.
+
+        Yields:
+            None
+        """
+        with self._condition:
+            state = self._host(url)
+            while state.active >= max(1, int(state.concurrency)):
+                self._condition.wait()
+            state.active += 1
+        try:
+            self.acquire(url)
+            yield
+        finally:
+            with self._condition:
+                state.active -= 1
+                self._condition.notify_all()
+
+    def record(self, url: str, latency: float, ok: bool):
+        """
+        Adapts the pace of the URL host to the outcome of a request: a success under the target latency
+        raises the rate and the concurrency additively, a slow success lowers the concurrency, and an error
+        halves both.
+
+        Args:
+            url (str): The requested URL.
+            latency (float): The duration of the request, in seconds.
+            ok (bool): Whether the request succeeded.
+
+        Returns:
+            None
+        """
+        with self._condition:
+            state = self._host(url)
+            state.requests += 1
+            state.latency = latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+            if not ok:
+                state.errors += 1
+                state.rate = max(self.min_rate, state.rate / 2)
+                state.concurrency = max(1.0, state.concurrency / 2)
+            elif state.latency <= self.target_latency:
+                state.rate = min(self.max_rate, state.rate + self.rate / 10)
+                state.concurrency = min(self.max_concurrency, state.concurrency + 1 / state.concurrency)
+            else:
+                state.concurrency = max(1.0, state.concurrency * 0.9)
+            self._condition.notify_all()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay before a retry: a random fraction of an exponentially growing backoff.
+
+        Args:
+            attempt (int): The number of failed attempts so far, starting at 0.
+
+        Returns:
+            float: The delay, in seconds.
+        """
+        return self.rng.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def call(self, url: str, request: Callable[[], T], retryable: Callable[[Exception], bool]) -> T:
+        """
+        Runs a request in a concurrency slot of the URL host, recording its outcome, and retries it with
+        backoff while it fails with a retryable error.
+
+        Args:
+            url (str): The requested URL, whose host paces the request.
+            request (Callable[[], T]): The request to run.
+            retryable (Callable[[Exception], bool]): Tells if an error is transient, like a timeout
+                or a throttling response. Other errors are raised at once.
+
+        Returns:
+            T: The result of the request.
+
+        Raises:
+            Exception: The last error of the request once the retries are exhausted, or a non-retryable error.
+        """
+        for attempt in range(self.max_retries + 1):
+            with self.slot(url):
+                start = self.clock()
+                try:
+                    result = request()
+                except Exception as error:
+                    if not retryable(error):
+                        raise
+                    self.record(url, self.clock() - start, ok=False)
+                    if attempt == self.max_retries:
+                        raise
+                    last_error = error
+                else:
+                    self.record(url, self.clock() - start, ok=True)
+                    return result
+            delay = self.backoff(attempt)
+            with self._condition:
+                self._host(url).retries += 1
+            logging.warning(f"Retrying {url} in {delay:.1f}s after attempt {attempt + 1}: {last_error}")
+            self.sleep(delay)
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Returns the current pace and counters of every host.
+
+        Returns:
+            Dict[str, dict]: The rate, concurrency, latency, requests, errors and retries of each host.
+        """
+        with self._condition:
+            return {
+                host: {
+                    "rate": round(state.rate, 2),
+                    "concurrency": round(state.concurrency, 2),
+                    "latency": round(state.latency, 3) if state.latency is not None else None,
+                    "requests": state.requests,
+                    "errors": state.errors,
+                    "retries": state.retries,
+                }
+                for host, state in self._hosts.items()
+            }
@@ -0,0 +1,66 @@
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from adapters.http.http_cache import CachingAdapter, HttpCache
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_session(
+    pool_size: int = 10, retries: int = 3, backoff_factor: float = 0.5, cache: Optional[HttpCache] = None
+) -> requests.Session:
+    """
+    Builds a requests session with keep-alive connection pooling and automatic retries, serving
+    GET requests from an on-disk cache when one is given.
+
+    Connections are reused across requests to the same host, so downloading many thumbnails
+    from the same CDN only pays the TCP/TLS handshake once per pooled connection.
+
+    Args:
+        pool_size (int, optional): Maximum number of pooled connections per host. Defaults to 10.
+        retries (int, optional): Number of retries on connection errors and retryable status codes. Defaults to 3.
+        backoff_factor (float, optional): Exponential backoff factor between retries, in seconds. Defaults to 0.5.
+        cache (Optional[HttpCache], optional): The cache of the responses. Defaults to None.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET", "HEAD"),
+    )
+    if cache is not None:
+        adapter = CachingAdapter(cache, pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Tells if a request error is transient: a timeout, a connection error or a throttling or server status.
+
+    Args:
+        error (Exception): The error raised by the request.
+
+    Returns:
+        bool: True if the request may succeed when retried, False otherwise.
+    """
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in RETRY_STATUSES
+    return isinstance(error, (requests.Timeout, requests.ConnectionError))
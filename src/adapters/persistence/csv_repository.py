@@ -0,0 +1,67 @@
+import csv
+import logging
+from pathlib import Path
+from typing import Optional
+from robocorp.tasks import get_output_dir
+from adapters.persistence.schema import NEWS_COLUMNS, news_rows
+from core.domain.batch import NewsRecords
+from core.domain.interfaces import StreamingRespository
+
+
+class CsvRepository(StreamingRespository):
+    """
+    A repository that appends the articles of each scrape to a CSV file, with the columns
+    of NewsArticle as header. Every chunk is on disk when `append` returns.
+
+    Attributes:
+        output_dir (Path): Directory where the CSV files are written.
+    """
+
+    def __init__(self, output_dir: Optional[Path] = None) -> None:
+        self.output_dir = output_dir or get_output_dir()
+
+    def _output_path(self, scrape_id: str) -> Path:
+        return self.output_dir / Path(f"news_scrape_result_{scrape_id}").with_suffix(".csv")
+
+    def append(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Appends a chunk of news articles to the CSV file of the scrape.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+            news_list (NewsRecords): The chunk of news articles to append, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        output_path = self._output_path(scrape_id)
+        write_header = not output_path.exists()
+        with open(output_path, "a", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=NEWS_COLUMNS)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(news_rows(news_list))
+
+    def close(self, scrape_id: str):
+        """
+        Logs the CSV file of the scrape, which is complete after its last append.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+
+        Returns:
+            None
+        """
+        logging.info(f"Results Saved in: {self._output_path(scrape_id)}")
+
+    def discard(self, scrape_id: str):
+        """
+        Removes the CSV file of a scrape before it is resumed from a checkpoint.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+
+        Returns:
+            None
+        """
+        self._output_path(scrape_id).unlink(missing_ok=True)
@@ -1,32 +1,99 @@
+import json
 import logging
-from dataclasses import asdict
+from datetime import date
 from pathlib import Path
-from typing import List
-from pandas import DataFrame
+from typing import Optional
+from openpyxl import Workbook
 from robocorp.tasks import get_output_dir
-from core.domain.entities import NewsArticle
-from core.domain.interfaces import Respository
+from adapters.persistence.schema import NEWS_COLUMNS, news_rows
+from core.domain.batch import NewsRecords
+from core.domain.interfaces import StreamingRespository
+from core.domain.tracing import get_tracer
 
 
-class ExcelRepository(Respository):
-    def __init__(self) -> None:
-        self.output_dir = get_output_dir()
+class ExcelRepository(StreamingRespository):
+    def __init__(self, output_dir: Optional[Path] = None) -> None:
+        self.output_dir = output_dir or get_output_dir()
 
-    def save(self, scrape_id: str, news_list: List[NewsArticle]):
+    def save(self, scrape_id: str, news_list: NewsRecords):
         """
-        Saves the list of news articles to an Excel file.
+        Saves the list of news articles to an Excel file through the spool and the write-only workbook
+        of `close`, so large result sets are not copied into a DataFrame. A spool left by an earlier run
+        of the scrape is discarded first.
 
         Args:
             scrape_id (str): The ID of the scrape, used for naming the output file.
-            news_list (List[NewsArticle]): A list of news articles to save.
+            news_list (NewsRecords): A list or a NewsBatch of news articles to save.
 
         Returns:
             None
         """
-        filename = Path(f"news_scrape_result_{scrape_id}").with_suffix(".xlsx")
-        output_path: Path = self.output_dir / filename
+        self.discard(scrape_id)
+        self.append(scrape_id, news_list)
+        self.close(scrape_id)
 
-        news_list_dict = list(map(asdict, news_list))
-        df = DataFrame(news_list_dict)
-        df.to_excel(output_path, sheet_name=f"results_{scrape_id}", index=False)
+    def append(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Appends a chunk of news articles to the JSON lines spool of the scrape, so partial
+        results are on disk before the Excel file is written.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the spool file.
+            news_list (NewsRecords): The chunk of news articles to append, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        spool_path = self._spool_path(scrape_id)
+        with open(spool_path, "a", encoding="utf-8") as spool:
+            for row in news_rows(news_list):
+                spool.write(json.dumps(row, default=str) + "\n")
+        logging.info(f"Appended {len(news_list)} articles to: {spool_path}")
+
+    def close(self, scrape_id: str):
+        """
+        Streams the spooled articles of the scrape into an Excel file with a write-only workbook,
+        one row at a time, and removes the spool.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+
+        Returns:
+            None
+        """
+        spool_path = self._spool_path(scrape_id)
+        if not spool_path.exists() or spool_path.stat().st_size == 0:
+            logging.warning(f"No articles spooled for scrape: {scrape_id}")
+            return
+
+        output_path = self._output_path(scrape_id)
+        with get_tracer().span("excel_write"):
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet(title=f"results_{scrape_id}")
+            sheet.append(NEWS_COLUMNS)
+            with open(spool_path, encoding="utf-8") as spool:
+                for line in spool:
+                    row = json.loads(line)
+                    row["date"] = date.fromisoformat(row["date"])
+                    sheet.append([row[column] for column in NEWS_COLUMNS])
+            workbook.save(output_path)
+        spool_path.unlink()
         logging.info(f"Results Saved in: {output_path}")
+
+    def discard(self, scrape_id: str):
+        """
+        Removes the JSON lines spool of a scrape before it is resumed from a checkpoint.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the spool file.
+
+        Returns:
+            None
+        """
+        self._spool_path(scrape_id).unlink(missing_ok=True)
+
+    def _output_path(self, scrape_id: str) -> Path:
+        return self.output_dir / Path(f"news_scrape_result_{scrape_id}").with_suffix(".xlsx")
+
+    def _spool_path(self, scrape_id: str) -> Path:
+        return self.output_dir / Path(f"news_scrape_result_{scrape_id}").with_suffix(".jsonl")
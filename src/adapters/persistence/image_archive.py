@@ -0,0 +1,128 @@
+import io
+import logging
+import tarfile
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Dict, Optional, Tuple
+
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+    (b"BM", ".bmp"),
+)
+
+
+def sniff_extension(data: bytes) -> str:
+    """
+    Detects the image format from the magic bytes of its content.
+
+    Args:
+        data (bytes): The image content.
+
+    Returns:
+        str: The file extension of the detected format, or ".bin" if the format is unknown.
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    if data[4:12] in (b"ftypavif", b"ftypavis"):
+        return ".avif"
+    for signature, extension in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return extension
+    return ".bin"
+
+
+def split_member_path(image_path: str) -> Optional[Tuple[Path, str]]:
+    """
+    Splits a reference built by `ImageArchive.member_path` into the archive and the member name.
+
+    Args:
+        image_path (str): The image path saved in `NewsArticle.image_path`.
+
+    Returns:
+        Optional[Tuple[Path, str]]: The tar archive and the member name, or None if the image is a plain file.
+    """
+    archive, _, member = image_path.rpartition("/")
+    if not archive.endswith(".tar") or not member:
+        return None
+    return Path(archive), member
+
+
+class ImageArchive:
+    """
+    A content-addressed image store that streams every unique image of a scrape into a single
+    `images_<scrape_id>.tar`, named by the SHA-256 of its content.
+
+    Images are written as they arrive, and an image already in the archive is not written again.
+    The archive is opened in append mode, so a resumed scrape keeps adding to the same file.
+
+    Attributes:
+        path (Path): The tar archive of the scrape.
+        stored (int): The number of unique images written.
+        deduplicated (int): The number of images skipped because the archive already had them.
+
+    Methods:
+        add: Stores an image and returns its reference in the archive.
+        close: Finishes the archive.
+    """
+
+    def __init__(self, output_dir: Path, scrape_id: str) -> None:
+        self.path = output_dir / f"images_{scrape_id}.tar"
+        self.stored = 0
+        self.deduplicated = 0
+        self._lock = Lock()
+        self._tar = tarfile.open(self.path, mode="a")
+        self._members: Dict[str, str] = {Path(name).stem: name for name in self._tar.getnames()}
+
+    def member_path(self, member: str) -> str:
+        """
+        Builds the reference of an archive member saved in `NewsArticle.image_path`.
+
+        Args:
+            member (str): The member name inside the archive.
+
+        Returns:
+            str: The reference, formatted as "<archive path>/<member name>".
+        """
+        return f"{self.path}/{member}"
+
+    def add(self, data: bytes) -> str:
+        """
+        Stores an image in the archive, unless an image with the same content is already there.
+
+        Args:
+            data (bytes): The image content.
+
+        Returns:
+            str: The reference of the image in the archive.
+        """
+        digest = sha256(data).hexdigest()
+        with self._lock:
+            member = self._members.get(digest)
+            if member is not None:
+                self.deduplicated += 1
+                return self.member_path(member)
+
+            member = f"{digest}{sniff_extension(data)}"
+            info = tarfile.TarInfo(member)
+            info.size = len(data)
+            info.mtime = int(time())
+            self._tar.addfile(info, io.BytesIO(data))
+            self._members[digest] = member
+            self.stored += 1
+        return self.member_path(member)
+
+    def close(self):
+        """
+        Finishes the archive.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._tar.close()
+        logging.info(f"Archived {self.stored} unique images ({self.deduplicated} duplicates) in: {self.path}")
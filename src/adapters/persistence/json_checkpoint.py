@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+import shutil
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+from core.domain.entities import NewsArticle, ScrapeProgress
+from core.domain.interfaces import Checkpoint
+
+
+class JsonCheckpointStore(Checkpoint):
+    """
+    A checkpoint store with one directory per scrape: the articles of the completed pages are appended
+    to `articles.jsonl`, and `progress.json` holds the next offset and how many bytes of that file belong to
+    completed pages. The progress file is replaced atomically after the articles are flushed, so a crash
+    mid-page leaves the checkpoint of the previous page intact.
+
+    Attributes:
+        directory (Path): Directory holding the checkpoints of every scrape.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _scrape_dir(self, scrape_id: str) -> Path:
+        return self.directory / scrape_id
+
+    def _read_progress(self, scrape_id: str) -> Optional[dict]:
+        progress_path = self._scrape_dir(scrape_id) / "progress.json"
+        if not progress_path.exists():
+            return None
+        return json.loads(progress_path.read_text(encoding="utf-8"))
+
+    def load(self, scrape_id: str) -> Optional[ScrapeProgress]:
+        """
+        Gets the progress saved for a scrape, ignoring articles written after its last completed page.
+
+        Args:
+            scrape_id (str): The ID of the scrape.
+
+        Returns:
+            Optional[ScrapeProgress]: The offset of the next page and the articles of the completed pages,
+                or None if the scrape has no checkpoint.
+        """
+        progress = self._read_progress(scrape_id)
+        if progress is None:
+            return None
+
+        with open(self._scrape_dir(scrape_id) / "articles.jsonl", "rb") as file:
+            lines = file.read(progress["size"]).decode("utf-8").splitlines()
+        articles = [self._to_article(json.loads(line)) for line in lines]
+        return ScrapeProgress(next_offset=progress["next_offset"], articles=articles)
+
+    def save_page(self, scrape_id: str, next_offset: int, news_list: List[NewsArticle]):
+        """
+        Appends the articles of a completed page and records the offset the scrape continues from.
+
+        Args:
+            scrape_id (str): The ID of the scrape.
+            next_offset (int): The offset of the page the scrape continues from.
+            news_list (List[NewsArticle]): The articles of the completed page.
+
+        Returns:
+            None
+        """
+        scrape_dir = self._scrape_dir(scrape_id)
+        scrape_dir.mkdir(parents=True, exist_ok=True)
+        progress = self._read_progress(scrape_id) or {"next_offset": 0, "articles": 0, "size": 0}
+
+        with open(scrape_dir / "articles.jsonl", "ab") as file:
+            file.truncate(progress["size"])
+            for article in news_list:
+                file.write((json.dumps(asdict(article), default=str, ensure_ascii=False) + "\n").encode("utf-8"))
+            file.flush()
+            os.fsync(file.fileno())
+            size = file.tell()
+
+        progress = {"next_offset": next_offset, "articles": progress["articles"] + len(news_list), "size": size}
+        temp_path = scrape_dir / "progress.json.tmp"
+        temp_path.write_text(json.dumps(progress), encoding="utf-8")
+        os.replace(temp_path, scrape_dir / "progress.json")
+        logging.info(f"Checkpoint of scrape {scrape_id}: {progress['articles']} articles, next offset {next_offset}")
+
+    def clear(self, scrape_id: str):
+        """
+        Removes the checkpoint of a finished scrape.
+
+        Args:
+            scrape_id (str): The ID of the scrape.
+
+        Returns:
+            None
+        """
+        shutil.rmtree(self._scrape_dir(scrape_id), ignore_errors=True)
+
+    @staticmethod
+    def _to_article(values: dict) -> NewsArticle:
+        values["date"] = date.fromisoformat(values["date"])
+        return NewsArticle(**values)
@@ -0,0 +1,137 @@
+import json
+import logging
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+from typing import Iterator, List, Optional
+from robocorp.tasks import get_output_dir
+from core.domain.batch import NewsRecords
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import StreamingRespository
+
+
+class JsonLinesRepository(StreamingRespository):
+    """
+    A repository that appends the articles of each scrape to a JSON lines file, keeping every field
+    as native JSON. Image paths inside the output directory are stored relative to it, so the file can
+    be moved to another machine with its thumbnails, like the shards of a distributed scrape.
+
+    Attributes:
+        output_dir (Path): Directory where the JSON lines files are written.
+
+    Methods:
+        append: Appends a chunk of news articles.
+        close: Logs the saved scrape.
+        discard: Removes the file of a scrape before it is resumed.
+        output_path: Returns the JSON lines file of a scrape.
+        files: Lists the file of a scrape and the thumbnails it references.
+        read: Reads the articles of a JSON lines file.
+    """
+
+    def __init__(self, output_dir: Optional[Path] = None) -> None:
+        self.output_dir = output_dir or get_output_dir()
+
+    def output_path(self, scrape_id: str) -> Path:
+        """
+        Returns the JSON lines file of a scrape.
+
+        Args:
+            scrape_id (str): The ID of the scrape.
+
+        Returns:
+            Path: The file, which only exists once an article was appended.
+        """
+        return self.output_dir / Path(f"news_scrape_result_{scrape_id}").with_suffix(".jsonl")
+
+    def append(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Appends a chunk of news articles to the JSON lines file of the scrape.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+            news_list (NewsRecords): The chunk of news articles to append, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        with open(self.output_path(scrape_id), "a", encoding="utf-8") as file:
+            for article in news_list:
+                values = asdict(article)
+                values["image_path"] = self._relative_image_path(article.image_path)
+                file.write(json.dumps(values, default=str, ensure_ascii=False) + "\n")
+
+    def close(self, scrape_id: str):
+        """
+        Logs the JSON lines file of the scrape, which is complete after its last append.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+
+        Returns:
+            None
+        """
+        logging.info(f"Results Saved in: {self.output_path(scrape_id)}")
+
+    def discard(self, scrape_id: str):
+        """
+        Removes the JSON lines file of a scrape before it is resumed from a checkpoint.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+
+        Returns:
+            None
+        """
+        self.output_path(scrape_id).unlink(missing_ok=True)
+
+    def files(self, scrape_id: str) -> List[Path]:
+        """
+        Lists the JSON lines file of a scrape and the thumbnails, or image archives, its articles reference
+        in the output directory.
+
+        Args:
+            scrape_id (str): The ID of the scrape.
+
+        Returns:
+            List[Path]: The existing files, starting with the JSON lines file.
+        """
+        output_path = self.output_path(scrape_id)
+        if not output_path.exists():
+            return []
+
+        image_files = {}
+        with open(output_path, encoding="utf-8") as file:
+            for line in file:
+                image_path = Path(json.loads(line)["image_path"] or ".")
+                if image_path.parts and not image_path.is_absolute():
+                    # an archive reference "<archive>/<member>" is moved with its whole archive
+                    image_file = self.output_dir / image_path.parts[0]
+                    image_files.setdefault(image_file, image_file.exists())
+        return [output_path] + [image_file for image_file, exists in image_files.items() if exists]
+
+    @staticmethod
+    def read(path: Path) -> Iterator[NewsArticle]:
+        """
+        Reads the articles of a JSON lines file, resolving relative image paths against its directory.
+
+        Args:
+            path (Path): The JSON lines file.
+
+        Yields:
+            NewsArticle: The articles, in file order.
+        """
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                values = json.loads(line)
+                values["date"] = date.fromisoformat(values["date"])
+                if values["image_path"] and not Path(values["image_path"]).is_absolute():
+                    values["image_path"] = str(path.parent / values["image_path"])
+                yield NewsArticle(**values)
+
+    def _relative_image_path(self, image_path: str) -> str:
+        if not image_path:
+            return image_path
+        try:
+            return str(Path(image_path).relative_to(self.output_dir))
+        except ValueError:
+            return image_path
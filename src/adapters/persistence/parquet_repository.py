@@ -0,0 +1,96 @@
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+import pyarrow as pa
+import pyarrow.parquet as pq
+from robocorp.tasks import get_output_dir
+from adapters.persistence.schema import NEWS_COLUMNS, arrow_schema, batch_column, news_columns
+from core.domain.batch import NewsBatch, NewsRecords
+from core.domain.interfaces import StreamingRespository
+from core.domain.tracing import get_tracer
+
+
+class ParquetRepository(StreamingRespository):
+    """
+    A repository that streams the articles of each scrape into a Parquet file, writing every appended
+    chunk as row groups with an explicit schema derived from NewsArticle. The footer is written by `close`,
+    so the file of a scrape that crashed before it is unreadable, and is removed by `discard` when the
+    scrape is resumed.
+
+    Attributes:
+        output_dir (Path): Directory where the Parquet files are written.
+        row_group_size (int): Largest number of articles in a row group.
+        schema (pyarrow.Schema): The schema of the articles.
+    """
+
+    def __init__(self, row_group_size: int = 10_000, output_dir: Optional[Path] = None) -> None:
+        self.output_dir = output_dir or get_output_dir()
+        self.row_group_size = row_group_size
+        self.schema = arrow_schema()
+        self._writers: Dict[str, pq.ParquetWriter] = {}
+
+    def _output_path(self, scrape_id: str) -> Path:
+        return self.output_dir / Path(f"news_scrape_result_{scrape_id}").with_suffix(".parquet")
+
+    def append(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Writes a chunk of news articles as row groups, which are on disk when the call returns. A NewsBatch
+        is written column by column.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+            news_list (NewsRecords): The chunk of news articles to append, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        if isinstance(news_list, NewsBatch):
+            table = self._batch_table(news_list)
+        else:
+            table = pa.Table.from_pydict(news_columns(news_list), schema=self.schema)
+        if not table.num_rows:
+            return
+
+        with get_tracer().span("parquet_row_group", rows=table.num_rows):
+            writer = self._writers.get(scrape_id)
+            if writer is None:
+                writer = pq.ParquetWriter(self._output_path(scrape_id), self.schema)
+                self._writers[scrape_id] = writer
+            writer.write_table(table, row_group_size=self.row_group_size)
+
+    def close(self, scrape_id: str):
+        """
+        Writes the Parquet footer of the scrape.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+
+        Returns:
+            None
+        """
+        writer = self._writers.pop(scrape_id, None)
+        if writer is None:
+            logging.warning(f"No articles saved for scrape: {scrape_id}")
+            return
+        writer.close()
+        logging.info(f"Results Saved in: {self._output_path(scrape_id)}")
+
+    def discard(self, scrape_id: str):
+        """
+        Removes the Parquet file of a scrape before it is resumed from a checkpoint.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the output file.
+
+        Returns:
+            None
+        """
+        writer = self._writers.pop(scrape_id, None)
+        if writer is not None:
+            writer.close()
+        self._output_path(scrape_id).unlink(missing_ok=True)
+
+    def _batch_table(self, batch: NewsBatch) -> pa.Table:
+        dates = pa.array(batch.epoch_days(), type=pa.int32()).cast(pa.date32())
+        columns = {name: dates if name == "date" else batch_column(batch, name) for name in NEWS_COLUMNS}
+        return pa.Table.from_pydict(columns, schema=self.schema)
@@ -0,0 +1,102 @@
+import json
+from dataclasses import asdict, fields
+from datetime import date
+from typing import Any, Dict, Iterator, List, Sequence, Union, get_args, get_origin
+from core.domain.batch import NewsBatch, NewsRecords
+from core.domain.entities import NewsArticle
+
+
+def _column_type(annotation: Any) -> type:
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if get_origin(annotation) in (dict, list):
+        return str
+    return annotation
+
+
+COLUMN_TYPES: Dict[str, type] = {field.name: _column_type(field.type) for field in fields(NewsArticle)}
+NEWS_COLUMNS: List[str] = list(COLUMN_TYPES)
+JSON_COLUMNS: List[str] = [field.name for field in fields(NewsArticle) if get_origin(field.type) in (dict, list)]
+
+
+def article_row(article: NewsArticle) -> Dict[str, Any]:
+    """
+    Converts an article into a flat row, serializing dict and list fields as JSON text.
+
+    Args:
+        article (NewsArticle): The article to convert.
+
+    Returns:
+        Dict[str, Any]: The row, with scalar values only.
+    """
+    row = asdict(article)
+    for key, value in row.items():
+        if isinstance(value, (dict, list)):
+            row[key] = json.dumps(value, ensure_ascii=False)
+    return row
+
+
+def batch_column(batch: NewsBatch, name: str) -> Sequence[Any]:
+    """
+    Returns a flat column of a batch, serializing dict and list fields as JSON text.
+
+    Args:
+        batch (NewsBatch): The articles.
+        name (str): The name of the column.
+
+    Returns:
+        Sequence[Any]: The values of the column, scalar only.
+    """
+    values = batch.column(name)
+    if name in JSON_COLUMNS:
+        return [json.dumps(value, ensure_ascii=False) for value in values]
+    return values
+
+
+def news_columns(news_list: NewsRecords) -> Dict[str, Sequence[Any]]:
+    """
+    Converts articles into flat columns. A NewsBatch is read column by column, without building
+    an article or a row per article.
+
+    Args:
+        news_list (NewsRecords): The articles, as a list or a NewsBatch.
+
+    Returns:
+        Dict[str, Sequence[Any]]: The columns, in the order of the NewsArticle fields.
+    """
+    if isinstance(news_list, NewsBatch):
+        return {name: batch_column(news_list, name) for name in NEWS_COLUMNS}
+    columns: Dict[str, List[Any]] = {name: [] for name in NEWS_COLUMNS}
+    for article in news_list:
+        for name, value in article_row(article).items():
+            columns[name].append(value)
+    return columns
+
+
+def news_rows(news_list: NewsRecords) -> Iterator[Dict[str, Any]]:
+    """
+    Converts articles into flat rows, like `article_row`.
+
+    Args:
+        news_list (NewsRecords): The articles, as a list or a NewsBatch.
+
+    Returns:
+        Iterator[Dict[str, Any]]: The rows, with scalar values only.
+    """
+    if isinstance(news_list, NewsBatch):
+        columns = news_columns(news_list)
+        return (dict(zip(NEWS_COLUMNS, values)) for values in zip(*columns.values()))
+    return map(article_row, news_list)
+
+
+def arrow_schema():
+    """
+    Builds the explicit Arrow schema of the articles, derived from the NewsArticle fields.
+
+    Returns:
+        pyarrow.Schema: The schema, with JSON text for dict and list fields.
+    """
+    import pyarrow as pa
+
+    arrow_types = {str: pa.string(), date: pa.date32(), int: pa.int64(), bool: pa.bool_()}
+    return pa.schema([(name, arrow_types[column_type]) for name, column_type in COLUMN_TYPES.items()])
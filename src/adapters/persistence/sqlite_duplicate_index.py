@@ -0,0 +1,234 @@
+import logging
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from core.domain.batch import NewsRecords
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import DuplicateIndex
+from core.domain.near_duplicates import MinHashLsh, jaccard, normalize_text
+
+# band keys are random, so inserts and lookups touch pages all over the table: keep the hot pages in memory
+CACHE_KIB = 64 * 1024
+# a band shared by more articles is made of boilerplate shingles, not of a story, and is skipped by lookups
+MAX_BUCKET_SIZE = 50
+# an article sharing a single band with a lookup is only confirmed if the band is this rare: copies sharing one
+# band come from rare bands, while the other candidates sharing one band are what makes the slowest lookups
+MAX_SINGLE_BAND_BUCKET_SIZE = 5
+# the buckets of all the bands of a lookup are read in one query, each limited to MAX_BUCKET_SIZE + 1 articles
+BUCKET_QUERY = (
+    "SELECT band_key, article_id FROM (SELECT band_key, article_id FROM article_bands WHERE band_key = ? LIMIT ?)"
+)
+
+
+class SqliteDuplicateIndex(DuplicateIndex):
+    """
+    A SQLite index of the MinHash LSH band keys of saved articles, used to find near-duplicates across
+    sections and runs, like the same story listed in `world` and `business` or republished with a slightly
+    different headline.
+
+    The band keys are kept in a table clustered on the key, so a lookup is one query searching the index once
+    per band, whatever the size of the index. The candidates sharing a band are then confirmed by the exact
+    Jaccard similarity of their stored text, most shared bands first. Bands shared by more than MAX_BUCKET_SIZE
+    articles are skipped, and so are the candidates sharing a single band with more than
+    MAX_SINGLE_BAND_BUCKET_SIZE articles, as they would cost many confirmations for unrelated articles.
+
+    Articles found by a running scrape are reserved in memory for that scrape, so their later copies are
+    caught before they are saved, and only written once saved. The reservations of a scrape are only seen
+    by the scrape itself and are dropped by `release` when it ends, so an interrupted or failed scrape does
+    not turn its unsaved articles into duplicates for the next one.
+
+    Articles are fingerprinted by their title, the text the scrapers have when they check an article,
+    before its thumbnail is downloaded. Descriptions are only fetched later by the enricher, so they are
+    left out of the indexed fingerprints too, which would otherwise no longer match the lookups.
+
+    Attributes:
+        path (Path): The SQLite database file.
+        threshold (float): The Jaccard similarity from which two articles are duplicates.
+        hasher (MinHashLsh): The MinHash signatures and LSH band keys of the article texts.
+
+    Methods:
+        find_duplicate: Finds the article a new article is a near-duplicate of, reserving it if there is none.
+        add: Indexes saved articles.
+        release: Drops the articles a scrape reserved without saving them.
+        close: Closes the database connection.
+    """
+
+    def __init__(self, path: Path, threshold: float = 0.7, hasher: Optional[MinHashLsh] = None) -> None:
+        self.path = path
+        self.threshold = threshold
+        self.hasher = hasher or MinHashLsh()
+        self._lock = Lock()
+        # per scrape ID, the text and band keys of each reserved URL, and the reserved URLs of each band key
+        self._reserved: Dict[str, Dict[str, Tuple[str, List[int]]]] = {}
+        self._reserved_bands: Dict[str, Dict[int, Set[str]]] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(f"PRAGMA cache_size=-{CACHE_KIB}")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS indexed_articles (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                scrape_id TEXT NOT NULL,
+                text TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS article_bands (
+                band_key INTEGER NOT NULL,
+                article_id INTEGER NOT NULL,
+                PRIMARY KEY (band_key, article_id)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def _fingerprint(self, article: NewsArticle) -> Tuple[str, Set[bytes], List[int]]:
+        text = normalize_text(article.title)
+        shingles = self.hasher.shingles(text)
+        band_keys = self.hasher.band_keys(self.hasher.signature(shingles)) if shingles else []
+        return text, shingles, band_keys
+
+    def _candidates(self, scrape_id: str, band_keys: List[int]) -> Iterator[Tuple[str, str]]:
+        band_keys = list(dict.fromkeys(band_keys))
+        buckets: Dict[int, List[int]] = {}
+        if band_keys:
+            rows = self._connection.execute(
+                " UNION ALL ".join([BUCKET_QUERY] * len(band_keys)),
+                [value for band_key in band_keys for value in (band_key, MAX_BUCKET_SIZE + 1)],
+            )
+            for band_key, article_id in rows:
+                buckets.setdefault(band_key, []).append(article_id)
+
+        shared_bands: Dict[int, int] = Counter()
+        rare_bucket_ids = set()
+        for bucket in buckets.values():
+            if len(bucket) <= MAX_BUCKET_SIZE:
+                shared_bands.update(bucket)
+                if len(bucket) <= MAX_SINGLE_BAND_BUCKET_SIZE:
+                    rare_bucket_ids.update(bucket)
+        article_ids = [
+            article_id for article_id, count in shared_bands.items() if count > 1 or article_id in rare_bucket_ids
+        ]
+        if article_ids:
+            placeholders = ", ".join("?" for _ in article_ids)
+            rows = self._connection.execute(
+                f"SELECT id, url, text FROM indexed_articles WHERE id IN ({placeholders})", article_ids
+            ).fetchall()
+            rows.sort(key=lambda row: shared_bands[row[0]], reverse=True)
+            for _, url, text in rows:
+                yield url, text
+        reserved = self._reserved.get(scrape_id, {})
+        reserved_bands = self._reserved_bands.get(scrape_id, {})
+        for url in set().union(*(reserved_bands.get(band_key, ()) for band_key in band_keys)):
+            yield url, reserved[url][0]
+
+    def find_duplicate(self, scrape_id: str, article: NewsArticle) -> Optional[str]:
+        """
+        Finds the article a new article is a near-duplicate of: an article with the same URL saved by another
+        scrape, or an article saved by any scrape or reserved by the same scrape whose title is at least
+        `threshold` similar. An article that is not a duplicate is reserved for the scrape until it is saved
+        or released. Articles without a title are never duplicates.
+
+        Args:
+            scrape_id (str): The ID of the scrape finding the article.
+            article (NewsArticle): The article, with its title.
+
+        Returns:
+            Optional[str]: The URL of the first copy of the article, or None if it is not a duplicate.
+        """
+        text, shingles, band_keys = self._fingerprint(article)
+        if not shingles:
+            return None
+
+        with self._lock:
+            reserved = self._reserved.setdefault(scrape_id, {})
+            if article.url in reserved:
+                return None
+            row = self._connection.execute(
+                "SELECT scrape_id FROM indexed_articles WHERE url = ?", (article.url,)
+            ).fetchone()
+            if row is not None:
+                return None if row[0] == scrape_id else article.url
+
+            for url, candidate_text in self._candidates(scrape_id, band_keys):
+                if jaccard(shingles, self.hasher.shingles(candidate_text)) >= self.threshold:
+                    return url
+
+            reserved[article.url] = (text, band_keys)
+            reserved_bands = self._reserved_bands.setdefault(scrape_id, {})
+            for band_key in band_keys:
+                reserved_bands.setdefault(band_key, set()).add(article.url)
+        return None
+
+    def add(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Indexes the titles of saved articles in one transaction, skipping the articles flagged as duplicates.
+        The fingerprints of the articles reserved by `find_duplicate` are reused. The band keys are inserted
+        in key order, so each page of the table is written once per chunk.
+
+        Args:
+            scrape_id (str): The ID of the scrape that saved the articles.
+            news_list (NewsRecords): The saved articles, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        indexed = 0
+        band_rows = []
+        with self._lock, self._connection:
+            reserved_articles = self._reserved.get(scrape_id, {})
+            reserved_bands = self._reserved_bands.get(scrape_id, {})
+            for article in news_list:
+                if article.duplicate_of:
+                    continue
+                reserved = reserved_articles.pop(article.url, None)
+                if reserved is not None:
+                    text, band_keys = reserved
+                    for band_key in band_keys:
+                        urls = reserved_bands[band_key]
+                        urls.discard(article.url)
+                        if not urls:
+                            del reserved_bands[band_key]
+                else:
+                    text, _, band_keys = self._fingerprint(article)
+                if not band_keys:
+                    continue
+
+                cursor = self._connection.execute(
+                    "INSERT OR IGNORE INTO indexed_articles (url, scrape_id, text) VALUES (?, ?, ?)",
+                    (article.url, scrape_id, text),
+                )
+                if cursor.rowcount:
+                    band_rows.extend((band_key, cursor.lastrowid) for band_key in band_keys)
+                    indexed += 1
+            band_rows.sort()
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO article_bands (band_key, article_id) VALUES (?, ?)", band_rows
+            )
+        logging.info(f"Indexed {indexed} articles for near-duplicate detection.")
+
+    def release(self, scrape_id: str):
+        """
+        Drops the articles a scrape reserved and did not save.
+
+        Args:
+            scrape_id (str): The ID of the scrape.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            released = self._reserved.pop(scrape_id, {})
+            self._reserved_bands.pop(scrape_id, None)
+        if released:
+            logging.info(f"Released {len(released)} unsaved articles of scrape {scrape_id}.")
+
+    def close(self):
+        """
+        Closes the database connection.
+
+        Returns:
+            None
+        """
+        self._connection.close()
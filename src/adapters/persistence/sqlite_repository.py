@@ -0,0 +1,202 @@
+import json
+import logging
+import sqlite3
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from robocorp.tasks import get_output_dir
+from adapters.persistence.schema import COLUMN_TYPES, JSON_COLUMNS, NEWS_COLUMNS, news_rows
+from core.domain.batch import NewsBatch, NewsRecords
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import StreamingRespository
+
+SQLITE_TYPES = {str: "TEXT", date: "TEXT", int: "INTEGER", bool: "INTEGER"}
+
+
+class SqliteRepository(StreamingRespository):
+    """
+    A repository that keeps the articles of every scrape in one SQLite database, upserting them
+    by URL in bulk transactions, with indexes for cross-run queries.
+
+    Attributes:
+        path (Path): The SQLite database file.
+
+    Methods:
+        append: Upserts a chunk of news articles in one transaction.
+        close: Logs the saved scrape.
+        query: Looks up articles across every saved scrape.
+        query_batch: Looks up articles across every saved scrape into a NewsBatch.
+        close_connection: Closes the database connection, once every scrape is saved.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or get_output_dir() / "news.sqlite3"
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        columns = ",\n".join(f"{name} {SQLITE_TYPES[column_type]}" for name, column_type in COLUMN_TYPES.items())
+        self._connection.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS news_articles (
+                {columns},
+                scrape_id TEXT NOT NULL,
+                UNIQUE (url)
+            );
+            CREATE INDEX IF NOT EXISTS news_articles_date ON news_articles (date);
+            CREATE INDEX IF NOT EXISTS news_articles_selected_section ON news_articles (selected_section);
+            CREATE INDEX IF NOT EXISTS news_articles_contains_money ON news_articles (contains_money);
+            CREATE INDEX IF NOT EXISTS news_articles_scrape_id ON news_articles (scrape_id);
+            """
+        )
+        # databases created before a NewsArticle field was added get its column, empty for the saved rows
+        existing_columns = {row[1] for row in self._connection.execute("PRAGMA table_info(news_articles)")}
+        for name, column_type in COLUMN_TYPES.items():
+            if name not in existing_columns:
+                sqlite_type = SQLITE_TYPES[column_type]
+                default = "0" if sqlite_type == "INTEGER" else "''"
+                self._connection.execute(f"ALTER TABLE news_articles ADD COLUMN {name} {sqlite_type} DEFAULT {default}")
+        insert_columns = NEWS_COLUMNS + ["scrape_id"]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in insert_columns if column != "url")
+        self._upsert = (
+            f"INSERT INTO news_articles ({', '.join(insert_columns)}) "
+            f"VALUES ({', '.join('?' for _ in insert_columns)}) "
+            f"ON CONFLICT (url) DO UPDATE SET {updates}"
+        )
+
+    def append(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Upserts a chunk of news articles by URL in one transaction.
+
+        Args:
+            scrape_id (str): The ID of the scrape the articles belong to.
+            news_list (NewsRecords): The chunk of news articles to save, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        rows = []
+        for row in news_rows(news_list):
+            row["date"] = row["date"].isoformat()
+            rows.append([row[column] for column in NEWS_COLUMNS] + [scrape_id])
+        with self._connection:
+            self._connection.executemany(self._upsert, rows)
+
+    def close(self, scrape_id: str):
+        """
+        Logs the saved scrape. Every chunk is committed when `append` returns.
+
+        Args:
+            scrape_id (str): The ID of the scrape.
+
+        Returns:
+            None
+        """
+        (total,) = self._connection.execute(
+            "SELECT COUNT(*) FROM news_articles WHERE scrape_id = ?", (scrape_id,)
+        ).fetchone()
+        logging.info(f"Results Saved in: {self.path} ({total} articles for scrape {scrape_id})")
+
+    def query(
+        self,
+        section: Optional[str] = None,
+        contains_money: Optional[bool] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        scrape_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[NewsArticle]:
+        """
+        Looks up articles across every saved scrape, newest first, e.g. every business article
+        mentioning money in the last quarter.
+
+        Args:
+            section (Optional[str], optional): The section selected for the search. Defaults to None.
+            contains_money (Optional[bool], optional): The money flag of the articles. Defaults to None.
+            since (Optional[date], optional): The earliest publication date, inclusive. Defaults to None.
+            until (Optional[date], optional): The latest publication date, inclusive. Defaults to None.
+            scrape_id (Optional[str], optional): The scrape the articles belong to. Defaults to None.
+            limit (Optional[int], optional): The maximum number of articles. Defaults to None.
+
+        Returns:
+            List[NewsArticle]: The matching articles.
+        """
+        rows = self._select(section, contains_money, since, until, scrape_id, limit)
+        return [NewsArticle(**self._values(row)) for row in rows]
+
+    def query_batch(
+        self,
+        section: Optional[str] = None,
+        contains_money: Optional[bool] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        scrape_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> NewsBatch:
+        """
+        Looks up articles like `query`, reading them straight into the columns of a NewsBatch, e.g. to
+        reprocess hundreds of thousands of saved articles.
+
+        Args:
+            section (Optional[str], optional): The section selected for the search. Defaults to None.
+            contains_money (Optional[bool], optional): The money flag of the articles. Defaults to None.
+            since (Optional[date], optional): The earliest publication date, inclusive. Defaults to None.
+            until (Optional[date], optional): The latest publication date, inclusive. Defaults to None.
+            scrape_id (Optional[str], optional): The scrape the articles belong to. Defaults to None.
+            limit (Optional[int], optional): The maximum number of articles. Defaults to None.
+
+        Returns:
+            NewsBatch: The matching articles.
+        """
+        batch = NewsBatch()
+        for row in self._select(section, contains_money, since, until, scrape_id, limit):
+            batch.append(**self._values(row))
+        return batch
+
+    def _select(
+        self,
+        section: Optional[str],
+        contains_money: Optional[bool],
+        since: Optional[date],
+        until: Optional[date],
+        scrape_id: Optional[str],
+        limit: Optional[int],
+    ) -> sqlite3.Cursor:
+        conditions = []
+        parameters: List[Any] = []
+        for condition, value in (
+            ("selected_section = ?", section),
+            ("contains_money = ?", contains_money),
+            ("date >= ?", since.isoformat() if since else None),
+            ("date <= ?", until.isoformat() if until else None),
+            ("scrape_id = ?", scrape_id),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+
+        sql = f"SELECT {', '.join(NEWS_COLUMNS)} FROM news_articles"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY date DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+
+        return self._connection.execute(sql, parameters)
+
+    @staticmethod
+    def _values(row: tuple) -> Dict[str, Any]:
+        values = dict(zip(NEWS_COLUMNS, row))
+        values["date"] = date.fromisoformat(values["date"])
+        values["contains_money"] = bool(values["contains_money"])
+        for column in JSON_COLUMNS:
+            values[column] = json.loads(values[column])
+        return values
+
+    def close_connection(self):
+        """
+        Closes the database connection.
+
+        Returns:
+            None
+        """
+        self._connection.close()
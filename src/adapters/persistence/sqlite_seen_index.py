@@ -0,0 +1,140 @@
+import logging
+import sqlite3
+import tarfile
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+from adapters.persistence.image_archive import split_member_path
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import SeenIndex
+
+
+class SqliteSeenIndex(SeenIndex):
+    """
+    A SQLite index of already-scraped article URLs and dates, keyed by query and section,
+    used to make repeated scrapes incremental.
+
+    Known thumbnails are reused whether they were saved as files or in an image archive. The member
+    names of each archive are read once and cached until the archive file changes.
+
+    Attributes:
+        path (Path): The SQLite database file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = Lock()
+        self._archives: Dict[Path, Tuple[Tuple[int, int], Set[str]]] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen_articles (
+                search_phrase TEXT NOT NULL,
+                section TEXT NOT NULL,
+                url TEXT NOT NULL,
+                date TEXT NOT NULL,
+                image_path TEXT,
+                PRIMARY KEY (search_phrase, section, url)
+            );
+            CREATE INDEX IF NOT EXISTS seen_articles_url ON seen_articles (url);
+            """
+        )
+
+    @staticmethod
+    def _query_key(search_phrase: str) -> str:
+        return " ".join(search_phrase.lower().split())
+
+    def is_seen(self, search_phrase: str, section: str, url: str) -> bool:
+        """
+        Checks if an article was already scraped for the query and section.
+
+        Args:
+            search_phrase (str): The phrase of the search.
+            section (str): The section of the search.
+            url (str): The article URL.
+
+        Returns:
+            bool: True if the article is in the index, False otherwise.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM seen_articles WHERE search_phrase = ? AND section = ? AND url = ?",
+                (self._query_key(search_phrase), section, url),
+            ).fetchone()
+        return row is not None
+
+    def image_path(self, url: str) -> Optional[str]:
+        """
+        Gets the thumbnail saved for an article in any previous scrape, if the file, or the archive member,
+        still exists.
+
+        Args:
+            url (str): The article URL.
+
+        Returns:
+            Optional[str]: The saved thumbnail path, or None if the article has no known thumbnail.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT image_path FROM seen_articles WHERE url = ? AND image_path != ''", (url,)
+            ).fetchall()
+        for (image_path,) in rows:
+            if self._image_exists(image_path):
+                return image_path
+        return None
+
+    def _image_exists(self, image_path: str) -> bool:
+        archived = split_member_path(image_path)
+        if archived is None:
+            return Path(image_path).exists()
+
+        archive, member = archived
+        try:
+            stat = archive.stat()
+        except OSError:
+            return False
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._archives.get(archive)
+            if cached is None or cached[0] != version:
+                try:
+                    with tarfile.open(archive) as tar:
+                        cached = self._archives[archive] = (version, set(tar.getnames()))
+                except (OSError, tarfile.TarError) as error:
+                    logging.warning(f"Image archive {archive} could not be read: {error}")
+                    return False
+        return member in cached[1]
+
+    def mark_seen(self, search_phrase: str, section: str, news_list: List[NewsArticle]):
+        """
+        Records scraped articles for the query and section.
+
+        Args:
+            search_phrase (str): The phrase of the search.
+            section (str): The section of the search.
+            news_list (List[NewsArticle]): The scraped articles.
+
+        Returns:
+            None
+        """
+        query_key = self._query_key(search_phrase)
+        rows = [
+            (query_key, section, article.url, article.date.isoformat(), article.image_path)
+            for article in news_list
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO seen_articles (search_phrase, section, url, date, image_path) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        logging.info(f"Marked {len(rows)} articles as seen for: {query_key} ({section})")
+
+    def close(self):
+        """
+        Closes the database connection.
+
+        Returns:
+            None
+        """
+        self._connection.close()
@@ -0,0 +1,150 @@
+import atexit
+import logging
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List, Optional
+import undetected_chromedriver as uc
+from pyvirtualdisplay import Display
+from selenium.common.exceptions import WebDriverException
+from core.domain.tracing import get_tracer
+
+_display: Optional[Display] = None
+_display_lock = Lock()
+_driver_lock = Lock()
+
+
+def ensure_display() -> Display:
+    """
+    Starts the virtual display shared by every browser of the process, on first use only,
+    so importing the scrapers does not spawn Xvfb.
+
+    Returns:
+        Display: The started virtual display.
+    """
+    global _display
+    with _display_lock:
+        if _display is None:
+            start = perf_counter()
+            _display = Display(visible=0, size=(800, 600))
+            _display.start()
+            atexit.register(_display.stop)
+            logging.info(f"Virtual display started in {perf_counter() - start:.2f}s.")
+    return _display
+
+
+def new_chrome_driver() -> uc.Chrome:
+    """
+    Starts a new undetected Chrome driver.
+
+    Driver creation is serialized because undetected-chromedriver patches a shared
+    chromedriver binary on startup.
+
+    Returns:
+        uc.Chrome: The started driver.
+    """
+    chrome_options = uc.ChromeOptions()
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.page_load_strategy = "eager"
+
+    with _driver_lock:
+        return uc.Chrome(options=chrome_options, version_main=114)
+
+
+class BrowserSession:
+    """
+    Manages the lifecycle of one Chrome driver: it starts lazily, stays warm across scrapes,
+    is health-checked before reuse, and is recycled after a number of pages.
+
+    Attributes:
+        name (str): The session name used in the logs.
+        max_pages (int): Pages loaded before the driver is recycled, 0 to never recycle.
+        pages (int): Pages loaded by the current driver.
+        timings (Dict[str, List[float]]): Seconds spent on each driver "startup", "first_page" and "teardown".
+
+    Methods:
+        driver: Property to get a healthy driver, starting or recycling it if needed.
+        is_alive: Checks if the current driver still responds.
+        page_loaded: Records a loaded page.
+        close: Quits the driver.
+    """
+
+    def __init__(self, name: str = "main", max_pages: int = 0) -> None:
+        self.name = name
+        self.max_pages = max_pages
+        self.pages = 0
+        self.timings: Dict[str, List[float]] = {"startup": [], "first_page": [], "teardown": []}
+        self._driver: Optional[uc.Chrome] = None
+        self._started_at = 0.0
+
+    @property
+    def driver(self) -> uc.Chrome:
+        """
+        Returns a healthy driver, starting it on first use, and recycling it when it stopped
+        responding or loaded `max_pages` pages.
+
+        Returns:
+            uc.Chrome: The driver of the session.
+        """
+        if self._driver is not None and self.max_pages and self.pages >= self.max_pages:
+            logging.info(f"Recycling browser session {self.name} after {self.pages} pages.")
+            self.close()
+        elif self._driver is not None and not self.is_alive():
+            logging.warning(f"Browser session {self.name} stopped responding, restarting it.")
+            self.close()
+
+        if self._driver is None:
+            ensure_display()
+            self._started_at = perf_counter()
+            self._driver = new_chrome_driver()
+            self._record("startup", perf_counter() - self._started_at)
+            self.pages = 0
+        return self._driver
+
+    def is_alive(self) -> bool:
+        """
+        Checks if the current driver still responds.
+
+        Returns:
+            bool: True if the driver answers a WebDriver command, False otherwise.
+        """
+        if self._driver is None:
+            return False
+        try:
+            self._driver.current_url
+        except WebDriverException:
+            return False
+        return True
+
+    def page_loaded(self):
+        """
+        Records a page loaded by the current driver.
+
+        Returns:
+            None
+        """
+        self.pages += 1
+        if self.pages == 1:
+            self._record("first_page", perf_counter() - self._started_at)
+
+    def close(self):
+        """
+        Quits the driver, if it is running.
+
+        Returns:
+            None
+        """
+        if self._driver is None:
+            return
+        start = perf_counter()
+        try:
+            self._driver.quit()
+        except WebDriverException as error:
+            logging.warning(f"Browser session {self.name} did not quit cleanly: {error}")
+        self._driver = None
+        self._record("teardown", perf_counter() - start)
+
+    def _record(self, stage: str, seconds: float):
+        self.timings[stage].append(seconds)
+        get_tracer().record(f"browser_{stage}", seconds, session=self.name)
+        logging.info(f"Browser session {self.name} {stage}: {seconds:.2f}s")
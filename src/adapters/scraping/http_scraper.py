@@ -0,0 +1,309 @@
+import logging
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+from uuid import uuid4
+import requests
+from lxml import etree, html
+from robocorp.tasks import get_output_dir
+from adapters.http.http_cache import HttpCache
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+from adapters.http.session import build_session, is_retryable
+from adapters.scraping.reuters import (
+    PAGE_SIZE,
+    SEARCH_URL,
+    Elements,
+    SearchContext,
+    parse_article_date,
+    parse_total_results,
+    search_url,
+)
+from adapters.scraping.thumbnail_downloader import ThumbnailDownloader
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import Checkpoint, DuplicateIndex, ScrapeInterrupted, SeenIndex, StreamingScraper
+from core.domain.tracing import get_tracer
+
+if TYPE_CHECKING:
+    from adapters.scraping.thumbnail_normalizer import ThumbnailNormalizer
+
+
+class XPaths(Enum):
+    NEWS_LIST = "//ul[contains(@class, 'search-results__list')]/li"
+    NEWS_TITLE = ".//a[@data-testid='Title']"
+    NEWS_SECTION = ".//span[@data-testid='Label']"
+    LINK = ".//a[@href]"
+    IMAGE = ".//img[@src]"
+
+
+class HttpScraper(StreamingScraper):
+    """
+    A browserless scraper that fetches Reuters search result pages over pooled HTTP and parses
+    them with lxml, filling the same NewsArticle fields as SeleniumScraper.
+
+    It skips the browser startup and every WebDriver round-trip, but it only works while the
+    search pages are served as rendered HTML without a CAPTCHA challenge.
+
+    Attributes:
+        base_url (str): The base URL template for Reuters search.
+        timeout (float): Timeout, in seconds, for each page request.
+        download_workers (int): Number of concurrent thumbnail downloads.
+        archive_images (bool): Whether thumbnails are stored in a deduplicated tar archive per scrape.
+        output_dir (Path): Directory where the thumbnails are written.
+        cache (Optional[HttpCache]): The on-disk cache of search pages and thumbnails.
+        normalizer (Optional[ThumbnailNormalizer]): The stage resizing and re-encoding the thumbnails.
+        limiter (AdaptiveRateLimiter): The limiter pacing and retrying page fetches and thumbnail downloads.
+        _session (Optional[requests.Session]): The pooled HTTP session, initialized lazily.
+        _downloader (Optional[ThumbnailDownloader]): The thumbnail download stage, initialized lazily.
+
+    Methods:
+        session: Property to initialize and get the pooled HTTP session.
+        downloader: Property to initialize and get the thumbnail download stage.
+        fetch_page: Fetches and parses one search result page.
+        close: Closes the thumbnail download stage and the HTTP session.
+        iter_news: Lazily scrapes news articles based on provided search parameters.
+        count_results: Returns the total number of results of a search.
+    """
+
+    def __init__(
+        self,
+        base_url: str = SEARCH_URL,
+        timeout: float = 30,
+        download_workers: int = 8,
+        archive_images: bool = False,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        output_dir: Optional[Path] = None,
+        cache: Optional[HttpCache] = None,
+        normalizer: Optional["ThumbnailNormalizer"] = None,
+    ) -> None:
+        self.base_url = base_url
+        self.timeout = timeout
+        self.download_workers = download_workers
+        self.archive_images = archive_images
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.output_dir = output_dir or get_output_dir()
+        self.cache = cache
+        self.normalizer = normalizer
+        self._session = None
+        self._downloader = None
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Initializes and returns the pooled HTTP session if not already initialized.
+
+        Returns:
+            requests.Session: The session shared by page fetches and thumbnail downloads.
+        """
+        if self._session is None:
+            self._session = build_session(pool_size=self.download_workers, retries=0, cache=self.cache)
+        return self._session
+
+    @property
+    def downloader(self) -> ThumbnailDownloader:
+        """
+        Initializes and returns the thumbnail download stage if not already initialized.
+
+        Returns:
+            ThumbnailDownloader: The pooled, concurrent thumbnail downloader.
+        """
+        if self._downloader is None:
+            self._downloader = ThumbnailDownloader(
+                output_dir=self.output_dir,
+                workers=self.download_workers,
+                session=self.session,
+                archive_images=self.archive_images,
+                limiter=self.limiter,
+                cache=self.cache,
+                normalizer=self.normalizer,
+            )
+        return self._downloader
+
+    def close(self):
+        """
+        Closes the thumbnail download stage and the pooled HTTP session, and logs the pace of each host.
+
+        Returns:
+            None
+        """
+        logging.info(f"Rate limiter: {self.limiter.stats()}")
+        if self._downloader is not None:
+            self._downloader.close()
+            self._downloader = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def fetch_page(self, url: str) -> Optional[html.HtmlElement]:
+        """
+        Fetches and parses one search result page, paced and retried by the rate limiter unless it is
+        served fresh from the cache.
+
+        Args:
+            url (str): The search page URL.
+
+        Returns:
+            Optional[html.HtmlElement]: The parsed page, or None if the request failed. An empty page is
+                returned as an empty document, which has no results.
+        """
+        try:
+            if self.cache is not None and self.cache.is_fresh(url):
+                response = self._get(url)
+            else:
+                response = self.limiter.call(url, lambda: self._get(url), is_retryable)
+        except requests.RequestException as error:
+            logging.error(f"Failed to fetch {url}: {error}")
+            return None
+        try:
+            return html.fromstring(response.content, base_url=url)
+        except etree.ParserError as error:
+            logging.warning(f"Empty results page {url}: {error}")
+            return html.Element("html")
+
+    def _get(self, url: str) -> requests.Response:
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def iter_news(
+        self,
+        scrape_id: str,
+        search_phrase: str,
+        earliest_date: date,
+        section: str = "all",
+        seen_index: Optional[SeenIndex] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        offset_range: Optional[Tuple[int, int]] = None,
+        duplicate_index: Optional[DuplicateIndex] = None,
+    ) -> Iterator[NewsArticle]:
+        """
+        Scrapes news articles from Reuters based on the provided search phrase, earliest date, and section,
+        yielding the articles of each page as soon as its thumbnails are downloaded.
+
+        Args:
+            scrape_id (str): The ID of the scrape process, used for organizing saved data.
+            search_phrase (str): The phrase to search for in the news articles.
+            earliest_date (date): The earliest date for filtering news articles.
+            section (str, optional): The section of the news to search in. Defaults to "all".
+            seen_index, checkpoint, offset_range, duplicate_index: See `Scraper.scrape_news`.
+
+        Yields:
+            NewsArticle: The scraped articles, newest first.
+
+        Raises:
+            ScrapeInterrupted: If a results page cannot be fetched.
+        """
+        logging.info(f"Search Phrase: {search_phrase}")
+        logging.info(f"Section: {section}")
+
+        tracer = get_tracer()
+        search = SearchContext(search_phrase, earliest_date, section, seen_index, duplicate_index, scrape_id)
+        max_offset = None
+        offset, end_offset = offset_range if offset_range is not None else (0, None)
+
+        progress = checkpoint.load(scrape_id) if checkpoint is not None else None
+        if progress is not None:
+            logging.info(f"Resuming scrape {scrape_id} from offset {progress.next_offset}")
+            yield from progress.articles
+            offset = progress.next_offset
+
+        self.downloader.open_archive(scrape_id)
+        try:
+            while (max_offset is None or offset < max_offset) and (end_offset is None or offset < end_offset):
+                url = search_url(search_phrase, section, offset, self.base_url)
+                with tracer.span("page_fetch", offset=offset):
+                    page = self.fetch_page(url)
+                if page is None:
+                    raise ScrapeInterrupted(f"Results page in offset {offset} could not be fetched.")
+
+                if max_offset is None:
+                    max_offset = self._parse_max_offset(page)
+                    logging.info(f"Offset range: {max_offset//PAGE_SIZE}")
+
+                news_list = page.xpath(XPaths.NEWS_LIST.value)
+                if not news_list:
+                    logging.info(f"No results in offset: {offset}")
+                    break
+
+                with tracer.span("page_extract", offset=offset):
+                    page_articles, break_scrape = self._parse_news_list(news_list, search, url)
+                tracer.count("pages")
+                with tracer.span("download_wait"):
+                    self.downloader.wait()
+                if checkpoint is not None:
+                    with tracer.span("checkpoint"):
+                        checkpoint.save_page(scrape_id, offset + PAGE_SIZE, page_articles)
+                yield from page_articles
+                if break_scrape:
+                    logging.info(f"Finish Scrape in offset: {offset}")
+                    break
+                offset += PAGE_SIZE
+        finally:
+            self.downloader.close_archive()
+
+    def count_results(self, search_phrase: str, section: str = "all") -> Optional[int]:
+        """
+        Fetches the first results page of a search and reads its total number of results.
+
+        Args:
+            search_phrase (str): The phrase to search for in the news articles.
+            section (str, optional): The section of the news to search in. Defaults to "all".
+
+        Returns:
+            Optional[int]: The number of results, or None if the page does not show it.
+
+        Raises:
+            ScrapeInterrupted: If the results page cannot be fetched.
+        """
+        page = self.fetch_page(search_url(search_phrase, section, 0, self.base_url))
+        if page is None:
+            raise ScrapeInterrupted("The first results page could not be fetched.")
+        total = self._parse_max_offset(page)
+        return None if total == float("inf") else int(total)
+
+    def _parse_max_offset(self, page: html.HtmlElement) -> float:
+        offset_elements = page.xpath(Elements.ALL_OFFSET.value.removeprefix("xpath:"))
+        if not offset_elements:
+            logging.warning("Total of results not found, paginating until an empty page.")
+            return float("inf")
+        return parse_total_results(offset_elements[0].text_content())
+
+    def _parse_news_list(
+        self, news_list: List[html.HtmlElement], search: SearchContext, page_url: str
+    ) -> Tuple[List[NewsArticle], bool]:
+        page_articles = []
+        for i, news in enumerate(news_list):
+            titles = news.xpath(XPaths.NEWS_TITLE.value)
+            links = news.xpath(XPaths.LINK.value)
+            if not titles or not links:
+                logging.warning(f"Skipping result {i} without title or link.")
+                continue
+
+            news_title = titles[0].text_content().strip()
+            news_url = urljoin(page_url, links[0].get("href"))
+            news_date = parse_article_date(news_url)
+            logging.info(f"Collecting {i}/{len(news_list)}: {news_title}")
+
+            if search.should_stop(news_url, news_date):
+                return page_articles, True
+
+            sections = news.xpath(XPaths.NEWS_SECTION.value)
+            article = NewsArticle(
+                article_id=str(uuid4()),
+                title=news_title,
+                date=news_date,
+                url=news_url,
+                image_path="",
+                extracted_section=sections[0].text_content().strip() if sections else None,
+                selected_section=search.section,
+            )
+
+            images = news.xpath(XPaths.IMAGE.value)
+            if not images:
+                logging.warning("News without image.")
+            if not search.is_duplicate(article) and images:
+                self.downloader.submit(article, urljoin(page_url, images[0].get("src")), search.seen_index)
+
+            page_articles.append(article)
+        return page_articles, False
@@ -0,0 +1,132 @@
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Optional
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import DuplicateIndex, SeenIndex
+from core.domain.tracing import get_tracer
+
+SEARCH_URL = "https://www.reuters.com/site-search/?query={}&section={}&offset={}&date=any_time&sort=newest"
+PAGE_SIZE = 20
+
+
+class Elements(Enum):
+    SEARCH_TITLE = '//*[@id="main-content"]'
+    ALL_OFFSET = "xpath:/html/body/div[1]/div[2]/div[2]/div/div[2]/div[3]/span"
+    NEWS_LIST = "ul.search-results__list__2SxSK > li"
+    NEWS_TITLE = "a[data-testid='Title']"
+    NEWS_SECTION = "span[data-testid='Label']"
+    NEWS_DATE = "time[data-testid='Text']"
+    LINK = "a"
+    IMAGE = "img"
+
+
+def search_url(search_phrase: str, section: str, offset: int, base_url: str = SEARCH_URL) -> str:
+    """
+    Builds the Reuters search URL for one page of results.
+
+    Args:
+        search_phrase (str): The phrase to search for, words are joined with "+".
+        section (str): The section of the news to search in.
+        offset (int): The offset of the first result of the page.
+        base_url (str, optional): The search URL template. Defaults to the Reuters site search.
+
+    Returns:
+        str: The formatted search URL.
+    """
+    query = "+".join(search_phrase.split())
+    return base_url.format(query, section, offset)
+
+
+def parse_article_date(url: str) -> date:
+    """
+    Parses the publication date from a Reuters article URL, which ends with "-YYYY-MM-DD/".
+
+    Args:
+        url (str): The article URL.
+
+    Returns:
+        date: The publication date of the article.
+
+    Raises:
+        ValueError: If the URL does not end with a date.
+    """
+    url_date = "-".join(url.removesuffix("/").split("-")[-3:])
+    return datetime.strptime(url_date, "%Y-%m-%d").date()
+
+
+def parse_total_results(text: str) -> int:
+    """
+    Parses the total number of results from the pagination label, like "1 to 20 of 1234".
+
+    Args:
+        text (str): The pagination label text.
+
+    Returns:
+        int: The total number of results.
+    """
+    return int(text.split()[-1].replace(",", ""))
+
+
+@dataclass
+class SearchContext:
+    """
+    The parameters of one search, shared by the page parsing helpers of the scrapers.
+
+    Attributes:
+        search_phrase (str): The phrase to search for in the news articles.
+        earliest_date (date): The earliest date for filtering news articles.
+        section (str): The section of the news to search in.
+        seen_index (Optional[SeenIndex]): Index of articles already scraped for incremental scrapes.
+        duplicate_index (Optional[DuplicateIndex]): Index of saved articles, to flag near-duplicates.
+        scrape_id (str): The ID of the scrape, under which its articles are indexed.
+    """
+
+    search_phrase: str
+    earliest_date: date
+    section: str
+    seen_index: Optional[SeenIndex] = None
+    duplicate_index: Optional[DuplicateIndex] = None
+    scrape_id: str = ""
+
+    def should_stop(self, url: str, news_date: date) -> bool:
+        """
+        Checks if the pagination must stop at an article, because it is older than the earliest date
+        or, in incremental scrapes, because it was already scraped.
+
+        Args:
+            url (str): The article URL.
+            news_date (date): The article publication date.
+
+        Returns:
+            bool: True if the article and every older one must be skipped.
+        """
+        if news_date < self.earliest_date:
+            logging.info("No more news in between selected date.")
+            return True
+        if self.seen_index is not None and self.seen_index.is_seen(self.search_phrase, self.section, url):
+            logging.info(f"Reached an article already scraped: {url}")
+            return True
+        return False
+
+    def is_duplicate(self, article: NewsArticle) -> bool:
+        """
+        Checks if an article is a near-duplicate of an article already saved or scraped, and flags it
+        with the URL of the first copy, so its thumbnail is not downloaded.
+
+        Args:
+            article (NewsArticle): The article, before its thumbnail is downloaded.
+
+        Returns:
+            bool: True if the article is a duplicate, False otherwise or without a duplicate index.
+        """
+        if self.duplicate_index is None:
+            return False
+        duplicate_of = self.duplicate_index.find_duplicate(self.scrape_id, article)
+        if duplicate_of is None:
+            return False
+        logging.info(f"Near-duplicate of {duplicate_of}: {article.url}")
+        get_tracer().count("duplicates")
+        article.duplicate_of = duplicate_of
+        return True
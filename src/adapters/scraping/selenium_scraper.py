@@ -1,102 +1,208 @@
+import json
 import logging
-from datetime import date, datetime
-from enum import Enum
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from threading import Lock
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import uuid4
 from robocorp.tasks import get_output_dir
 from RPA.Browser.Selenium import ElementNotFound, Selenium
-from RPA.HTTP import HTTP
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from adapters.http.http_cache import HttpCache
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+from adapters.scraping.browser_session import BrowserSession
+from adapters.scraping.reuters import (
+    PAGE_SIZE,
+    SEARCH_URL,
+    Elements,
+    SearchContext,
+    parse_article_date,
+    parse_total_results,
+    search_url,
+)
+from adapters.scraping.thumbnail_downloader import ThumbnailDownloader
 from core.domain.entities import NewsArticle
-from core.domain.interfaces import Scraper
+from core.domain.interfaces import Checkpoint, DuplicateIndex, ScrapeInterrupted, SeenIndex, StreamingScraper
+from core.domain.offset_planner import OffsetPlanner
+from core.domain.tracing import get_tracer
 import undetected_chromedriver as uc
 from datetime import timedelta
-from pyvirtualdisplay import Display
 
-
-
-class Elements(Enum):
-    SEARCH_TITLE = '//*[@id="main-content"]'
-    ALL_OFFSET = "xpath:/html/body/div[1]/div[2]/div[2]/div/div[2]/div[3]/span"
-    NEWS_LIST = "ul.search-results__list__2SxSK > li"
-    NEWS_TITLE = "a[data-testid='Title']"
-    NEWS_SECTION = "span[data-testid='Label']"
-    NEWS_DATE = "time[data-testid='Text']"
-    LINK = "a"
-    IMAGE = "img"
-
-
-class SeleniumScraper(Scraper):
+if TYPE_CHECKING:
+    from adapters.scraping.thumbnail_normalizer import ThumbnailNormalizer
+
+# Collects every result of the page in a single WebDriver round-trip.
+EXTRACT_NEWS_JS = """
+const items = document.querySelectorAll(arguments[0]);
+return JSON.stringify(Array.from(items, (item) => {
+    const title = item.querySelector(arguments[1]);
+    const link = item.querySelector(arguments[2]);
+    const label = item.querySelector(arguments[3]);
+    const time = item.querySelector(arguments[4]);
+    const image = item.querySelector(arguments[5]);
+    return {
+        title: title ? title.innerText.trim() : null,
+        href: link ? link.href : null,
+        section: label ? label.innerText.trim() : null,
+        date: time ? time.getAttribute("datetime") : null,
+        image: image ? (image.currentSrc || image.src || image.getAttribute("data-src")) : null,
+    };
+}));
+"""
+
+
+class SeleniumScraper(StreamingScraper):
     """
     A scraper class that uses Selenium to scrape news articles from Reuters based on a search phrase,
     date range, and section, and handles saving images locally.
 
     Attributes:
-        offset (str): The URL parameter used for pagination.
         base_url (str): The base URL template for Reuters search.
         browser (Selenium): The Selenium browser instance.
-        _driver (Optional[WebDriver]): The WebDriver instance, initialized lazily.
-        _http (Optional[HTTP]): An HTTP client for downloading images, initialized lazily.
+        session (BrowserSession): The main browser session, started lazily and kept warm across scrapes.
+        _driver (Optional[WebDriver]): The WebDriver registered in the RPA browser.
+        download_workers (int): Number of concurrent thumbnail downloads.
+        archive_images (bool): Whether thumbnails are stored in a deduplicated tar archive per scrape.
+        batch_extraction (bool): Whether each results page is extracted with a single JavaScript call.
+        page_workers (int): Number of browser sessions visiting result pages in parallel.
+        plan_offsets (bool): Whether the cutoff page is found by binary search before the parallel pagination.
+        limiter (AdaptiveRateLimiter): The limiter pacing and retrying page loads and thumbnail downloads.
+        cache (Optional[HttpCache]): The on-disk cache of thumbnails.
+        normalizer (Optional[ThumbnailNormalizer]): The stage resizing and re-encoding the thumbnails.
+        _downloader (Optional[ThumbnailDownloader]): The thumbnail download stage, initialized lazily.
 
     Methods:
-        driver: Property to initialize and get the Selenium WebDriver.
-        http: Property to initialize and get the HTTP client.
-        scrape_news: Scrapes news articles based on provided search parameters.
+        driver: Property to initialize and get the Selenium WebDriver, kept open across scrapes.
+        close: Closes the browser session and the thumbnail download stage.
+        downloader: Property to initialize and get the thumbnail download stage.
+        iter_news: Lazily scrapes news articles based on provided search parameters.
+        count_results: Returns the total number of results of a search.
     """
-    display = Display(visible=0, size=(800, 600))
-    display.start()
-
-    def __init__(self) -> None:
-        self.offset = "offset={}"
-        self.base_url = "https://www.reuters.com/site-search/?query={}&section={}&{}&date=any_time&sort=newest"
+    def __init__(
+        self,
+        download_workers: int = 8,
+        batch_extraction: bool = True,
+        page_workers: int = 1,
+        plan_offsets: bool = False,
+        archive_images: bool = False,
+        recycle_pages: int = 0,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        cache: Optional[HttpCache] = None,
+        normalizer: Optional["ThumbnailNormalizer"] = None,
+    ) -> None:
+        self.base_url = SEARCH_URL
         self.browser = Selenium()
-        self._http = None  # using another lib, like requests or urllib, because HTTP RPA slow download image
+        self.session = BrowserSession("main", max_pages=recycle_pages)
+        self.download_workers = download_workers
+        self.archive_images = archive_images
+        self.batch_extraction = batch_extraction
+        self.page_workers = page_workers
+        self.plan_offsets = plan_offsets
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.cache = cache
+        self.normalizer = normalizer
+        self._navigated_at = 0.0
+        self._downloader = None
+        self._driver = None
 
+    @property
+    def downloader(self) -> ThumbnailDownloader:
+        """
+        Initializes and returns the thumbnail download stage if not already initialized.
 
+        Returns:
+            ThumbnailDownloader: The pooled, concurrent thumbnail downloader.
+        """
+        if self._downloader is None:
+            self._downloader = ThumbnailDownloader(
+                output_dir=get_output_dir(),
+                workers=self.download_workers,
+                archive_images=self.archive_images,
+                limiter=self.limiter,
+                normalizer=self.normalizer,
+                cache=self.cache,
+            )
+        return self._downloader
 
     @property
-    def http(self):
+    def driver(self) -> uc.Chrome:
         """
-        Initializes and returns the HTTP client for downloading images if not already initialized.
+        Returns the driver of the main browser session, registering it in the RPA browser whenever
+        the session starts or recycles it. The same session is reused by every scrape until `close`.
 
         Returns:
-            HTTP: The initialized HTTP client instance.
+            uc.Chrome: The driver of the main browser session.
+        """
+        driver = self.session.driver
+        if driver is not self._driver:
+            self.browser.set_selenium_implicit_wait(timedelta(seconds=50))
+
+            browser_alias = "uc"
+            self.browser.register_driver(driver=driver, alias=browser_alias)
+            self.browser.switch_browser(browser_alias)
+            self._driver = driver
+        return driver
+
+    def close(self):
         """
-        if self._http is None:
-            self._http = HTTP()
-        return self._http
+        Closes the browser session and the thumbnail download stage, and logs the session timings
+        and the pace of each host.
 
-    def scrape_news(
+        Returns:
+            None
+        """
+        self.session.close()
+        self._driver = None
+        logging.info(f"Browser session timings: {self.session.timings}")
+        logging.info(f"Rate limiter: {self.limiter.stats()}")
+        if self._downloader is not None:
+            self._downloader.close()
+            self._downloader = None
+
+    def iter_news(
         self,
         scrape_id: str,
         search_phrase: str,
         earliest_date: date,
         section: str = "all",
-    ) -> Optional[List[NewsArticle]]:
+        seen_index: Optional[SeenIndex] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        offset_range: Optional[Tuple[int, int]] = None,
+        duplicate_index: Optional[DuplicateIndex] = None,
+    ) -> Iterator[NewsArticle]:
         """
-        Scrapes news articles from Reuters based on the provided search phrase, earliest date, and section.
+        Scrapes news articles from Reuters based on the provided search phrase, earliest date, and section,
+        yielding the articles of each page as soon as its thumbnails are downloaded.
 
         Args:
             scrape_id (str): The ID of the scrape process, used for organizing saved data.
             search_phrase (str): The phrase to search for in the news articles.
             earliest_date (date): The earliest date for filtering news articles.
             section (str, optional): The section of the news to search in. Defaults to "all".
+            seen_index, checkpoint, offset_range, duplicate_index: See `Scraper.scrape_news`.
 
-        Returns:
-            Optional[List[NewsArticle]]: A list of NewsArticle objects if scraping is successful, None otherwise.
+        Yields:
+            NewsArticle: The scraped articles, newest first.
+
+        Raises:
+            ScrapeInterrupted: If a results page does not load.
         """
         logging.info(f"Search Phrase: {search_phrase}")
         logging.info(f"Section: {section}")
 
-        query = "+".join(search_phrase.split())
-        offset = self.offset.format(0)
+        start_offset, end_offset = offset_range if offset_range is not None else (0, None)
+        progress = checkpoint.load(scrape_id) if checkpoint is not None else None
+        if progress is not None:
+            logging.info(f"Resuming scrape {scrape_id} from offset {progress.next_offset}")
+            yield from progress.articles
+            start_offset = progress.next_offset
 
-    
-
-        url = self.base_url.format(query, section, offset)
+        url = search_url(search_phrase, section, start_offset, self.base_url)
 
         # exploring captcha breaker
         # self.browser.open_available_browser(
@@ -109,21 +215,36 @@ class SeleniumScraper(Scraper):
         #         }
         #     }
         # )
-        self.browser.set_selenium_implicit_wait(timedelta(seconds=50))
-        self.browser.set_selenium_speed(timedelta(seconds=1))
+        self.driver  # starts the browser session on the first scrape, then reuses it
+        self.downloader.open_archive(scrape_id)
+        try:
+            self._navigate(url)
+            search = SearchContext(search_phrase, earliest_date, section, seen_index, duplicate_index, scrape_id)
+            yield from self._iter_pages(search, scrape_id, start_offset, checkpoint, end_offset)
+        finally:
+            self.downloader.close_archive()
 
-        chrome_options = uc.ChromeOptions()
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.page_load_strategy = "eager"
+    def count_results(self, search_phrase: str, section: str = "all") -> Optional[int]:
+        """
+        Opens the first results page of a search and reads its total number of results.
 
-        driver = uc.Chrome(options=chrome_options, version_main=114)
+        Args:
+            search_phrase (str): The phrase to search for in the news articles.
+            section (str, optional): The section of the news to search in. Defaults to "all".
 
-        browser_alias = "uc"
-        self.browser.register_driver(driver=driver, alias=browser_alias)
-        self.browser.switch_browser(browser_alias)
-        self.browser.go_to(url=url)
+        Returns:
+            Optional[int]: The number of results, 0 if no result matches the search.
+        """
+        self.driver  # starts the browser session on the first call, then reuses it
+        self._navigate(search_url(search_phrase, section, 0, self.base_url))
+        total = self._total_results()
+        if total is None:
+            logging.error(f"No search result match the term: {search_phrase}")
+            return 0
+        logging.info(f"{total} results for {search_phrase!r} in section {section}")
+        return total
 
+    def _total_results(self) -> Optional[int]:
         # exploring explict waits
         self.wait = WebDriverWait(self.browser.driver, 10)
 
@@ -135,99 +256,370 @@ class SeleniumScraper(Scraper):
                 )
             )
         except TimeoutException:
-            logging.error(f"No search result match the term: {search_phrase}")
+            return None
+        return parse_total_results(offset_element.text)
+
+    def _iter_pages(
+        self,
+        search: SearchContext,
+        scrape_id: str,
+        start_offset: int = 0,
+        checkpoint: Optional[Checkpoint] = None,
+        end_offset: Optional[int] = None,
+    ) -> Iterator[NewsArticle]:
+        max_offset = self._total_results()
+        if max_offset is None:
+            logging.error(f"No search result match the term: {search.search_phrase}")
             self.browser.capture_page_screenshot(str(get_output_dir()/'NSRMT-TOexcpetion.png'))
-            self.browser.close_browser()
             return
+        if end_offset is not None:
+            max_offset = min(max_offset, end_offset)
+
+        logging.info(f"Offset range: {start_offset//PAGE_SIZE}-{max_offset//PAGE_SIZE}")
+
+        tracer = get_tracer()
+        pages_scraped = 0
+        start = perf_counter()
+
+        for offset in range(start_offset, max_offset, PAGE_SIZE):
+            self._await_results(search_url(search.search_phrase, search.section, offset, self.base_url), offset)
+
+            with tracer.span("page_extract", offset=offset):
+                page_articles, break_scrape = self._collect_page(search)
+            self.session.page_loaded()
+            pages_scraped += 1
+            tracer.count("pages")
+
+            next_offset = offset + PAGE_SIZE
+            if not break_scrape and next_offset < max_offset and self.page_workers > 1:
+                offsets = range(next_offset, max_offset, PAGE_SIZE)
+                if self.plan_offsets:
+                    planner = OffsetPlanner(lambda offset: self._probe_oldest_date(search, offset), PAGE_SIZE)
+                    offsets = planner.plan(max_offset, search.earliest_date, start_offset=next_offset)
+                parallel_result = self._scrape_pages_parallel(search, offsets)
+                if parallel_result is None:
+                    raise ScrapeInterrupted("A results page did not load in the browser pool.")
+                parallel_articles, parallel_pages, merged_end = parallel_result
+                # the checkpoint continues after the last merged page, not after the page of the main browser
+                next_offset = merged_end or next_offset
+                page_articles.extend(parallel_articles)
+                pages_scraped += parallel_pages
+                break_scrape = True
+            elif not break_scrape and next_offset < max_offset:
+                # the next page loads while the thumbnails of this one are downloading
+                self.browser.execute_javascript("window.stop();")
+                logging.info(f"Go to Offset: {next_offset}")
+                self.driver  # recycles the session once it loaded `recycle_pages` pages
+                self._navigate(search_url(search.search_phrase, search.section, next_offset, self.base_url))
+            else:
+                logging.info(f"Finish Scrape in offset: {offset}")
+                break_scrape = True
+
+            with tracer.span("download_wait"):
+                self.downloader.wait()
+            if checkpoint is not None:
+                with tracer.span("checkpoint"):
+                    checkpoint.save_page(scrape_id, next_offset, page_articles)
+            yield from page_articles
+            if break_scrape:
+                break
 
-        max_offset = int(offset_element.text.split()[-1])
+        elapsed = perf_counter() - start
+        logging.info(f"Scraped {pages_scraped} pages in {elapsed:.2f}s ({pages_scraped / elapsed:.2f} pages/s).")
 
-        logging.info(f"Offset range: {max_offset//20}")
+    def _navigate(self, url: str):
+        """
+        Opens a results page in the main browser once the rate limiter grants a request to its host.
 
-        news_articles = []
-        break_scrape = False
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            None
+        """
+        self.limiter.acquire(url)
+        self._navigated_at = perf_counter()
+        self.browser.go_to(url)
+
+    def _await_results(self, url: str, offset: int):
+        """
+        Waits for the results of the page opened by `_navigate`, and records its load time in the rate
+        limiter. A page that does not load is opened again after the backoff of the limiter.
+
+        Args:
+            url (str): The URL of the page.
+            offset (int): The offset of the page.
+
+        Returns:
+            None
 
-        for offset in range(0, max_offset, 20):
+        Raises:
+            ScrapeInterrupted: If the page does not load within the retries of the limiter.
+        """
+        for attempt in range(self.limiter.max_retries + 1):
             # exploring wait from RPAframework
             try:
-                self.browser.wait_until_page_contains_element(
-                    f"xpath:{Elements.SEARCH_TITLE.value}", 40
-                )
+                self.browser.wait_until_page_contains_element(f"xpath:{Elements.SEARCH_TITLE.value}", 40)
             except TimeoutException:
+                self.limiter.record(url, perf_counter() - self._navigated_at, ok=False)
+                get_tracer().count("page_timeouts")
                 logging.error("Lazy page.")
-                self.browser.capture_page_screenshot(str(get_output_dir()/'LP-TOexcpetion.png'))
+            else:
+                load_time = perf_counter() - self._navigated_at
+                self.limiter.record(url, load_time, ok=True)
+                get_tracer().record("page_load", load_time, offset=offset)
                 return
+            if attempt < self.limiter.max_retries:
+                sleep(self.limiter.backoff(attempt))
+                self._navigate(url)
 
-            news_list = self.browser.get_webelements(f"css:{Elements.NEWS_LIST.value}")
-            total_height: int = self.browser.execute_javascript(
-                "return document.body.scrollHeight"
-            )
-            scroll_height = total_height // len(news_list)
-            scroll_coord = 0
-
-            for i, news in enumerate(news_list):
-                scroll_coord += scroll_height
-                article_id = str(uuid4())
-                self.browser.execute_javascript(
-                    f"window.scrollBy(0, {scroll_coord*0.7});"
-                )
-                news_title = self.browser.get_webelement(
-                    f"css:{Elements.NEWS_TITLE.value}", news
-                )
-                logging.info(f"Collecting {i}/{len(news_list)}: {news_title.text}")
+        self.browser.capture_page_screenshot(str(get_output_dir()/'LP-TOexcpetion.png'))
+        raise ScrapeInterrupted(f"Results page in offset {offset} did not load.")
 
-                news_clickable = news.find_element(By.CSS_SELECTOR, Elements.LINK.value)
-                news_url: str = news_clickable.get_attribute("href")
-                news_url_splitted = news_url.split("-")
-                news_date = "-".join(news_url_splitted[-3:]).removesuffix("/")
-                news_date = datetime.strptime(news_date, "%Y-%m-%d").date()
+    def _probe_oldest_date(self, search: SearchContext, offset: int) -> Optional[date]:
+        """
+        Loads a results page in the main browser and returns the date of its oldest article.
 
-                logging.info(
-                    f"Comparing article date: {news_date} with earliest date: {earliest_date}"
-                )
-                if news_date < earliest_date:
-                    break_scrape = True
-                    logging.info("No more news in between selected date.")
-                    break
+        Args:
+            search (SearchContext): The parameters of the search.
+            offset (int): The offset of the page to probe.
 
-                try:
-                    article_section = self.browser.get_webelement(
-                        f"css:{Elements.NEWS_SECTION.value}", news
-                    ).text
-                except ElementNotFound:
-                    article_section = None
+        Returns:
+            Optional[date]: The date of the oldest article of the page, or None if the page has no results.
 
-                logging.info(f"Saving thumbnail: {news_title}")
-                image_path = get_output_dir()
+        Raises:
+            ScrapeInterrupted: If the page does not load.
+        """
+        self.driver  # recycles the session once it loaded `recycle_pages` pages
+        url = search_url(search.search_phrase, search.section, offset, self.base_url)
+        self._navigate(url)
+        self._await_results(url, offset)
+        self.session.page_loaded()
+        get_tracer().count("probes")
+
+        hrefs = [item["href"] for item in self._extract_items(self.browser.driver) if item["href"]]
+        return parse_article_date(hrefs[-1]) if hrefs else None
+
+    def _scrape_pages_parallel(
+        self, search: SearchContext, offsets: Iterable[int]
+    ) -> Optional[Tuple[List[NewsArticle], int, Optional[int]]]:
+        """
+        Visits result pages with a pool of browser sessions, each worker taking the next pending offset.
 
-                try:
-                    image_element = news.find_element(By.CSS_SELECTOR, Elements.IMAGE.value)
-                    image_url = image_element.get_attribute("src")
-                    image_file = image_path / article_id
-                    image_file = image_file.with_suffix(".png")
-                    self.http.download(image_url, image_file)
-                except NoSuchElementException:
-                    logging.warning('News without image.')
+        Once a page reaches the stop condition of the search, no offset after it is handed out, and pages already
+        collected past it are discarded. Pages are merged back in offset order, so the articles
+        stay newest-first.
 
-                article = NewsArticle(
-                    article_id=article_id,
-                    title=news_title.text,
-                    date=news_date,
-                    url=news_url,
-                    image_path=str(image_file),
-                    extracted_section=article_section,
-                    selected_section=section,
-                )
+        Args:
+            search (SearchContext): The parameters of the search.
+            offsets (Iterable[int]): The result offsets to visit, in ascending order.
 
-                news_articles.append(article)
+        Returns:
+            Optional[Tuple[List[NewsArticle], int, Optional[int]]]: The merged articles, the number of pages
+                visited and the offset after the last merged page, if any, or None if a page failed to load.
+        """
+        pending = deque(offsets)
+        pages: Dict[int, List[Tuple[NewsArticle, Optional[str]]]] = {}
+        lock = Lock()
+        state = {"cutoff": None, "failed": False}
+
+        def next_offset() -> Optional[int]:
+            with lock:
+                if state["failed"] or not pending:
+                    return None
+                offset = pending.popleft()
+                if state["cutoff"] is not None and offset > state["cutoff"]:
+                    pending.clear()
+                    return None
+                return offset
+
+        def load_page(driver: uc.Chrome, url: str):
+            driver.get(url)
+            WebDriverWait(driver, 40).until(EC.presence_of_element_located((By.XPATH, Elements.SEARCH_TITLE.value)))
+
+        def is_timeout(error: Exception) -> bool:
+            return isinstance(error, TimeoutException)
+
+        def worker(worker_id: int):
+            tracer = get_tracer()
+            session = BrowserSession(f"worker-{worker_id}", max_pages=self.session.max_pages)
+            try:
+                while (offset := next_offset()) is not None:
+                    logging.info(f"Go to Offset: {offset}")
+                    driver = session.driver
+                    url = search_url(search.search_phrase, search.section, offset, self.base_url)
+                    with tracer.span("page_load", offset=offset, worker=worker_id):
+                        self.limiter.call(url, lambda: load_page(driver, url), is_timeout)
+                    with tracer.span("page_extract", offset=offset, worker=worker_id):
+                        page_items, crossed = self._parse_items(self._extract_items(driver), search)
+                    session.page_loaded()
+                    tracer.count("pages")
+                    with lock:
+                        pages[offset] = page_items
+                        if crossed and (state["cutoff"] is None or offset < state["cutoff"]):
+                            state["cutoff"] = offset
+            except TimeoutException:
+                logging.error("Lazy page.")
+                with lock:
+                    state["failed"] = True
+            finally:
+                session.close()
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=self.page_workers, thread_name_prefix="page") as executor:
+            for future in [executor.submit(worker, worker_id) for worker_id in range(self.page_workers)]:
+                future.result()
+        elapsed = perf_counter() - start
+        logging.info(
+            f"Scraped {len(pages)} pages in {elapsed:.2f}s ({len(pages) / elapsed:.2f} pages/s) "
+            f"with {self.page_workers} browser sessions."
+        )
+
+        if state["failed"]:
+            return
 
-            if not break_scrape:
-                self.browser.execute_javascript("window.stop();")
-                logging.info(f"Go to Offset: {offset}")
-                self.browser.go_to(self.base_url.format(query, section, offset))
-            else:
-                logging.info(f"Finish Scrape in offset: {offset}")
+        news_articles = []
+        end_offset = None
+        for offset in sorted(pages):
+            if state["cutoff"] is not None and offset > state["cutoff"]:
                 break
+            for article, image_url in pages[offset]:
+                if not search.is_duplicate(article) and image_url:
+                    self.downloader.submit(article, image_url, search.seen_index)
+                news_articles.append(article)
+            end_offset = offset + PAGE_SIZE
+        return news_articles, len(pages), end_offset
+
+    def _collect_page(self, search: SearchContext) -> Tuple[List[NewsArticle], bool]:
+        """
+        Collects the news articles of the current results page.
+
+        Args:
+            search (SearchContext): The parameters of the search.
+
+        Returns:
+            Tuple[List[NewsArticle], bool]: The collected articles and whether the stop condition was reached.
+        """
+        if self.batch_extraction:
+            return self._collect_page_batch(search)
+        return self._collect_page_elements(search)
+
+    def _collect_page_batch(self, search: SearchContext) -> Tuple[List[NewsArticle], bool]:
+        page_items, crossed = self._parse_items(self._extract_items(self.browser.driver), search)
+
+        page_articles = []
+        for article, image_url in page_items:
+            if not search.is_duplicate(article) and image_url:
+                self.downloader.submit(article, image_url, search.seen_index)
+            page_articles.append(article)
+        return page_articles, crossed
+
+    def _extract_items(self, driver) -> List[dict]:
+        raw_items = driver.execute_script(
+            EXTRACT_NEWS_JS,
+            Elements.NEWS_LIST.value,
+            Elements.NEWS_TITLE.value,
+            Elements.LINK.value,
+            Elements.NEWS_SECTION.value,
+            Elements.NEWS_DATE.value,
+            Elements.IMAGE.value,
+        )
+        items = json.loads(raw_items)
+        logging.info(f"Extracted {len(items)} results in one round-trip.")
+        return items
+
+    def _parse_items(
+        self, items: List[dict], search: SearchContext
+    ) -> Tuple[List[Tuple[NewsArticle, Optional[str]]], bool]:
+        """
+        Builds the news articles from the extracted results of a page, up to the stop condition of the search.
+
+        Args:
+            items (List[dict]): The results returned by the extraction script.
+            search (SearchContext): The parameters of the search.
+
+        Returns:
+            Tuple[List[Tuple[NewsArticle, Optional[str]]], bool]: The articles paired with their thumbnail URL,
+                and whether the stop condition was reached.
+        """
+        page_items = []
+        for i, item in enumerate(items):
+            if not item["title"] or not item["href"]:
+                logging.warning(f"Skipping result {i} without title or link.")
+                continue
+
+            news_date = parse_article_date(item["href"])
+            if search.should_stop(item["href"], news_date):
+                return page_items, True
+
+            article = NewsArticle(
+                article_id=str(uuid4()),
+                title=item["title"],
+                date=news_date,
+                url=item["href"],
+                image_path="",
+                extracted_section=item["section"],
+                selected_section=search.section,
+            )
+            if not item["image"]:
+                logging.warning("News without image.")
+            page_items.append((article, item["image"]))
+        return page_items, False
+
+    def _collect_page_elements(self, search: SearchContext) -> Tuple[List[NewsArticle], bool]:
+        page_articles = []
+        news_list = self.browser.get_webelements(f"css:{Elements.NEWS_LIST.value}")
+        total_height: int = self.browser.execute_javascript(
+            "return document.body.scrollHeight"
+        )
+        scroll_height = total_height // len(news_list)
+        scroll_coord = 0
+
+        for i, news in enumerate(news_list):
+            scroll_coord += scroll_height
+            article_id = str(uuid4())
+            self.browser.execute_javascript(
+                f"window.scrollBy(0, {scroll_coord*0.7});"
+            )
+            news_title = self.browser.get_webelement(
+                f"css:{Elements.NEWS_TITLE.value}", news
+            )
+            logging.info(f"Collecting {i}/{len(news_list)}: {news_title.text}")
+
+            news_clickable = news.find_element(By.CSS_SELECTOR, Elements.LINK.value)
+            news_url: str = news_clickable.get_attribute("href")
+            news_date = parse_article_date(news_url)
+
+            logging.info(
+                f"Comparing article date: {news_date} with earliest date: {search.earliest_date}"
+            )
+            if search.should_stop(news_url, news_date):
+                return page_articles, True
+
+            try:
+                article_section = self.browser.get_webelement(
+                    f"css:{Elements.NEWS_SECTION.value}", news
+                ).text
+            except ElementNotFound:
+                article_section = None
+
+            article = NewsArticle(
+                article_id=article_id,
+                title=news_title.text,
+                date=news_date,
+                url=news_url,
+                image_path="",
+                extracted_section=article_section,
+                selected_section=search.section,
+            )
+
+            if not search.is_duplicate(article):
+                try:
+                    image_element = news.find_element(By.CSS_SELECTOR, Elements.IMAGE.value)
+                    logging.info(f"Queueing thumbnail: {news_title.text}")
+                    self.downloader.submit(article, image_element.get_attribute("src"), search.seen_index)
+                except NoSuchElementException:
+                    logging.warning('News without image.')
 
-        self.browser.close_all_browsers()
-        return news_articles
+            page_articles.append(article)
+        return page_articles, False
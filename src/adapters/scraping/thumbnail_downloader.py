@@ -0,0 +1,220 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, List, Optional
+import requests
+from adapters.http.http_cache import HttpCache
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+from adapters.http.session import build_session, is_retryable
+from adapters.persistence.image_archive import ImageArchive, sniff_extension
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import SeenIndex
+from core.domain.tracing import get_tracer
+
+if TYPE_CHECKING:
+    from adapters.scraping.thumbnail_normalizer import ThumbnailNormalizer
+
+
+class ThumbnailDownloader:
+    """
+    Downloads article thumbnails in a bounded thread pool, so the scraping loop only queues URLs.
+
+    Each finished download fills in `NewsArticle.image_path`. Failed downloads are logged and leave
+    `image_path` empty. Thumbnails are saved with the extension of their real format, either as one
+    file per article or, when `archive_images` is set, in a deduplicated tar archive per scrape.
+    With a rate limiter, downloads are paced per host and retried by the limiter instead of the session,
+    except fresh cache hits, which are served from disk without a token and do not feed its latency.
+    With a normalizer, each thumbnail is resized and re-encoded in its process pool before it is stored,
+    still off the scraping thread, and its dimensions are recorded. The stored size is always recorded.
+
+    Attributes:
+        output_dir (Path): Directory where the thumbnails are written.
+        workers (int): Maximum number of concurrent downloads.
+        timeout (float): Timeout, in seconds, for each download request.
+        archive_images (bool): Whether thumbnails are stored in an ImageArchive per scrape.
+        limiter (Optional[AdaptiveRateLimiter]): The limiter pacing the downloads.
+        cache (Optional[HttpCache]): The on-disk cache serving repeated thumbnails.
+        normalizer (Optional[ThumbnailNormalizer]): The stage resizing and re-encoding the thumbnails.
+
+    Methods:
+        open_archive: Starts the image archive of a scrape.
+        close_archive: Waits for pending downloads and finishes the image archive.
+        submit: Queues the download of an article thumbnail.
+        wait: Blocks until every queued download has finished.
+        close: Waits for pending downloads and releases the pool and the HTTP session.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        workers: int = 8,
+        timeout: float = 30,
+        session: Optional[requests.Session] = None,
+        archive_images: bool = False,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        cache: Optional[HttpCache] = None,
+        normalizer: Optional["ThumbnailNormalizer"] = None,
+    ) -> None:
+        self.output_dir = output_dir
+        self.workers = workers
+        self.timeout = timeout
+        self.archive_images = archive_images
+        self.limiter = limiter
+        self.cache = cache
+        self.normalizer = normalizer
+        self._archive: Optional[ImageArchive] = None
+        self._session = session
+        self._executor = None
+        self._pending: List[Future] = []
+        self._lock = Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Initializes and returns the pooled HTTP session if not already initialized.
+
+        Returns:
+            requests.Session: The pooled session shared by all download workers.
+        """
+        if self._session is None:
+            self._session = build_session(
+                pool_size=self.workers, retries=0 if self.limiter else 3, cache=self.cache
+            )
+        return self._session
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Initializes and returns the download thread pool if not already initialized.
+
+        Returns:
+            ThreadPoolExecutor: The bounded thread pool running the downloads.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="thumbnail")
+        return self._executor
+
+    def open_archive(self, scrape_id: str):
+        """
+        Starts the image archive of a scrape, if thumbnails are archived.
+
+        Args:
+            scrape_id (str): The ID of the scrape, used for naming the archive.
+
+        Returns:
+            None
+        """
+        if self.archive_images:
+            self._archive = ImageArchive(self.output_dir, scrape_id)
+
+    def close_archive(self):
+        """
+        Waits for pending downloads and finishes the image archive of the current scrape.
+
+        Returns:
+            None
+        """
+        self.wait()
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def submit(
+        self, article: NewsArticle, image_url: str, seen_index: Optional[SeenIndex] = None
+    ) -> Optional[Future]:
+        """
+        Queues the download of an article thumbnail, unless a previous scrape already saved it.
+
+        Args:
+            article (NewsArticle): The article whose `image_path` is filled in once the download finishes.
+            image_url (str): The URL of the thumbnail.
+            seen_index (Optional[SeenIndex], optional): Index used to reuse known thumbnails. Defaults to None.
+
+        Returns:
+            Optional[Future]: A future resolving to the saved image path, or None if the download failed.
+                None if a known thumbnail was reused.
+        """
+        if seen_index is not None:
+            known_image = seen_index.image_path(article.url)
+            if known_image is not None:
+                article.image_path = known_image
+                get_tracer().count("images_reused")
+                return None
+
+        future = self.executor.submit(self._download, article, image_url)
+        with self._lock:
+            self._pending.append(future)
+        return future
+
+    def _download(self, article: NewsArticle, image_url: str) -> Optional[str]:
+        tracer = get_tracer()
+        try:
+            with tracer.span("image_download"):
+                if self.limiter is not None and not (self.cache is not None and self.cache.is_fresh(image_url)):
+                    response = self.limiter.call(image_url, lambda: self._get(image_url), is_retryable)
+                else:
+                    response = self._get(image_url)
+            data = response.content
+            if self.normalizer is not None:
+                with tracer.span("image_normalize"):
+                    data, article.image_width, article.image_height = self.normalizer.normalize(data)
+                tracer.count("image_bytes_saved", len(response.content) - len(data))
+            with tracer.span("image_store"):
+                article.image_path = self._store(article, data)
+            article.image_bytes = len(data)
+        except (requests.RequestException, OSError) as error:
+            logging.warning(f"Thumbnail download failed for {image_url}: {error}")
+            tracer.count("images_failed")
+            return None
+        tracer.count("images_downloaded")
+        return article.image_path
+
+    def _get(self, url: str) -> requests.Response:
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def _store(self, article: NewsArticle, data: bytes) -> str:
+        archive = self._archive
+        if archive is not None:
+            return archive.add(data)
+
+        image_file = (self.output_dir / article.article_id).with_suffix(sniff_extension(data))
+        image_file.write_bytes(data)
+        return str(image_file)
+
+    def wait(self) -> int:
+        """
+        Blocks until every queued download has finished.
+
+        Returns:
+            int: The number of thumbnails downloaded successfully.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+
+        start = perf_counter()
+        wait(pending)
+        elapsed = perf_counter() - start
+        downloaded = sum(1 for future in pending if future.result() is not None)
+        logging.info(f"Downloaded {downloaded}/{len(pending)} thumbnails, waited {elapsed:.2f}s for the pool.")
+        return downloaded
+
+    def close(self):
+        """
+        Waits for pending downloads and releases the thread pool and the HTTP session.
+
+        Returns:
+            None
+        """
+        self.close_archive()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
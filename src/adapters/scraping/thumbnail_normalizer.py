@@ -0,0 +1,157 @@
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Optional, Tuple
+from PIL import Image, ImageOps
+
+SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "method": 4},
+    "jpeg": {"format": "JPEG", "optimize": True, "progressive": True},
+}
+
+
+def normalize_thumbnail(data: bytes, max_size: int, image_format: str, quality: int) -> Tuple[bytes, int, int]:
+    """
+    Decodes an image of any format Pillow reads, applies its EXIF orientation, shrinks it to fit in a
+    square of `max_size` pixels and re-encodes it. It runs in the worker processes of ThumbnailNormalizer.
+
+    The source is kept when it cannot be decoded, or when it is already within the bound and smaller
+    than its re-encoded version.
+
+    Args:
+        data (bytes): The downloaded image.
+        max_size (int): The bound, in pixels, of the width and the height.
+        image_format (str): The output format, "webp" or "jpeg".
+        quality (int): The encoder quality, from 1 to 100.
+
+    Returns:
+        Tuple[bytes, int, int]: The image to store, its width and its height, 0 if it could not be decoded.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            resized = max(source.size) > max_size
+            # JPEG sources are decoded at the nearest scale above the bound, far cheaper than full size
+            source.draft("RGB", (max_size, max_size))
+            image = ImageOps.exif_transpose(source)
+            image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            if image_format == "jpeg" or image.mode not in ("RGB", "RGBA"):
+                image = _flatten(image) if image_format == "jpeg" else image.convert("RGBA")
+
+            output = io.BytesIO()
+            image.save(output, quality=quality, **SAVE_OPTIONS[image_format])
+    except (OSError, ValueError, Image.DecompressionBombError) as error:
+        logging.warning(f"Thumbnail kept as downloaded, it could not be normalized: {error}")
+        return data, 0, 0
+
+    if not resized and output.tell() >= len(data):
+        return data, image.width, image.height
+    return output.getvalue(), image.width, image.height
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+class ThumbnailNormalizer:
+    """
+    Resizes and re-encodes downloaded thumbnails in a process pool, so the decoding and encoding
+    run in parallel without holding the GIL of the download threads or the scraping thread.
+
+    The workers are spawned rather than forked: a fork copies the locks held by other threads, like the
+    logging and connection pool locks of the download threads, and a worker can then wait on them forever.
+    The pool should also be started before the download threads, with `start`.
+
+    Attributes:
+        max_size (int): The bound, in pixels, of the width and the height of a thumbnail.
+        image_format (str): The output format, "webp" or "jpeg".
+        quality (int): The encoder quality, from 1 to 100.
+        workers (Optional[int]): The number of worker processes, the number of CPUs if None.
+        _executor (Optional[ProcessPoolExecutor]): The process pool, initialized lazily.
+
+    Methods:
+        executor: Property to initialize and get the process pool.
+        start: Starts the process pool.
+        normalize: Resizes and re-encodes a thumbnail in the process pool.
+        close: Shuts the process pool down.
+    """
+
+    def __init__(
+        self, max_size: int = 320, image_format: str = "webp", quality: int = 80, workers: Optional[int] = None
+    ) -> None:
+        if image_format not in SAVE_OPTIONS:
+            raise ValueError(f"Unsupported thumbnail format: {image_format}")
+        self.max_size = max_size
+        self.image_format = image_format
+        self.quality = quality
+        self.workers = workers
+        self._executor = None
+        self._lock = Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """
+        Initializes and returns the process pool if not already initialized.
+
+        Returns:
+            ProcessPoolExecutor: The pool running `normalize_thumbnail`.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def start(self) -> "ThumbnailNormalizer":
+        """
+        Starts the process pool and its worker processes, so they are ready before the first download.
+
+        Returns:
+            ThumbnailNormalizer: The normalizer itself.
+        """
+        executor = self.executor
+        # spawned workers are only started as tasks are submitted, one per task while none is idle
+        wait([executor.submit(int) for _ in range(self.workers or os.cpu_count() or 1)])
+        return self
+
+    def normalize(self, data: bytes) -> Tuple[bytes, int, int]:
+        """
+        Resizes and re-encodes a thumbnail in the process pool, blocking the calling download thread
+        until it is done. If a worker process dies, the thumbnail is kept as downloaded and a new pool
+        is started for the next ones.
+
+        Args:
+            data (bytes): The downloaded image.
+
+        Returns:
+            Tuple[bytes, int, int]: The image to store, its width and its height, 0 if it could not be decoded.
+        """
+        executor = self.executor
+        try:
+            return executor.submit(normalize_thumbnail, data, self.max_size, self.image_format, self.quality).result()
+        except BrokenProcessPool as error:
+            logging.error(f"Thumbnail normalization pool failed, thumbnail kept as downloaded: {error}")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            return data, 0, 0
+
+    def close(self):
+        """
+        Shuts the process pool down.
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,156 @@
+"""
+Benchmarks the near-duplicate index at large sizes: the time to index synthetic articles, the size of
+the SQLite file, then the latency of `find_duplicate` for new articles and for edited copies of indexed
+articles, with the share of copies found and of new articles wrongly flagged.
+
+The index is reopened before the lookups, so they run against the database file, not the articles
+reserved in memory while it was built.
+
+Usage (from the src directory):
+    python -m benchmarks.duplicate_index --sizes 100000 1000000
+"""
+import argparse
+import json
+import random
+import tempfile
+from datetime import date
+from itertools import accumulate
+from pathlib import Path
+from statistics import mean, quantiles
+from time import perf_counter
+from typing import Iterator, List
+from uuid import uuid4
+from adapters.persistence.sqlite_duplicate_index import SqliteDuplicateIndex
+from core.domain.entities import NewsArticle
+from core.domain.near_duplicates import normalize_text
+
+CHUNK_SIZE = 10_000
+VOCABULARY_SIZE = 30_000
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+class HeadlineGenerator:
+    """
+    Generates synthetic headlines from a vocabulary with a Zipf-like word frequency, so common words
+    are shared by many headlines like in real news.
+    """
+
+    def __init__(self, seed: int) -> None:
+        self.random = random.Random(seed)
+        self.words = [
+            "".join(self.random.choices(LETTERS, k=self.random.randint(2, 10))) for _ in range(VOCABULARY_SIZE)
+        ]
+        self.cum_weights = list(accumulate(1 / (rank + 1) for rank in range(VOCABULARY_SIZE)))
+
+    def headline(self) -> str:
+        words = self.random.choices(self.words, cum_weights=self.cum_weights, k=self.random.randint(7, 14))
+        return " ".join(words).capitalize()
+
+    def edit(self, headline: str) -> str:
+        """
+        Edits a headline like a republished copy: one word replaced, removed or added, and punctuation.
+        """
+        words = headline.split()
+        position = self.random.randrange(len(words))
+        edit = self.random.choice(("replace", "remove", "add"))
+        if edit == "replace":
+            words[position] = self.random.choice(self.words)
+        elif edit == "remove":
+            del words[position]
+        else:
+            words.insert(position, self.random.choice(self.words))
+        return " ".join(words) + self.random.choice(("", ".", " - update"))
+
+
+def synthetic_articles(generator: HeadlineGenerator, size: int, prefix: str) -> Iterator[NewsArticle]:
+    today = date.today()
+    for i in range(size):
+        yield NewsArticle(
+            article_id=str(uuid4()),
+            title=generator.headline(),
+            date=today,
+            url=f"https://www.reuters.com/markets/{prefix}-{i}/",
+            image_path="",
+            selected_section="all",
+        )
+
+
+def latencies(microseconds: List[float]) -> dict:
+    percentiles = quantiles(microseconds, n=100)
+    return {
+        "mean_us": round(mean(microseconds), 1),
+        "p50_us": round(percentiles[49], 1),
+        "p99_us": round(percentiles[98], 1),
+    }
+
+
+def run(size: int, lookups: int, seed: int) -> dict:
+    generator = HeadlineGenerator(seed)
+    with tempfile.TemporaryDirectory() as output_dir:
+        path = Path(output_dir) / "duplicate_index.sqlite3"
+        index = SqliteDuplicateIndex(path)
+        # every `step`-th article is kept to be copied, instead of holding every article in memory
+        step = max(1, size // lookups)
+        indexed: List[NewsArticle] = []
+        chunk = []
+        start = perf_counter()
+        for i, article in enumerate(synthetic_articles(generator, size, "indexed")):
+            chunk.append(article)
+            if i % step == 0:
+                indexed.append(article)
+            if len(chunk) == CHUNK_SIZE:
+                index.add("build", chunk)
+                chunk = []
+        index.add("build", chunk)
+        build_seconds = perf_counter() - start
+        index.close()
+
+        index = SqliteDuplicateIndex(path)
+        fingerprint_times = []
+        new_times, new_flagged = [], 0
+        for article in synthetic_articles(generator, lookups, "new"):
+            start = perf_counter()
+            index.hasher.band_keys(index.hasher.signature(index.hasher.shingles(normalize_text(article.title))))
+            fingerprint_times.append((perf_counter() - start) * 1e6)
+            start = perf_counter()
+            new_flagged += index.find_duplicate("lookup", article) is not None
+            new_times.append((perf_counter() - start) * 1e6)
+
+        copy_times, copies_found = [], 0
+        for i, original in enumerate(indexed[:lookups]):
+            copy = NewsArticle(
+                article_id=str(uuid4()),
+                title=generator.edit(original.title),
+                date=original.date,
+                url=f"https://www.reuters.com/world/copy-{i}/",
+                image_path="",
+                selected_section="world",
+            )
+            start = perf_counter()
+            copies_found += index.find_duplicate("lookup", copy) == original.url
+            copy_times.append((perf_counter() - start) * 1e6)
+        index.close()
+
+        return {
+            "articles": size,
+            "build_s": round(build_seconds, 1),
+            "database_mib": round(path.stat().st_size / 2**20, 1),
+            "fingerprint": latencies(fingerprint_times),
+            "lookup_new": latencies(new_times),
+            "lookup_copy": latencies(copy_times),
+            "copies_found": round(copies_found / len(copy_times), 3),
+            "new_flagged": round(new_flagged / len(new_times), 4),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps([run(size, args.lookups, args.seed) for size in args.sizes], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Benchmarks the memory and the conversion time of large result sets held as regular dataclass
+articles (the previous layout), slotted NewsArticle objects, and a columnar NewsBatch.
+
+For each layout it reports the memory retained and the peak while building the articles, then the
+time and peak memory of converting them into the flat columns the repositories write.
+
+Usage (from the src directory):
+    python -m benchmarks.news_batch --sizes 100000 500000
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Any, Callable, Iterator, Tuple
+from uuid import uuid4
+from adapters.persistence.schema import news_columns
+from core.domain.batch import NewsBatch
+from core.domain.entities import NewsArticle
+
+LegacyNewsArticle = make_dataclass(
+    "LegacyNewsArticle",
+    [
+        (item.name, item.type, field(default=item.default, default_factory=item.default_factory))
+        if item.default is not MISSING or item.default_factory is not MISSING
+        else (item.name, item.type)
+        for item in fields(NewsArticle)
+    ],
+)
+SECTIONS = ("Markets", "Business", "World", "Technology", "Sustainability")
+
+
+def synthetic_fields(size: int) -> Iterator[tuple]:
+    """
+    Generates the fields of synthetic articles, in the order of the NewsArticle fields.
+
+    Args:
+        size (int): The number of articles.
+
+    Yields:
+        tuple: The fields of an article, with new strings for every text field.
+    """
+    today = date.today()
+    for i in range(size):
+        section = SECTIONS[i % len(SECTIONS)]
+        yield (
+            str(uuid4()),
+            f"Markets rally as investors weigh central bank outlook {i}",
+            today - timedelta(days=i // 500),
+            f"https://www.reuters.com/markets/markets-rally-{i}/",
+            f"output/{i}.jpg",
+            "all",
+            "".join(section),  # A new string per article, like the text read from a page
+            f"Shares rose $1.5 billion in early trading {i}.",
+            0,
+            False,
+            {"central bank": 1} if i % 10 == 0 else {},
+            ["USD"] if i % 3 == 0 else [],
+        )
+
+
+def timed(action: Callable[[], Any]) -> Tuple[Any, float]:
+    gc.collect()
+    start = perf_counter()
+    result = action()
+    return result, perf_counter() - start
+
+
+def traced(action: Callable[[], Any]) -> Tuple[int, int]:
+    """
+    Runs an action under tracemalloc, which slows it down, so it is timed in a separate run.
+
+    Args:
+        action (Callable[[], Any]): The action.
+
+    Returns:
+        Tuple[int, int]: The memory retained by the result of the action and the peak memory, in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = action()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def mib(size: int) -> float:
+    return round(size / 2**20, 1)
+
+
+def measure(build: Callable[[], Any], dataframe: bool, from_articles: bool = False) -> dict:
+    """
+    Measures one layout: the memory and time of building its articles, then of converting them. The
+    articles are released when the function returns, before the next layout is built.
+
+    Args:
+        build (Callable[[], Any]): Builds the articles of the layout.
+        dataframe (bool): Whether to convert the columns into a pandas DataFrame.
+        from_articles (bool, optional): Whether to also time the conversion of the articles into a
+            NewsBatch. Defaults to False.
+
+    Returns:
+        dict: The measures of the layout.
+    """
+    retained, build_peak = traced(build)
+    articles, build_seconds = timed(build)
+    _, convert_seconds = timed(lambda: convert(articles, dataframe))
+    _, convert_peak = traced(lambda: convert(articles, dataframe))
+    measures = {
+        "build_s": round(build_seconds, 3),
+        "retained_mib": mib(retained),
+        "build_peak_mib": mib(build_peak),
+        "convert_s": round(convert_seconds, 3),
+        "convert_peak_mib": mib(convert_peak),
+    }
+    if from_articles:
+        _, seconds = timed(lambda: NewsBatch.from_articles(articles))
+        measures["from_articles_s"] = round(seconds, 3)
+    return measures
+
+
+def run(size: int, dataframe: bool) -> dict:
+    builders = {
+        "dataclass": lambda: [LegacyNewsArticle(*values) for values in synthetic_fields(size)],
+        "slotted": lambda: [NewsArticle(*values) for values in synthetic_fields(size)],
+        "batch": lambda: build_batch(size),
+    }
+    result = {"articles": size}
+    for layout, build in builders.items():
+        result[layout] = measure(build, dataframe, from_articles=layout == "slotted")
+    return result
+
+
+def build_batch(size: int) -> NewsBatch:
+    batch = NewsBatch()
+    for values in synthetic_fields(size):
+        batch.append(*values)
+    return batch
+
+
+def convert(articles, dataframe: bool):
+    """
+    Converts articles into the flat columns written by the repositories.
+
+    Args:
+        articles (NewsRecords): The articles, as a list or a NewsBatch.
+        dataframe (bool): Whether to build a pandas DataFrame from the columns, like the Excel repository.
+
+    Returns:
+        Any: The columns, or the DataFrame.
+    """
+    columns = news_columns(articles)
+    if dataframe:
+        from pandas import DataFrame
+
+        return DataFrame(columns)
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 500_000])
+    parser.add_argument("--dataframe", action="store_true", help="Convert into a pandas DataFrame.")
+    args = parser.parse_args()
+    print(json.dumps([run(size, args.dataframe) for size in args.sizes], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmarks the per-article news processors against the batched and pandas-vectorized APIs.
+
+Usage (from the src directory):
+    python -m benchmarks.news_processor --sizes 10000 100000 1000000
+"""
+import argparse
+import json
+import random
+from time import perf_counter
+from typing import List, Tuple
+from core.domain.news_processor import analyze_batch, analyze_frame, contains_money, count_phrases
+
+WORDS = ("markets", "rally", "as", "investors", "weigh", "central", "bank", "outlook", "shares", "fall", "tech")
+AMOUNTS = ("$1,200", "$ 35", "4.5 USD", "10 dólares", "$3.2")
+
+
+def synthetic_articles(size: int, seed: int = 0) -> Tuple[List[str], List[str]]:
+    """
+    Builds synthetic titles and descriptions, a fifth of them mentioning an amount of money.
+
+    Args:
+        size (int): The number of articles.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        Tuple[List[str], List[str]]: The titles and the descriptions.
+    """
+    rng = random.Random(seed)
+    titles, descriptions = [], []
+    for i in range(size):
+        words = rng.choices(WORDS, k=rng.randint(6, 14))
+        if i % 5 == 0:
+            words.insert(rng.randrange(len(words)), rng.choice(AMOUNTS))
+        titles.append(" ".join(words))
+        descriptions.append(" ".join(rng.choices(WORDS, k=rng.randint(15, 40))))
+    return titles, descriptions
+
+
+def throughput(size: int, seconds: float) -> float:
+    return round(size / seconds) if seconds else float("inf")
+
+
+def run(size: int) -> dict:
+    titles, descriptions = synthetic_articles(size)
+    result = {"articles": size}
+
+    start = perf_counter()
+    for title, description in zip(titles, descriptions):
+        contains_money(title=title, description=description)
+        count_phrases(title=title, description=description)
+    result["per_article_per_second"] = throughput(size, perf_counter() - start)
+
+    start = perf_counter()
+    analyze_batch(titles, descriptions)
+    result["batch_per_second"] = throughput(size, perf_counter() - start)
+
+    try:
+        from pandas import DataFrame
+    except ImportError:
+        return result
+
+    df = DataFrame({"title": titles, "description": descriptions})
+    start = perf_counter()
+    analyze_frame(df)
+    result["pandas_per_second"] = throughput(size, perf_counter() - start)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    print(json.dumps([run(size) for size in args.sizes], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmarks the OffsetPlanner against a linear walk on synthetic newest-first result sets.
+
+Usage (from the src directory):
+    python -m benchmarks.offset_planner --pages 1000 5000 10000
+"""
+import argparse
+import json
+import random
+from datetime import date, timedelta
+from time import perf_counter
+from typing import List, Optional
+from core.domain.offset_planner import OffsetPlanner
+
+PAGE_SIZE = 20
+
+
+def synthetic_results(pages: int, seed: int = 0) -> List[date]:
+    """
+    Builds the article dates of a synthetic newest-first result set.
+
+    Args:
+        pages (int): The number of result pages.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        List[date]: The article dates, newest first.
+    """
+    rng = random.Random(seed)
+    current = date.today()
+    dates = []
+    for _ in range(pages * PAGE_SIZE):
+        current -= timedelta(days=rng.choice((0, 0, 0, 1)))
+        dates.append(current)
+    return dates
+
+
+def run(pages: int, page_latency: float, workers: int) -> dict:
+    dates = synthetic_results(pages)
+    earliest_date = dates[len(dates) * 3 // 4]
+
+    def probe(offset: int) -> Optional[date]:
+        page = dates[offset : offset + PAGE_SIZE]
+        return page[-1] if page else None
+
+    start = perf_counter()
+    planner = OffsetPlanner(probe, PAGE_SIZE)
+    planned = planner.plan(len(dates), earliest_date)
+    planner_seconds = perf_counter() - start
+
+    linear_pages = 0
+    for offset in range(0, len(dates), PAGE_SIZE):
+        linear_pages += 1
+        if probe(offset) < earliest_date:
+            break
+
+    assert planned[-1] == (linear_pages - 1) * PAGE_SIZE, "planner and linear walk disagree"
+    parallel_loads = -(-len(planned) // workers)
+    return {
+        "pages": pages,
+        "pages_to_fetch": len(planned),
+        "planner_probes": planner.probes,
+        "planner_cpu_seconds": round(planner_seconds, 6),
+        "linear_sequential_loads": linear_pages,
+        "estimated_sequential_seconds": round(linear_pages * page_latency, 1),
+        "estimated_planned_seconds": round((planner.probes + parallel_loads) * page_latency, 1),
+        "workers": workers,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--page-latency", type=float, default=2.0, help="Seconds to load one results page.")
+    parser.add_argument("--workers", type=int, default=4, help="Browser sessions fetching the planned pages.")
+    args = parser.parse_args()
+    print(json.dumps([run(pages, args.page_latency, args.workers) for pages in args.pages], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+Benchmarks the whole scrape pipeline offline. A local HTTP server stands in for the Reuters search and
+its thumbnail CDN, and `ScrapeNews.scrape_and_save` runs end to end with the http scraper, reporting
+articles per second, latency percentiles of each stage and peak RSS as JSON.
+
+The server generates result pages with the markup the scraper parses, or serves recorded pages from
+a fixtures directory holding `search_<offset>.html` files and an `images` directory, with the
+thumbnails of the pages pointing at `/images/<name>`.
+
+Usage (from the src directory):
+    python -m benchmarks.pipeline --articles 2000 --repository excel
+    python -m benchmarks.pipeline --fixtures ../fixtures/reuters --latency-ms 50
+    python -m benchmarks.pipeline --enrich --latency-ms 50
+    python -m benchmarks.pipeline --cache-dir /tmp/bench_cache  # run twice to measure the cache hits
+"""
+import argparse
+import hashlib
+import json
+import resource
+import tempfile
+from datetime import date
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock, Thread
+from time import perf_counter, sleep
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+from adapters.http.article_enricher import HttpArticleEnricher
+from adapters.http.http_cache import HttpCache
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+from adapters.persistence.json_checkpoint import JsonCheckpointStore
+from adapters.scraping.http_scraper import HttpScraper
+from adapters.scraping.reuters import PAGE_SIZE
+from benchmarks.repositories import build_repository
+from core.application.scrape_news import ScrapeNews
+from core.domain.tracing import Tracer, set_tracer
+
+REPOSITORIES = ("excel", "parquet", "csv", "sqlite")
+SEARCH_PATH = "/site-search/?query={}&section={}&offset={}&date=any_time&sort=newest"
+SECTIONS = ("World", "Business", "Markets", "Technology", "Sustainability")
+# a JPEG signature followed by padding, so the thumbnails are saved with their sniffed extension
+THUMBNAIL_HEADER = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00"
+
+PAGE_TEMPLATE = """<html><body><div>
+<div></div><div><div></div><div><div><div></div><div>
+<div></div><div></div><div><span>{first} to {last} of {total}</span></div>
+</div></div></div></div>
+<ul class="search-results__list__2SxSK">{items}</ul>
+</div></body></html>"""
+
+ARTICLE_TEMPLATE = """<html><head>
+<meta name="description" content="Shares rose as investors weighed a $1.5 billion central bank facility in {path}."/>
+</head><body><article><p>Shares rose in early trading.</p></article></body></html>"""
+
+ITEM_TEMPLATE = """<li><div>
+<span data-testid="Label">{section}</span>
+<a data-testid="Title" href="/{slug}/article-{i}-{day}/">Markets weigh $1.5 billion central bank outlook {i}</a>
+<img src="/images/{image}.jpg"/>
+</div></li>"""
+
+
+class SyntheticFixtures:
+    """
+    Generates result pages and thumbnails in the markup of the Reuters search.
+
+    Attributes:
+        articles (int): The total number of results.
+        images (int): The number of distinct thumbnails.
+        thumbnail (bytes): The body of every thumbnail.
+    """
+
+    def __init__(self, articles: int, images: int, thumbnail_kb: int) -> None:
+        self.articles = articles
+        self.images = images
+        self.thumbnail = THUMBNAIL_HEADER + bytes(thumbnail_kb * 1024)
+        self.day = date.today().isoformat()
+
+    def page(self, offset: int) -> bytes:
+        items = "".join(
+            ITEM_TEMPLATE.format(
+                section=SECTIONS[i % len(SECTIONS)],
+                slug=SECTIONS[i % len(SECTIONS)].lower(),
+                i=i,
+                day=self.day,
+                image=i % self.images,
+            )
+            for i in range(offset, min(offset + PAGE_SIZE, self.articles))
+        )
+        return PAGE_TEMPLATE.format(
+            first=offset + 1, last=min(offset + PAGE_SIZE, self.articles), total=self.articles, items=items
+        ).encode("utf-8")
+
+    def image(self, name: str) -> Optional[bytes]:
+        return self.thumbnail
+
+    def article(self, path: str) -> Optional[bytes]:
+        return ARTICLE_TEMPLATE.format(path=path).encode("utf-8")
+
+
+class RecordedFixtures:
+    """
+    Serves recorded result pages and thumbnails from a directory.
+
+    Attributes:
+        directory (Path): The directory with `search_<offset>.html` files and an `images` directory.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def page(self, offset: int) -> bytes:
+        path = self.directory / f"search_{offset}.html"
+        return path.read_bytes() if path.exists() else b"<html><body></body></html>"
+
+    def image(self, name: str) -> Optional[bytes]:
+        path = self.directory / "images" / Path(name).name
+        return path.read_bytes() if path.exists() else None
+
+    def article(self, path: str) -> Optional[bytes]:
+        return None
+
+
+def start_server(fixtures, latency: float) -> ThreadingHTTPServer:
+    """
+    Starts the local HTTP server of the fixtures on a free port, in a daemon thread.
+
+    Args:
+        fixtures (SyntheticFixtures | RecordedFixtures): The pages and thumbnails to serve.
+        latency (float): The delay, in seconds, added to every response.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            sleep(latency)
+            url = urlsplit(self.path)
+            if url.path.startswith("/images/"):
+                body, content_type = fixtures.image(url.path.removeprefix("/images/")), "image/jpeg"
+            elif url.path.startswith("/site-search/"):
+                offset = int(parse_qs(url.query).get("offset", ["0"])[0])
+                body, content_type = fixtures.page(offset), "text/html; charset=utf-8"
+            else:
+                body, content_type = fixtures.article(url.path), "text/html; charset=utf-8"
+            if body is None:
+                self.send_error(404)
+                return
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class StageTimer:
+    """
+    Records the latency of every call of the wrapped methods, grouped by pipeline stage, and the number
+    of articles of the calls that take a list of them.
+    """
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = {}
+        self.articles: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def wrap(self, obj, method: str, stage: str):
+        function = getattr(obj, method)
+
+        @wraps(function)
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.samples.setdefault(stage, []).append(perf_counter() - start)
+                    if args and isinstance(args[0], list):
+                        self.articles[stage] = self.articles.get(stage, 0) + len(args[0])
+
+        setattr(obj, method, timed)
+
+    def report(self) -> Dict[str, dict]:
+        return {stage: latency_summary(samples) for stage, samples in self.samples.items()}
+
+
+def latency_summary(samples: List[float]) -> dict:
+    ordered = sorted(samples)
+
+    def percentile(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 3)
+
+    return {
+        "calls": len(ordered),
+        "total_s": round(sum(ordered), 3),
+        "p50_ms": percentile(0.5),
+        "p90_ms": percentile(0.9),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    if args.fixtures:
+        fixtures = RecordedFixtures(Path(args.fixtures))
+    else:
+        fixtures = SyntheticFixtures(args.articles, args.images, args.thumbnail_kb)
+    server = start_server(fixtures, args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_port}{SEARCH_PATH}"
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        output_dir = Path(output_dir)
+        if args.repository == "sqlite":
+            from adapters.persistence.sqlite_repository import SqliteRepository
+
+            repository = SqliteRepository(output_dir / "news.sqlite3")
+        else:
+            repository = build_repository(args.repository, output_dir)
+        limiter = AdaptiveRateLimiter(
+            rate=args.rate, burst=args.rate, max_rate=args.rate, concurrency=args.workers, max_concurrency=args.workers
+        )
+        cache = HttpCache(Path(args.cache_dir)) if args.cache_dir else None
+        scraper = HttpScraper(
+            base_url=base_url, download_workers=args.workers, limiter=limiter, output_dir=output_dir, cache=cache
+        )
+        checkpoint = JsonCheckpointStore(output_dir / "checkpoints") if args.checkpoint else None
+        enricher = None
+        if args.enrich:
+            enricher = HttpArticleEnricher(workers=args.enrich_workers, limiter=limiter, cache=cache)
+        app = ScrapeNews(
+            scraper=scraper,
+            repositoy=repository,
+            chunk_size=args.chunk_size,
+            checkpoint=checkpoint,
+            enricher=enricher,
+        )
+
+        timer = StageTimer()
+        timer.wrap(scraper, "fetch_page", "fetch")
+        timer.wrap(scraper, "_parse_news_list", "parse")
+        timer.wrap(scraper.downloader, "_download", "download")
+        timer.wrap(scraper.downloader, "wait", "download_wait")
+        timer.wrap(app, "process", "process")
+        timer.wrap(repository, "append", "append")
+        timer.wrap(repository, "close", "close")
+        if checkpoint is not None:
+            timer.wrap(checkpoint, "save_page", "checkpoint")
+        if enricher is not None:
+            timer.wrap(enricher, "enrich", "enrich")
+
+        tracer = Tracer()
+        set_tracer(tracer)
+        start = perf_counter()
+        try:
+            app.scrape_and_save(args.search_phrase, args.date_option)
+        finally:
+            scraper.close()
+            repository.close_connection()
+            if enricher is not None:
+                enricher.close()
+            if cache is not None:
+                cache.close()
+            server.shutdown()
+        elapsed = perf_counter() - start
+        output_bytes = sum(path.stat().st_size for path in output_dir.rglob("*") if path.is_file())
+
+    articles = timer.articles.get("process", 0)
+    return {
+        "repository": args.repository,
+        "fixtures": args.fixtures or "synthetic",
+        "latency_ms": args.latency_ms,
+        "articles": articles,
+        "seconds": round(elapsed, 2),
+        "articles_per_second": round(articles / elapsed, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "output_mb": round(output_bytes / 2**20, 1),
+        "stages": timer.report(),
+        "traced_stages": tracer.summary()["stages"],
+        "http_cache": cache.stats() if cache is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=2000, help="Results of the synthetic search.")
+    parser.add_argument("--images", type=int, default=200, help="Distinct synthetic thumbnails.")
+    parser.add_argument("--thumbnail-kb", type=int, default=20, help="Size of the synthetic thumbnails.")
+    parser.add_argument("--fixtures", help="Directory of recorded pages, instead of synthetic ones.")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response.")
+    parser.add_argument("--repository", choices=REPOSITORIES, default="excel")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent thumbnail downloads.")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Requests per second allowed per host.")
+    parser.add_argument("--chunk-size", type=int, default=20)
+    parser.add_argument("--enrich", action="store_true", help="Fetch the article pages to fill in descriptions.")
+    parser.add_argument("--enrich-workers", type=int, default=16)
+    parser.add_argument("--cache-dir", help="Directory of an HTTP cache kept across runs.")
+    parser.add_argument("--checkpoint", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--search-phrase", default="central bank")
+    parser.add_argument("--date-option", type=int, default=1)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
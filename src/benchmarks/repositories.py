@@ -0,0 +1,137 @@
+"""
+Benchmarks save time and peak RSS of the repositories for a large result set, against the original
+Excel adapter, which built a pandas DataFrame of every article and wrote it with `to_excel`. Each
+repository runs in its own process, so the peak RSS of one does not hide the others.
+
+Usage (from the src directory):
+    python -m benchmarks.repositories --articles 100000
+"""
+import argparse
+import json
+import multiprocessing
+import resource
+import tempfile
+from dataclasses import asdict
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import Iterator, List
+from uuid import uuid4
+from core.domain.entities import NewsArticle
+
+CHUNK_SIZE = 1000
+REPOSITORIES = ("excel_pandas", "excel", "excel_stream", "parquet", "csv")
+
+
+def synthetic_articles(size: int) -> Iterator[NewsArticle]:
+    """
+    Generates synthetic articles.
+
+    Args:
+        size (int): The number of articles.
+
+    Yields:
+        NewsArticle: The synthetic articles.
+    """
+    today = date.today()
+    for i in range(size):
+        yield NewsArticle(
+            article_id=str(uuid4()),
+            title=f"Markets rally as investors weigh central bank outlook {i}",
+            date=today - timedelta(days=i // 500),
+            url=f"https://www.reuters.com/markets/markets-rally-{i}-{today.isoformat()}/",
+            image_path=f"output/{i}.jpg",
+            selected_section="all",
+            extracted_section="Markets",
+            description="Shares rose $1.5 billion in early trading. " * 3,
+            count_phrases=30,
+            contains_money=True,
+            phrase_matches={"central bank": 1},
+            currencies=["USD"],
+        )
+
+
+class PandasExcelRepository:
+    """
+    The original Excel adapter, kept as the reference of the benchmark: it converts every article
+    with `asdict` into a DataFrame, then writes the whole sheet with `to_excel`.
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+
+    def save(self, scrape_id: str, news_list: List[NewsArticle]):
+        from pandas import DataFrame
+
+        output_path = self.output_dir / Path(f"news_scrape_result_{scrape_id}").with_suffix(".xlsx")
+        DataFrame(list(map(asdict, news_list))).to_excel(output_path, sheet_name=f"results_{scrape_id}", index=False)
+
+
+def build_repository(name: str, output_dir: Path):
+    if name == "excel_pandas":
+        return PandasExcelRepository(output_dir)
+    if name in ("excel", "excel_stream"):
+        from adapters.persistence.excel_repository import ExcelRepository
+
+        return ExcelRepository(output_dir=output_dir)
+    if name == "parquet":
+        from adapters.persistence.parquet_repository import ParquetRepository
+
+        return ParquetRepository(output_dir=output_dir)
+
+    from adapters.persistence.csv_repository import CsvRepository
+
+    return CsvRepository(output_dir=output_dir)
+
+
+def run(name: str, size: int) -> dict:
+    with tempfile.TemporaryDirectory() as output_dir:
+        repository = build_repository(name, Path(output_dir))
+        start = perf_counter()
+        if name in ("excel_pandas", "excel"):
+            repository.save("bench", list(synthetic_articles(size)))
+        else:
+            chunk: List[NewsArticle] = []
+            for article in synthetic_articles(size):
+                chunk.append(article)
+                if len(chunk) == CHUNK_SIZE:
+                    repository.append("bench", chunk)
+                    chunk = []
+            if chunk:
+                repository.append("bench", chunk)
+            repository.close("bench")
+        elapsed = perf_counter() - start
+        output_bytes = sum(path.stat().st_size for path in Path(output_dir).iterdir())
+
+    return {
+        "repository": name,
+        "articles": size,
+        "seconds": round(elapsed, 2),
+        "articles_per_second": round(size / elapsed),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "output_mb": round(output_bytes / 2**20, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--repositories", nargs="+", choices=REPOSITORIES, default=list(REPOSITORIES))
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for name in args.repositories:
+        with context.Pool(processes=1) as pool:
+            results.append(pool.apply(run, (name, args.articles)))
+
+    reference = next((result for result in results if result["repository"] == "excel_pandas"), None)
+    if reference is not None:
+        for result in results:
+            result["seconds_vs_excel_pandas"] = round(result["seconds"] / reference["seconds"], 2)
+            result["peak_rss_vs_excel_pandas"] = round(result["peak_rss_mb"] / reference["peak_rss_mb"], 2)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,52 @@
 import logging
 from datetime import date
-from typing import Tuple
+from typing import List, Optional, Tuple
 from uuid import uuid4
-from core.domain.interfaces import Respository, Scraper
-from core.domain.news_processor import contains_money, count_phrases
+from core.domain.batch import NewsBatch, NewsRecords
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import (
+    Checkpoint,
+    DuplicateIndex,
+    Enricher,
+    Respository,
+    ScrapeInterrupted,
+    Scraper,
+    SeenIndex,
+    StreamingRespository,
+    StreamingScraper,
+)
+from core.domain.news_processor import analyze_batch
+from core.domain.term_matcher import TermMatcher
+from core.domain.tracing import get_tracer
 
 
 class ScrapeNews:
-    def __init__(self, scraper: Scraper, repositoy: Respository):
+    def __init__(
+        self,
+        scraper: Scraper,
+        repositoy: Respository,
+        chunk_size: int = 20,
+        seen_index: Optional[SeenIndex] = None,
+        matcher: Optional[TermMatcher] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        scrape_id: Optional[str] = None,
+        enricher: Optional[Enricher] = None,
+        offset_range: Optional[Tuple[int, int]] = None,
+        duplicate_index: Optional[DuplicateIndex] = None,
+        drop_duplicates: bool = True,
+    ):
         self.scraper = scraper
         self.repository = repositoy
-        self._scrape_id = None
+        self.chunk_size = chunk_size
+        self.seen_index = seen_index
+        self.matcher = matcher
+        self.checkpoint = checkpoint
+        self.enricher = enricher
+        self.offset_range = offset_range
+        self.duplicate_index = duplicate_index
+        self.drop_duplicates = drop_duplicates
+        self.interrupted = False
+        self._scrape_id = scrape_id
 
     @property
     def scrape_id(self) -> str:
@@ -19,7 +55,7 @@ class ScrapeNews:
 
         The scrape ID is a string derived from the first segment of a newly generated UUID.
         If the scrape ID has already been set (i.e., is not `None`), it simply returns the
-        existing ID.
+        existing ID. Passing the ID of an interrupted scrape resumes it from its checkpoint.
 
         Returns:
             str: A unique scrape ID.
@@ -70,6 +106,15 @@ class ScrapeNews:
         processes each article to determine if it contains financial information and
         counts all phrases, then saves the processed articles.
 
+        With a checkpoint, the progress is recorded page by page and kept if the scrape is interrupted,
+        so running again with the same scrape ID resumes from the last completed page. The articles are
+        then only marked as seen once the scrape completes, so an interrupted run does not stop its own
+        resumption early. An interrupted scrape sets `interrupted`.
+
+        With a duplicate index, the near-duplicates of saved articles are flagged while scraping, before their
+        thumbnails are downloaded, then dropped before processing unless `drop_duplicates` is False, and the
+        saved articles are indexed.
+
         Args:
             search_phrase (str): The phrase to search for in news articles.
             date_option (int): An integer representing the date range for the search.
@@ -82,23 +127,190 @@ class ScrapeNews:
 
         logging.info(f"Scrape ID: {self.scrape_id}")
 
-        news_list = self.scraper.scrape_news(
+        with get_tracer().span("scrape"):
+            if isinstance(self.scraper, StreamingScraper) and isinstance(self.repository, StreamingRespository):
+                self.stream_and_save(search_phrase, earliest_date, section)
+            else:
+                self.batch_and_save(search_phrase, earliest_date, section)
+
+    def batch_and_save(self, search_phrase: str, earliest_date: date, section: str = "all"):
+        """
+        Scrapes every article before processing and saving them at once, for scrapers or repositories
+        that do not stream.
+        The articles it reserved in the duplicate index and did not save are released however it ends.
+
+        Args:
+            search_phrase (str): The phrase to search for in news articles.
+            earliest_date (date): The earliest publication date for the articles.
+            section (str, optional): The section of the news to search in. Defaults to "all".
+
+        Returns:
+            None
+        """
+        try:
+            tracer = get_tracer()
+            with tracer.span("scrape_news"):
+                news_list = self.scraper.scrape_news(
+                    scrape_id=self.scrape_id,
+                    search_phrase=search_phrase,
+                    earliest_date=earliest_date,
+                    section=section,
+                    seen_index=self.seen_index,
+                    checkpoint=self.checkpoint,
+                    offset_range=self.offset_range,
+                    duplicate_index=self.duplicate_index,
+                )
+
+            self.interrupted = news_list is None
+            if news_list is None and self.checkpoint is not None:
+                logging.error(f"Scrape interrupted, rerun with scrape ID {self.scrape_id} to resume it.")
+                return
+
+            if news_list and self.drop_duplicates:
+                news_list = self.without_duplicates(news_list)
+            if not news_list:
+                logging.warning("No news scraped.")
+            else:
+                self.process(news_list)
+                with tracer.span("repository.save"):
+                    self.repository.save(scrape_id=self.scrape_id, news_list=news_list)
+                if self.duplicate_index is not None:
+                    with tracer.span("index_duplicates"):
+                        self.duplicate_index.add(self.scrape_id, news_list)
+                if self.seen_index is not None:
+                    with tracer.span("mark_seen"):
+                        self.seen_index.mark_seen(search_phrase, section, news_list)
+            if self.checkpoint is not None:
+                self.checkpoint.clear(self.scrape_id)
+        finally:
+            if self.duplicate_index is not None:
+                self.duplicate_index.release(self.scrape_id)
+
+    def stream_and_save(self, search_phrase: str, earliest_date: date, section: str = "all"):
+        """
+        Moves the articles through processing and persistence in chunks while they are scraped,
+        so memory stays bounded and partial results are on disk if the scrape is interrupted.
+        A resumed scrape yields its checkpointed articles again, so its partial output is discarded first.
+        The articles it reserved in the duplicate index and did not save are released however it ends.
+
+        Args:
+            search_phrase (str): The phrase to search for in news articles.
+            earliest_date (date): The earliest publication date for the articles.
+            section (str, optional): The section of the news to search in. Defaults to "all".
+
+        Returns:
+            None
+        """
+        if self.checkpoint is not None:
+            self.repository.discard(scrape_id=self.scrape_id)
+
+        news_iter = self.scraper.iter_news(
             scrape_id=self.scrape_id,
             search_phrase=search_phrase,
             earliest_date=earliest_date,
             section=section,
+            seen_index=self.seen_index,
+            checkpoint=self.checkpoint,
+            offset_range=self.offset_range,
+            duplicate_index=self.duplicate_index,
         )
 
-        if not news_list:
+        chunk: List[NewsArticle] = []
+        saved = 0
+        completed = False
+        try:
+            try:
+                for article in news_iter:
+                    chunk.append(article)
+                    if len(chunk) == self.chunk_size:
+                        saved += self._save_chunk(chunk, search_phrase, section)
+                        chunk = []
+                completed = True
+            except ScrapeInterrupted as error:
+                self.interrupted = True
+                logging.error(f"Scrape interrupted: {error}")
+                if self.checkpoint is not None:
+                    logging.error(f"Rerun with scrape ID {self.scrape_id} to resume it.")
+            # the last chunk is only saved once the scrape ends or is interrupted, a failed save is not retried
+            saved += self._save_chunk(chunk, search_phrase, section)
+        finally:
+            if saved:
+                logging.info(f"Saved {saved} articles.")
+                with get_tracer().span("repository.close"):
+                    self.repository.close(scrape_id=self.scrape_id)
+            if self.duplicate_index is not None:
+                self.duplicate_index.release(self.scrape_id)
+
+        if not saved:
             logging.warning("No news scraped.")
-            return
 
-        for article in news_list:
-            article.contains_money = contains_money(
-                title=article.title, description=article.description
-            )
-            article.count_phrases = count_phrases(
-                title=article.title, description=article.description
-            )
+        if completed and self.checkpoint is not None:
+            progress = self.checkpoint.load(self.scrape_id)
+            if progress is not None and self.seen_index is not None:
+                with get_tracer().span("mark_seen"):
+                    self.seen_index.mark_seen(search_phrase, section, progress.articles)
+            self.checkpoint.clear(self.scrape_id)
 
-        self.repository.save(scrape_id=self.scrape_id, news_list=news_list)
+    def _save_chunk(self, chunk: List[NewsArticle], search_phrase: str, section: str) -> int:
+        if chunk and self.drop_duplicates:
+            chunk = self.without_duplicates(chunk)
+        if not chunk:
+            return 0
+        tracer = get_tracer()
+        self.process(chunk)
+        with tracer.span("repository.append"):
+            self.repository.append(scrape_id=self.scrape_id, news_list=chunk)
+        if self.duplicate_index is not None:
+            with tracer.span("index_duplicates"):
+                self.duplicate_index.add(self.scrape_id, chunk)
+        if self.seen_index is not None and self.checkpoint is None:
+            with tracer.span("mark_seen"):
+                self.seen_index.mark_seen(search_phrase, section, chunk)
+        return len(chunk)
+
+    def without_duplicates(self, news_list: List[NewsArticle]) -> List[NewsArticle]:
+        """
+        Drops the articles flagged as near-duplicates by the scraper.
+
+        Args:
+            news_list (List[NewsArticle]): The scraped articles.
+
+        Returns:
+            List[NewsArticle]: The articles that are not duplicates, in the same order.
+        """
+        articles = [article for article in news_list if not article.duplicate_of]
+        if len(articles) < len(news_list):
+            logging.info(f"Dropped {len(news_list) - len(articles)} near-duplicate articles.")
+        return articles
+
+    def process(self, news_list: NewsRecords):
+        """
+        Checks each article for financial information and counts its phrases. With a matcher,
+        it also counts the tracked phrases and detects the currencies of each article. With an
+        enricher, the descriptions are fetched first, so the checks cover more than the headline.
+        A NewsBatch is processed column by column.
+
+        Args:
+            news_list (NewsRecords): The news articles to process in place, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        if self.enricher is not None:
+            self.enricher.enrich(news_list)
+
+        tracer = get_tracer()
+        tracer.count("articles", len(news_list))
+        with tracer.span("process"):
+            if isinstance(news_list, NewsBatch):
+                news_list.set_analysis(*analyze_batch(news_list.titles, news_list.descriptions))
+            else:
+                money_flags, phrase_counts = analyze_batch(
+                    [article.title for article in news_list],
+                    [article.description for article in news_list],
+                )
+                for article, money_flag, phrase_count in zip(news_list, money_flags, phrase_counts):
+                    article.contains_money = money_flag
+                    article.count_phrases = phrase_count
+            if self.matcher is not None:
+                self.matcher.match_batch(news_list)
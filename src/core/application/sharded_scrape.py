@@ -0,0 +1,63 @@
+import logging
+from typing import Iterable, List, Optional
+from core.domain.entities import NewsArticle, ScrapeShard
+
+
+def plan_shards(scrape_id: str, total_results: Optional[int], shard_size: int) -> List[ScrapeShard]:
+    """
+    Splits the results of a search into contiguous offset ranges, each scraped by its own consumer
+    under the shard ID and merged back under the scrape ID.
+
+    Shards past the earliest date of the search stop on their first page, so planning on the total
+    number of results only costs one page load per extra shard.
+
+    Args:
+        scrape_id (str): The scrape ID of the merged result.
+        total_results (Optional[int]): The number of results of the search, or None if it is unknown.
+        shard_size (int): The number of results per shard, a multiple of the page size.
+
+    Returns:
+        List[ScrapeShard]: The shards, in offset order, each with the number of shards of the scrape, so the
+            reducer knows when they have all arrived. An unknown total gives a single open-ended shard.
+
+    Raises:
+        ValueError: If the shard size is not positive.
+    """
+    if shard_size <= 0:
+        raise ValueError("The shard size must be positive.")
+    if total_results is None:
+        return [ScrapeShard(scrape_id, f"{scrape_id}-000", 0, None)]
+
+    starts = range(0, max(total_results, 1), shard_size)
+    shards = [
+        ScrapeShard(scrape_id, f"{scrape_id}-{index:03d}", start, min(start + shard_size, total_results), len(starts))
+        for index, start in enumerate(starts)
+    ]
+    logging.info(f"Planned {total_results} results of scrape {scrape_id} into {len(shards)} shards.")
+    return shards
+
+
+def merge_shards(shards: Iterable[Iterable[NewsArticle]]) -> List[NewsArticle]:
+    """
+    Merges the articles of the shards of a scrape, given in offset order, keeping the first article
+    of each URL. Articles published during the scrape shift the results, so neighbouring shards
+    can overlap.
+
+    Args:
+        shards (Iterable[Iterable[NewsArticle]]): The articles of each shard, newest first.
+
+    Returns:
+        List[NewsArticle]: The merged articles, newest first.
+    """
+    merged = []
+    seen_urls = set()
+    duplicates = 0
+    for articles in shards:
+        for article in articles:
+            if article.url in seen_urls:
+                duplicates += 1
+                continue
+            seen_urls.add(article.url)
+            merged.append(article)
+    logging.info(f"Merged {len(merged)} articles, dropping {duplicates} duplicates.")
+    return merged
@@ -0,0 +1,334 @@
+from array import array
+from datetime import date
+from sys import intern
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from uuid import UUID
+from core.domain.entities import NewsArticle
+
+UUID_BYTES = 16
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class NewsBatch:
+    """
+    A column-oriented container of articles for scrapes and reprocessing jobs with hundreds of
+    thousands of rows. Instead of one object per article, each field is a column: UUID ids are
+    packed as 16 bytes, dates as day ordinals, counts and money flags in typed arrays, sections
+    as codes into a shared list of interned names, and empty phrase matches and currencies as None.
+
+    The processors and the repositories accept a batch in place of a list of articles, and
+    `NewsBatch.article` materializes a single NewsArticle when one is needed.
+
+    Attributes:
+        titles (List[str]): The titles of the articles.
+        urls (List[str]): The URLs of the articles.
+        image_paths (List[str]): The image paths of the articles.
+        descriptions (List[str]): The descriptions of the articles.
+        dates (array): The publication dates, as `date.toordinal` values.
+        count_phrases (array): The word counts of the articles.
+        contains_money (array): The money flags of the articles, as 0 or 1.
+        sections (List[str]): The distinct section names, indexed by the section codes.
+        selected_sections (array): The codes of the sections selected for the search.
+        extracted_sections (array): The codes of the sections extracted from the articles.
+        phrase_matches (List[Optional[Dict[str, int]]]): The tracked phrase counts, None when empty.
+        currencies (List[Optional[List[str]]]): The detected currencies, None when empty.
+        image_widths (array): The widths of the thumbnails, 0 when unknown.
+        image_heights (array): The heights of the thumbnails, 0 when unknown.
+        image_sizes (array): The sizes of the thumbnails, in bytes, 0 when unknown.
+        duplicate_urls (List[str]): The URLs of the articles the near-duplicates are copies of, "" otherwise.
+
+    Methods:
+        from_articles: Builds a batch from articles.
+        append: Appends the fields of an article.
+        append_article: Appends an article.
+        article: Materializes the article at an index.
+        article_ids: Returns the ids of the articles as strings.
+        column: Returns the values of a NewsArticle field.
+        epoch_days: Returns the dates as days since 1970-01-01.
+        set_analysis: Stores the money flags and word counts of the articles.
+        set_matches: Stores the tracked phrase counts and currencies of the articles.
+    """
+
+    def __init__(self) -> None:
+        self._ids = bytearray()
+        self._id_strings: Optional[List[str]] = None
+        self.titles: List[str] = []
+        self.urls: List[str] = []
+        self.image_paths: List[str] = []
+        self.descriptions: List[str] = []
+        self.dates = array("i")
+        self.count_phrases = array("i")
+        self.contains_money = array("b")
+        self.sections: List[str] = []
+        self._section_codes: Dict[str, int] = {}
+        self.selected_sections = array("H")
+        self.extracted_sections = array("H")
+        self.phrase_matches: List[Optional[Dict[str, int]]] = []
+        self.currencies: List[Optional[List[str]]] = []
+        self.image_widths = array("i")
+        self.image_heights = array("i")
+        self.image_sizes = array("i")
+        self.duplicate_urls: List[str] = []
+
+    @classmethod
+    def from_articles(cls, news_list: Iterable[NewsArticle]) -> "NewsBatch":
+        """
+        Builds a batch from articles.
+
+        Args:
+            news_list (Iterable[NewsArticle]): The articles.
+
+        Returns:
+            NewsBatch: The batch of the articles, in the same order.
+        """
+        batch = cls()
+        for article in news_list:
+            batch.append_article(article)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __iter__(self) -> Iterator[NewsArticle]:
+        for index in range(len(self)):
+            yield self.article(index)
+
+    def append(
+        self,
+        article_id: str,
+        title: str,
+        date: date,
+        url: str,
+        image_path: str,
+        selected_section: str,
+        extracted_section: Optional[str] = "",
+        description: Optional[str] = "",
+        count_phrases: Optional[int] = 0,
+        contains_money: Optional[bool] = False,
+        phrase_matches: Optional[Dict[str, int]] = None,
+        currencies: Optional[List[str]] = None,
+        image_width: Optional[int] = 0,
+        image_height: Optional[int] = 0,
+        image_bytes: Optional[int] = 0,
+        duplicate_of: Optional[str] = "",
+    ):
+        """
+        Appends the fields of an article, in the order of the NewsArticle fields. Ids that are not
+        canonical UUID strings switch the batch to plain string ids.
+
+        Args:
+            article_id (str): The id of the article.
+            title (str): The title of the article.
+            date (date): The publication date of the article.
+            url (str): The URL of the article.
+            image_path (str): The image path of the article.
+            selected_section (str): The section selected for the search.
+            extracted_section (Optional[str], optional): The section of the article. Defaults to "".
+            description (Optional[str], optional): The description of the article. Defaults to "".
+            count_phrases (Optional[int], optional): The word count of the article. Defaults to 0.
+            contains_money (Optional[bool], optional): The money flag of the article. Defaults to False.
+            phrase_matches (Optional[Dict[str, int]], optional): The tracked phrase counts. Defaults to None.
+            currencies (Optional[List[str]], optional): The detected currencies. Defaults to None.
+            image_width (Optional[int], optional): The width of the thumbnail. Defaults to 0.
+            image_height (Optional[int], optional): The height of the thumbnail. Defaults to 0.
+            image_bytes (Optional[int], optional): The size of the thumbnail, in bytes. Defaults to 0.
+            duplicate_of (Optional[str], optional): The URL of the article it is a copy of. Defaults to "".
+
+        Returns:
+            None
+        """
+        self._append_id(article_id)
+        self.titles.append(title)
+        self.urls.append(url)
+        self.image_paths.append(image_path)
+        self.descriptions.append(description or "")
+        self.dates.append(date.toordinal())
+        self.count_phrases.append(count_phrases or 0)
+        self.contains_money.append(1 if contains_money else 0)
+        self.selected_sections.append(self._section_code(selected_section))
+        self.extracted_sections.append(self._section_code(extracted_section))
+        self.phrase_matches.append(phrase_matches or None)
+        self.currencies.append(currencies or None)
+        self.image_widths.append(image_width or 0)
+        self.image_heights.append(image_height or 0)
+        self.image_sizes.append(image_bytes or 0)
+        self.duplicate_urls.append(duplicate_of or "")
+
+    def append_article(self, article: NewsArticle):
+        """
+        Appends an article.
+
+        Args:
+            article (NewsArticle): The article.
+
+        Returns:
+            None
+        """
+        self.append(
+            article.article_id,
+            article.title,
+            article.date,
+            article.url,
+            article.image_path,
+            article.selected_section,
+            article.extracted_section,
+            article.description,
+            article.count_phrases,
+            article.contains_money,
+            article.phrase_matches,
+            article.currencies,
+            article.image_width,
+            article.image_height,
+            article.image_bytes,
+            article.duplicate_of,
+        )
+
+    def article(self, index: int) -> NewsArticle:
+        """
+        Materializes the article at an index.
+
+        Args:
+            index (int): The index of the article.
+
+        Returns:
+            NewsArticle: A new article with the fields of the row.
+        """
+        return NewsArticle(
+            article_id=self._article_id(index),
+            title=self.titles[index],
+            date=date.fromordinal(self.dates[index]),
+            url=self.urls[index],
+            image_path=self.image_paths[index],
+            selected_section=self.sections[self.selected_sections[index]],
+            extracted_section=self.sections[self.extracted_sections[index]],
+            description=self.descriptions[index],
+            count_phrases=self.count_phrases[index],
+            contains_money=bool(self.contains_money[index]),
+            phrase_matches=dict(self.phrase_matches[index] or {}),
+            currencies=list(self.currencies[index] or []),
+            image_width=self.image_widths[index],
+            image_height=self.image_heights[index],
+            image_bytes=self.image_sizes[index],
+            duplicate_of=self.duplicate_urls[index],
+        )
+
+    def article_ids(self) -> List[str]:
+        """
+        Returns the ids of the articles as strings.
+
+        Returns:
+            List[str]: The ids, aligned with the other columns.
+        """
+        if self._id_strings is not None:
+            return list(self._id_strings)
+        ids = self._ids
+        return [str(UUID(bytes=bytes(ids[start : start + UUID_BYTES]))) for start in range(0, len(ids), UUID_BYTES)]
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        Returns the values of a NewsArticle field for every article. Text columns are returned as they
+        are stored; ids, dates, sections and flags are decoded.
+
+        Args:
+            name (str): The name of the NewsArticle field.
+
+        Returns:
+            Sequence[Any]: The values, aligned with the other columns.
+
+        Raises:
+            KeyError: If the name is not a NewsArticle field.
+        """
+        if name == "article_id":
+            return self.article_ids()
+        if name == "date":
+            return [date.fromordinal(ordinal) for ordinal in self.dates]
+        if name in ("selected_section", "extracted_section"):
+            sections = self.sections
+            return [sections[code] for code in getattr(self, f"{name}s")]
+        if name == "contains_money":
+            return [bool(flag) for flag in self.contains_money]
+        if name == "phrase_matches":
+            return [matches or {} for matches in self.phrase_matches]
+        if name == "currencies":
+            return [currencies or [] for currencies in self.currencies]
+        columns = {
+            "title": self.titles,
+            "url": self.urls,
+            "image_path": self.image_paths,
+            "description": self.descriptions,
+            "count_phrases": self.count_phrases,
+            "image_width": self.image_widths,
+            "image_height": self.image_heights,
+            "image_bytes": self.image_sizes,
+            "duplicate_of": self.duplicate_urls,
+        }
+        return columns[name]
+
+    def epoch_days(self) -> array:
+        """
+        Returns the dates as days since 1970-01-01, the layout of Arrow and Parquet dates.
+
+        Returns:
+            array: The days, aligned with the other columns.
+        """
+        return array("i", (ordinal - EPOCH_ORDINAL for ordinal in self.dates))
+
+    def set_analysis(self, money_flags: Sequence[bool], phrase_counts: Sequence[int]):
+        """
+        Stores the money flags and word counts of the articles, e.g. from `analyze_batch`.
+
+        Args:
+            money_flags (Sequence[bool]): The money flags, aligned with the articles.
+            phrase_counts (Sequence[int]): The word counts, aligned with the articles.
+
+        Returns:
+            None
+        """
+        self.contains_money = array("b", map(bool, money_flags))
+        self.count_phrases = array("i", phrase_counts)
+
+    def set_matches(self, scans: Iterable[tuple]):
+        """
+        Stores the tracked phrase counts and currencies of the articles, e.g. from `TermMatcher.scan`.
+
+        Args:
+            scans (Iterable[tuple]): The phrase counts and currencies of each article.
+
+        Returns:
+            None
+        """
+        self.phrase_matches = []
+        self.currencies = []
+        for matches, currencies in scans:
+            self.phrase_matches.append(matches or None)
+            self.currencies.append(currencies or None)
+
+    def _append_id(self, article_id: str):
+        if self._id_strings is None:
+            try:
+                uuid = UUID(article_id)
+            except ValueError:
+                uuid = None
+            if uuid is not None and str(uuid) == article_id:
+                self._ids += uuid.bytes
+                return
+            self._id_strings = self.article_ids()
+            self._ids = bytearray()
+        self._id_strings.append(article_id)
+
+    def _article_id(self, index: int) -> str:
+        if self._id_strings is not None:
+            return self._id_strings[index]
+        start = index * UUID_BYTES
+        return str(UUID(bytes=bytes(self._ids[start : start + UUID_BYTES])))
+
+    def _section_code(self, section: Optional[str]) -> int:
+        section = section or ""
+        code = self._section_codes.get(section)
+        if code is None:
+            code = self._section_codes[section] = len(self.sections)
+            self.sections.append(intern(section))
+        return code
+
+
+NewsRecords = Union[List[NewsArticle], NewsBatch]
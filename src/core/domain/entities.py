@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional
+from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     article_id: str
     title: str
@@ -15,3 +15,24 @@ class NewsArticle:
     description: Optional[str] = field(default_factory=str)
     count_phrases: Optional[int] = field(default_factory=int)
     contains_money: Optional[bool] = field(default_factory=bool)
+    phrase_matches: Dict[str, int] = field(default_factory=dict)
+    currencies: List[str] = field(default_factory=list)
+    image_width: Optional[int] = field(default_factory=int)
+    image_height: Optional[int] = field(default_factory=int)
+    image_bytes: Optional[int] = field(default_factory=int)
+    duplicate_of: Optional[str] = field(default_factory=str)
+
+
+@dataclass
+class ScrapeProgress:
+    next_offset: int
+    articles: List[NewsArticle] = field(default_factory=list)
+
+
+@dataclass
+class ScrapeShard:
+    scrape_id: str
+    shard_id: str
+    start_offset: int
+    end_offset: Optional[int] = None
+    shard_count: int = 1
@@ -1,7 +1,243 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Literal, Optional
-from core.domain.entities import NewsArticle
+from typing import Iterator, List, Literal, Optional, Tuple
+from core.domain.batch import NewsRecords
+from core.domain.entities import NewsArticle, ScrapeProgress
+
+
+class ScrapeInterrupted(Exception):
+    """
+    Raised by a streaming scraper when the scrape stops before reaching the earliest date,
+    e.g. on a page load timeout. Articles yielded before the interruption remain valid.
+    """
+
+
+class SeenIndex(ABC):
+    """
+    Abstract base class for an index of already-scraped article URLs, keyed by query and section.
+
+    Methods:
+        is_seen(search_phrase: str, section: str, url: str) -> bool:
+            Abstract method to check if an article was already scraped for the query and section.
+        image_path(url: str) -> Optional[str]:
+            Abstract method to get the thumbnail saved for an article in any previous scrape.
+        mark_seen(search_phrase: str, section: str, news_list: List[NewsArticle]) -> None:
+            Abstract method to record scraped articles.
+        close() -> None:
+            Releases the resources kept open across scrapes.
+    """
+
+    @abstractmethod
+    def is_seen(self, search_phrase: str, section: str, url: str) -> bool:
+        """
+        Checks if an article was already scraped for the query and section.
+
+        Args:
+            search_phrase (str): The phrase of the search.
+            section (str): The section of the search.
+            url (str): The article URL.
+
+        Returns:
+            bool: True if the article is in the index, False otherwise.
+        """
+        raise NotImplementedError("Is Seen Not Implemented Yet.")
+
+    @abstractmethod
+    def image_path(self, url: str) -> Optional[str]:
+        """
+        Gets the thumbnail saved for an article in any previous scrape.
+
+        Args:
+            url (str): The article URL.
+
+        Returns:
+            Optional[str]: The saved thumbnail path, or None if the article has no known thumbnail.
+        """
+        raise NotImplementedError("Image Path Not Implemented Yet.")
+
+    @abstractmethod
+    def mark_seen(self, search_phrase: str, section: str, news_list: List[NewsArticle]):
+        """
+        Records scraped articles for the query and section.
+
+        Args:
+            search_phrase (str): The phrase of the search.
+            section (str): The section of the search.
+            news_list (List[NewsArticle]): The scraped articles.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError("Mark Seen Not Implemented Yet.")
+
+    def close(self):
+        """
+        Releases the resources kept open across scrapes, like a database connection.
+
+        Returns:
+            None
+        """
+
+
+class DuplicateIndex(ABC):
+    """
+    Abstract base class for an index of the articles saved across sections and runs, used to find the
+    near-duplicates of new articles, like the same story listed in another section or republished
+    with a slightly different headline.
+
+    Methods:
+        find_duplicate(scrape_id: str, article: NewsArticle) -> Optional[str]:
+            Abstract method to find the article a new article is a near-duplicate of.
+        add(scrape_id: str, news_list: NewsRecords) -> None:
+            Abstract method to index saved articles.
+        release(scrape_id: str) -> None:
+            Abstract method to drop the articles a scrape reserved without saving them.
+        close() -> None:
+            Releases the resources kept open across scrapes.
+    """
+
+    @abstractmethod
+    def find_duplicate(self, scrape_id: str, article: NewsArticle) -> Optional[str]:
+        """
+        Finds the article a new article is a near-duplicate of, among the indexed articles and the articles
+        already found by the same scrape. An article that is not a duplicate is reserved for the scrape, so
+        its later copies are found before it is saved. An article indexed by the same scrape, e.g. on a
+        resumed page, is not a duplicate of itself.
+
+        Args:
+            scrape_id (str): The ID of the scrape finding the article.
+            article (NewsArticle): The article, with its title and any description.
+
+        Returns:
+            Optional[str]: The URL of the first copy of the article, or None if it is not a duplicate.
+        """
+        raise NotImplementedError("Find Duplicate Not Implemented Yet.")
+
+    @abstractmethod
+    def add(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Indexes saved articles, skipping the articles flagged as duplicates.
+
+        Args:
+            scrape_id (str): The ID of the scrape that saved the articles.
+            news_list (NewsRecords): The saved articles, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError("Add Not Implemented Yet.")
+
+    @abstractmethod
+    def release(self, scrape_id: str):
+        """
+        Drops the articles a scrape reserved and did not save, once it ends, is interrupted or fails, so they
+        are not taken for the first copies of the articles of later scrapes.
+
+        Args:
+            scrape_id (str): The ID of the scrape.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError("Release Not Implemented Yet.")
+
+    def close(self):
+        """
+        Releases the resources kept open across scrapes, like a database connection.
+
+        Returns:
+            None
+        """
+
+
+class Checkpoint(ABC):
+    """
+    Abstract base class for the progress of scrapes, stored page by page so an interrupted
+    scrape can resume from its last completed page.
+
+    Methods:
+        load(scrape_id: str) -> Optional[ScrapeProgress]:
+            Abstract method to get the progress saved for a scrape.
+        save_page(scrape_id: str, next_offset: int, news_list: List[NewsArticle]) -> None:
+            Abstract method to record a completed page.
+        clear(scrape_id: str) -> None:
+            Abstract method to remove the progress of a finished scrape.
+    """
+
+    @abstractmethod
+    def load(self, scrape_id: str) -> Optional[ScrapeProgress]:
+        """
+        Gets the progress saved for a scrape.
+
+        Args:
+            scrape_id (str): The unique identifier for the scrape operation.
+
+        Returns:
+            Optional[ScrapeProgress]: The offset of the next page and the articles of the completed pages,
+                or None if the scrape has no checkpoint.
+        """
+        raise NotImplementedError("Load Not Implemented Yet.")
+
+    @abstractmethod
+    def save_page(self, scrape_id: str, next_offset: int, news_list: List[NewsArticle]):
+        """
+        Records a completed page, whose articles and thumbnails must be on disk when the call returns.
+
+        Args:
+            scrape_id (str): The unique identifier for the scrape operation.
+            next_offset (int): The offset of the page the scrape continues from.
+            news_list (List[NewsArticle]): The articles of the completed page.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError("Save Page Not Implemented Yet.")
+
+    @abstractmethod
+    def clear(self, scrape_id: str):
+        """
+        Removes the progress of a finished scrape.
+
+        Args:
+            scrape_id (str): The unique identifier for the scrape operation.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError("Clear Not Implemented Yet.")
+
+
+class Enricher(ABC):
+    """
+    Abstract base class for a stage that completes scraped articles with details from their own pages.
+
+    Methods:
+        enrich(news_list: NewsRecords) -> int:
+            Abstract method to fill in the details of a list of articles.
+        close() -> None:
+            Releases the resources kept open across scrapes.
+    """
+
+    @abstractmethod
+    def enrich(self, news_list: NewsRecords) -> int:
+        """
+        Fills in the details of the articles in place, skipping the articles that already have them.
+
+        Args:
+            news_list (NewsRecords): The articles to enrich, as a list or a NewsBatch.
+
+        Returns:
+            int: The number of articles enriched.
+        """
+        raise NotImplementedError("Enrich Not Implemented Yet.")
+
+    def close(self):
+        """
+        Releases the resources kept open across scrapes, like a connection pool.
+
+        Returns:
+            None
+        """
 
 
 class Scraper(ABC):
@@ -12,8 +248,13 @@ class Scraper(ABC):
         scrape_news(scrape_id: str,
                     search_phrase: str,
                     earliest_date: date,
-                    section: Literal) -> Optional[List[NewsArticle]]:
+                    section: Literal,
+                    ...) -> Optional[List[NewsArticle]]:
             Abstract method to scrape news articles based on the provided search criteria.
+        count_results(search_phrase: str, section: str) -> Optional[int]:
+            Returns the total number of results of a search.
+        close() -> None:
+            Releases the resources kept open across scrapes, like a browser session.
     """
 
     @abstractmethod
@@ -35,6 +276,10 @@ class Scraper(ABC):
             "sports",
             "lifestyle",
         ],
+        seen_index: Optional[SeenIndex] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        offset_range: Optional[Tuple[int, int]] = None,
+        duplicate_index: Optional[DuplicateIndex] = None,
     ) -> Optional[List[NewsArticle]]:
         """
         Scrapes news articles based on the provided search criteria.
@@ -44,6 +289,15 @@ class Scraper(ABC):
             search_phrase (str): The phrase to search for in news articles.
             earliest_date (date): The earliest publication date for the articles.
             section (Literal): The news section to filter by, with specific allowable values.
+            seen_index (Optional[SeenIndex], optional): If given, the scrape stops at the first article
+                already in the index, and known thumbnails are not downloaded again. Defaults to None.
+            checkpoint (Optional[Checkpoint], optional): If given, every completed page is recorded under the
+                scrape ID, and a scrape with saved progress yields the saved articles and resumes from the
+                next page. Defaults to None.
+            offset_range (Optional[Tuple[int, int]], optional): The start and end result offsets to scrape, end
+                excluded, e.g. for one shard of a distributed scrape. Defaults to every result.
+            duplicate_index (Optional[DuplicateIndex], optional): If given, the near-duplicates of indexed articles
+                are flagged with `duplicate_of` and their thumbnails are not downloaded. Defaults to None.
 
         Returns:
             Optional[List[NewsArticle]]: A list of NewsArticle objects if articles are found, otherwise None.
@@ -53,26 +307,200 @@ class Scraper(ABC):
         """
         raise NotImplementedError("Scrape News Not Implemented Yet.")
 
+    def count_results(self, search_phrase: str, section: str = "all") -> Optional[int]:
+        """
+        Returns the total number of results of a search, used to plan it into shards.
+
+        Args:
+            search_phrase (str): The phrase to search for in news articles.
+            section (str, optional): The news section to filter by. Defaults to "all".
+
+        Returns:
+            Optional[int]: The number of results, or None if the site does not show it.
+
+        Raises:
+            NotImplementedError: If the scraper cannot count the results.
+        """
+        raise NotImplementedError("Count Results Not Implemented Yet.")
+
+    def close(self):
+        """
+        Releases the resources kept open across scrapes, like a browser session.
+        Scrapers without such resources do not need to override it.
+
+        Returns:
+            None
+        """
+
+
+class StreamingScraper(Scraper):
+    """
+    Abstract base class for a scraper that yields news articles as they are scraped.
+
+    Methods:
+        iter_news(...) -> Iterator[NewsArticle]:
+            Abstract method to lazily scrape news articles, with the arguments of `Scraper.scrape_news`.
+        scrape_news(...) -> Optional[List[NewsArticle]]:
+            Collects every article yielded by `iter_news`.
+    """
+
+    @abstractmethod
+    def iter_news(
+        self,
+        scrape_id: str,
+        search_phrase: str,
+        earliest_date: date,
+        section: str = "all",
+        seen_index: Optional[SeenIndex] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        offset_range: Optional[Tuple[int, int]] = None,
+        duplicate_index: Optional[DuplicateIndex] = None,
+    ) -> Iterator[NewsArticle]:
+        """
+        Lazily scrapes news articles based on the provided search criteria, taking the same arguments
+        as `Scraper.scrape_news`.
+
+        Yields:
+            NewsArticle: The scraped articles, newest first.
+
+        Raises:
+            ScrapeInterrupted: If the scrape stops before reaching the earliest date.
+        """
+        raise NotImplementedError("Iter News Not Implemented Yet.")
+
+    def scrape_news(
+        self,
+        scrape_id: str,
+        search_phrase: str,
+        earliest_date: date,
+        section: str = "all",
+        seen_index: Optional[SeenIndex] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        offset_range: Optional[Tuple[int, int]] = None,
+        duplicate_index: Optional[DuplicateIndex] = None,
+    ) -> Optional[List[NewsArticle]]:
+        """
+        Collects every article yielded by `iter_news`.
+
+        Returns:
+            Optional[List[NewsArticle]]: A list of NewsArticle objects, or None if the scrape was interrupted.
+        """
+        try:
+            return list(
+                self.iter_news(
+                    scrape_id,
+                    search_phrase,
+                    earliest_date,
+                    section,
+                    seen_index,
+                    checkpoint,
+                    offset_range,
+                    duplicate_index,
+                )
+            )
+        except ScrapeInterrupted:
+            return None
+
 
 class Respository(ABC):
     """
     Abstract base class for defining a repository to save news articles.
 
     Methods:
-        save(scrape_id: str, news_list: List[NewsArticle]) -> None:
-            Abstract method to save a list of news articles.
+        save(scrape_id: str, news_list: NewsRecords) -> None:
+            Abstract method to save a list or a NewsBatch of news articles.
+        close_connection() -> None:
+            Releases the resources kept open across scrapes.
     """
 
     @abstractmethod
-    def save(self, scrape_id: str, news_list: List[NewsArticle]):
+    def save(self, scrape_id: str, news_list: NewsRecords):
         """
         Saves the list of news articles.
 
         Args:
             scrape_id (str): The unique identifier for the scrape operation.
-            news_list (List[NewsArticle]): A list of news articles to save.
+            news_list (NewsRecords): A list or a NewsBatch of news articles to save.
 
         Returns:
             None
         """
         raise NotImplementedError("Save Not Implemented Yet.")
+
+    def close_connection(self):
+        """
+        Releases the resources kept open across scrapes, like a database connection.
+        Repositories without such resources do not need to override it.
+
+        Returns:
+            None
+        """
+
+
+class StreamingRespository(Respository):
+    """
+    Abstract base class for a repository that appends news articles incrementally.
+
+    Methods:
+        append(scrape_id: str, news_list: NewsRecords) -> None:
+            Abstract method to append a chunk of news articles.
+        close(scrape_id: str) -> None:
+            Abstract method to finish the output of a scrape.
+        discard(scrape_id: str) -> None:
+            Removes the partial output of a scrape before it is resumed.
+        save(scrape_id: str, news_list: NewsRecords) -> None:
+            Appends the whole list and closes the output.
+    """
+
+    @abstractmethod
+    def append(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Appends a chunk of news articles, which must be on disk when the call returns.
+
+        Args:
+            scrape_id (str): The unique identifier for the scrape operation.
+            news_list (NewsRecords): The chunk of news articles to append, as a list or a NewsBatch.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError("Append Not Implemented Yet.")
+
+    @abstractmethod
+    def close(self, scrape_id: str):
+        """
+        Finishes the output of a scrape after its last chunk.
+
+        Args:
+            scrape_id (str): The unique identifier for the scrape operation.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError("Close Not Implemented Yet.")
+
+    def discard(self, scrape_id: str):
+        """
+        Removes the partial output of a scrape before it is resumed from a checkpoint, which yields
+        its saved articles again. Repositories that overwrite or upsert do not need to override it.
+
+        Args:
+            scrape_id (str): The unique identifier for the scrape operation.
+
+        Returns:
+            None
+        """
+
+    def save(self, scrape_id: str, news_list: NewsRecords):
+        """
+        Saves the list of news articles by appending it as a single chunk.
+
+        Args:
+            scrape_id (str): The unique identifier for the scrape operation.
+            news_list (NewsRecords): A list or a NewsBatch of news articles to save.
+
+        Returns:
+            None
+        """
+        self.append(scrape_id, news_list)
+        self.close(scrape_id)
@@ -1,4 +1,28 @@
 import re
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+MONEY_PATTERN = re.compile(
+    r"""
+    (                   # Start of a capturing group
+        \$\s?           # Dollar sign ($), followed by an optional space
+        \d{1,3}         # 1 to 3 digits
+        (?:             # Start of a non-capturing group for thousand/decimal handling
+            [.,]\d{3}   # A dot or comma followed by 3 digits (thousand separator)
+        )*              # This group can occur zero or more times
+        (?:             # Start of a non-capturing group for decimals
+            [.,]\d{1,2} # A dot or comma followed by 1 to 2 digits (decimal)
+        )?              # This group is optional (may or may not exist)
+    )
+    |                   # Or
+    (\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{1,2})?) # Number format without a dollar sign
+    \s?                 # Optional space
+    (dólares|USD)       # Currency specified as 'dollars' or 'USD'
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
 
 
 def count_phrases(title: str, **kwargs: str) -> int:
@@ -48,26 +72,58 @@ def contains_money(title: str, **kwargs: str) -> bool:
     """
     description = kwargs.get("description", None)
 
-    money_pattern = re.compile(
-        r"""
-        (                   # Start of a capturing group
-            \$\s?           # Dollar sign ($), followed by an optional space
-            \d{1,3}         # 1 to 3 digits
-            (?:             # Start of a non-capturing group for thousand/decimal handling
-                [.,]\d{3}   # A dot or comma followed by 3 digits (thousand separator)
-            )*              # This group can occur zero or more times
-            (?:             # Start of a non-capturing group for decimals
-                [.,]\d{1,2} # A dot or comma followed by 1 to 2 digits (decimal)
-            )?              # This group is optional (may or may not exist)
-        )
-        |                   # Or
-        (\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{1,2})?) # Number format without a dollar sign
-        \s?                 # Optional space
-        (dólares|USD)       # Currency specified as 'dollars' or 'USD'
-        """,
-        re.VERBOSE | re.IGNORECASE,
-    )
-
     if description:
         title = " ".join([title, description]).strip()
-    return bool(money_pattern.search(title))
+    return bool(MONEY_PATTERN.search(title))
+
+
+def analyze_batch(
+    titles: Sequence[str], descriptions: Optional[Sequence[Optional[str]]] = None
+) -> Tuple[List[bool], List[int]]:
+    """
+    Computes `contains_money` and `count_phrases` for a whole batch of articles in one pass,
+    reusing the precompiled money pattern.
+
+    Args:
+        titles (Sequence[str]): The titles of the articles.
+        descriptions (Optional[Sequence[Optional[str]]], optional): The descriptions of the articles,
+            aligned with the titles. Defaults to None.
+
+    Returns:
+        Tuple[List[bool], List[int]]: The money flags and the word counts, aligned with the titles.
+    """
+    if descriptions is None:
+        descriptions = [None] * len(titles)
+
+    search = MONEY_PATTERN.search
+    money_flags = []
+    phrase_counts = []
+    for title, description in zip(titles, descriptions):
+        text = f"{title} {description}" if description else title
+        money_flags.append(search(text) is not None)
+        phrase_counts.append(len(text.split()))
+    return money_flags, phrase_counts
+
+
+def analyze_frame(
+    df: "DataFrame", title_column: str = "title", description_column: str = "description"
+) -> "DataFrame":
+    """
+    Computes the `contains_money` and `count_phrases` columns of a DataFrame with vectorized
+    pandas string operations, e.g. to reprocess historical exports.
+
+    Args:
+        df (DataFrame): The articles, with title and description columns.
+        title_column (str, optional): The title column. Defaults to "title".
+        description_column (str, optional): The description column. Defaults to "description".
+
+    Returns:
+        DataFrame: The same DataFrame, with the `contains_money` and `count_phrases` columns set.
+    """
+    text = df[title_column].fillna("").astype(str)
+    if description_column in df:
+        text = text.str.cat(df[description_column].fillna("").astype(str), sep=" ")
+
+    df["contains_money"] = text.str.contains(MONEY_PATTERN, regex=True)
+    df["count_phrases"] = text.str.split().str.len()
+    return df
@@ -0,0 +1,77 @@
+import logging
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+
+class OffsetPlanner:
+    """
+    Plans which result pages of a newest-first search must be fetched to reach an earliest date.
+
+    Instead of walking every page until one crosses the earliest date, the planner binary-searches
+    the offset space, probing the date of the oldest article of a page. The pages before the cutoff
+    page can then be fetched in any order, or in parallel.
+
+    Attributes:
+        probe (Callable[[int], Optional[date]]): Returns the date of the oldest article in the page
+            starting at the given offset, or None if the page has no results.
+        page_size (int): The number of results per page.
+        probes (int): The number of pages probed so far.
+
+    Methods:
+        cutoff_offset: Finds the offset of the last page that must be fetched.
+        plan: Lists the offsets of every page that must be fetched.
+    """
+
+    def __init__(self, probe: Callable[[int], Optional[date]], page_size: int = 20) -> None:
+        self.probe = probe
+        self.page_size = page_size
+        self.probes = 0
+        self._oldest_dates: Dict[int, Optional[date]] = {}
+
+    def _oldest_date(self, page: int) -> Optional[date]:
+        if page not in self._oldest_dates:
+            self.probes += 1
+            self._oldest_dates[page] = self.probe(page * self.page_size)
+        return self._oldest_dates[page]
+
+    def cutoff_offset(self, max_offset: int, earliest_date: date, start_offset: int = 0) -> int:
+        """
+        Finds the offset of the first page whose oldest article is older than the earliest date,
+        which is the last page that must be fetched. It takes O(log n) probes for the n pages from
+        the start offset, so a resumed scrape does not probe the pages it already passed.
+
+        Args:
+            max_offset (int): The total number of results of the search.
+            earliest_date (date): The earliest date for filtering news articles.
+            start_offset (int, optional): The offset of the first page left to fetch. Defaults to 0.
+
+        Returns:
+            int: The offset of the cutoff page, or of the last page if no page crosses the earliest date.
+        """
+        low = start_offset // self.page_size
+        high = max(low, (max_offset - 1) // self.page_size)
+        while low < high:
+            middle = (low + high) // 2
+            oldest_date = self._oldest_date(middle)
+            if oldest_date is None or oldest_date < earliest_date:
+                high = middle
+            else:
+                low = middle + 1
+
+        logging.info(f"Cutoff offset: {low * self.page_size}, found with {self.probes} probes.")
+        return low * self.page_size
+
+    def plan(self, max_offset: int, earliest_date: date, start_offset: int = 0) -> List[int]:
+        """
+        Lists the offsets of every page that must be fetched to reach the earliest date.
+
+        Args:
+            max_offset (int): The total number of results of the search.
+            earliest_date (date): The earliest date for filtering news articles.
+            start_offset (int, optional): The offset of the first page to fetch. Defaults to 0.
+
+        Returns:
+            List[int]: The page offsets, in ascending order.
+        """
+        cutoff = self.cutoff_offset(max_offset, earliest_date, start_offset)
+        return list(range(start_offset, cutoff + 1, self.page_size))
@@ -0,0 +1,132 @@
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
+from core.domain.batch import NewsBatch
+from core.domain.entities import NewsArticle
+
+AMOUNT = r"\d{1,3}(?:[.,]\d{3})*(?:[.,]\d+)?(?:\s?(?:thousand|million|billion|trillion|mln|bln|bn|k|m)\b)?"
+
+# each currency matches its symbol or ISO code before an amount, and its ISO code or name after it
+DEFAULT_CURRENCIES: Dict[str, str] = {
+    "USD": (
+        rf"(?<![A-Za-z])(?:US)?\$\s?{AMOUNT}|\bUSD\s?{AMOUNT}"
+        rf"|{AMOUNT}\s?(?:USD|US\s?dollars?|dollars?|dólares)\b"
+        r"|\b(?:thousand|million|billion|trillion)s?\s(?:of\s)?(?:US\s)?dollars\b"
+    ),
+    "EUR": rf"€\s?{AMOUNT}|\bEUR\s?{AMOUNT}|{AMOUNT}\s?(?:€|EUR\b|euros?\b)|\b(?:million|billion|trillion)\seuros\b",
+    "GBP": (
+        rf"£\s?{AMOUNT}|\bGBP\s?{AMOUNT}"
+        rf"|{AMOUNT}\s?(?:GBP|pounds?(?:\ssterling)?)\b|\b(?:million|billion)\spounds\b"
+    ),
+    "JPY": rf"(?:¥|JP¥)\s?{AMOUNT}|\bJPY\s?{AMOUNT}|{AMOUNT}\s?(?:JPY|yen)\b",
+    "BRL": rf"R\$\s?{AMOUNT}|\bBRL\s?{AMOUNT}|{AMOUNT}\s?(?:BRL|reais)\b",
+    "CNY": rf"\bCNY\s?{AMOUNT}|{AMOUNT}\s?(?:CNY|yuan|renminbi)\b",
+}
+
+
+def normalize_phrase(phrase: str) -> str:
+    """
+    Normalizes a phrase for matching, lowercasing it and collapsing whitespace.
+
+    Args:
+        phrase (str): The phrase to normalize.
+
+    Returns:
+        str: The normalized phrase.
+    """
+    return " ".join(phrase.lower().split())
+
+
+class TermMatcher:
+    """
+    Scans each article once with a single combined regular expression that matches every tracked
+    phrase and every currency pattern, instead of running one regex per term.
+
+    Phrases are matched case-insensitively as whole words, with any whitespace between their words.
+    Matches do not overlap: the leftmost match wins, and at the same position a currency amount wins
+    over a phrase, so a phrase inside an amount (e.g. "dollars" in "5 million dollars") is not counted.
+
+    Attributes:
+        phrases (List[str]): The tracked phrases, as configured.
+        currencies (Dict[str, str]): The currency labels and their regular expressions.
+        pattern (re.Pattern): The combined pattern.
+
+    Methods:
+        scan: Counts the tracked phrases and detects the currencies of a text.
+        match_article: Stores the scan of an article title and description on the article.
+        match_batch: Stores the scan of every article of a list.
+    """
+
+    def __init__(self, phrases: Iterable[str] = (), currencies: Mapping[str, str] = DEFAULT_CURRENCIES) -> None:
+        self.phrases = [phrase for phrase in phrases if phrase.strip()]
+        self.currencies = dict(currencies)
+        self._phrase_keys = {normalize_phrase(phrase): phrase for phrase in self.phrases}
+        self._currency_groups: Dict[str, str] = {}
+
+        alternatives = []
+        for i, (label, currency_pattern) in enumerate(self.currencies.items()):
+            group = f"currency_{i}"
+            self._currency_groups[group] = label
+            alternatives.append(f"(?P<{group}>{currency_pattern})")
+
+        if self._phrase_keys:
+            escaped = [
+                r"\s+".join(map(re.escape, key.split()))
+                for key in sorted(self._phrase_keys, key=len, reverse=True)
+            ]
+            alternatives.append(rf"(?P<phrase>(?<!\w)(?:{'|'.join(escaped)})(?!\w))")
+
+        self.pattern = re.compile("|".join(alternatives) or r"(?!)", re.IGNORECASE)
+
+    def scan(self, text: str) -> Tuple[Dict[str, int], List[str]]:
+        """
+        Counts the tracked phrases and detects the currencies of a text in one pass.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            Tuple[Dict[str, int], List[str]]: The count of each tracked phrase found, and the sorted
+                labels of the currencies found.
+        """
+        phrase_counts: Counter = Counter()
+        currencies = set()
+        for match in self.pattern.finditer(text):
+            group = match.lastgroup
+            if group == "phrase":
+                phrase_counts[self._phrase_keys[normalize_phrase(match.group())]] += 1
+            else:
+                currencies.add(self._currency_groups[group])
+        return dict(phrase_counts), sorted(currencies)
+
+    def match_article(self, article: NewsArticle):
+        """
+        Stores the scan of an article title and description in `phrase_matches` and `currencies`.
+
+        Args:
+            article (NewsArticle): The article to scan, updated in place.
+
+        Returns:
+            None
+        """
+        text = f"{article.title}\n{article.description}" if article.description else article.title
+        article.phrase_matches, article.currencies = self.scan(text)
+
+    def match_batch(self, news_list: Union[Iterable[NewsArticle], NewsBatch]):
+        """
+        Stores the scan of every article of a list, or in the columns of a NewsBatch.
+
+        Args:
+            news_list (Union[Iterable[NewsArticle], NewsBatch]): The articles to scan, updated in place.
+
+        Returns:
+            None
+        """
+        if isinstance(news_list, NewsBatch):
+            news_list.set_matches(
+                self.scan(f"{title}\n{description}" if description else title)
+                for title, description in zip(news_list.titles, news_list.descriptions)
+            )
+            return
+        for article in news_list:
+            self.match_article(article)
@@ -0,0 +1,189 @@
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, List
+
+
+class Span:
+    """
+    Times a block of code and records its duration in a tracer when the block exits.
+
+    Attributes:
+        tracer (Tracer): The tracer recording the span.
+        stage (str): The name of the stage.
+        attributes (Dict[str, Any]): Details of the span, like the page offset.
+    """
+
+    __slots__ = ("tracer", "stage", "attributes", "start")
+
+    def __init__(self, tracer: "Tracer", stage: str, attributes: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.stage = stage
+        self.attributes = attributes
+        self.start = 0.0
+
+    def __enter__(self) -> "Span":
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.record(self.stage, perf_counter() - self.start, **self.attributes)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Aggregates the duration and count of every stage of a scrape, and keeps the spans recorded with
+    attributes, like the pages, as individual events. It is thread-safe, so the download and page
+    workers share it.
+
+    Methods:
+        span: Context manager timing a stage.
+        record: Records the duration of a stage.
+        count: Increments a counter.
+        summary: Returns the stages, counters and events recorded so far.
+        reset: Clears everything recorded.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.reset()
+
+    def span(self, stage: str, **attributes) -> Span:
+        """
+        Times the block of a `with` statement as a stage.
+
+        Args:
+            stage (str): The name of the stage.
+            **attributes: Details of the span; a span with attributes is also kept as an event.
+
+        Returns:
+            Span: The context manager of the span.
+        """
+        return Span(self, stage, attributes)
+
+    def record(self, stage: str, seconds: float, **attributes):
+        """
+        Records the duration of a stage.
+
+        Args:
+            stage (str): The name of the stage.
+            seconds (float): The duration.
+            **attributes: Details of the span; a span with attributes is also kept as an event.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = {"count": 0, "total_s": 0.0, "max_s": 0.0}
+            stats["count"] += 1
+            stats["total_s"] += seconds
+            stats["max_s"] = max(stats["max_s"], seconds)
+            if attributes:
+                self._events.append({"stage": stage, "seconds": round(seconds, 4), **attributes})
+
+    def count(self, metric: str, value: int = 1):
+        """
+        Increments a counter, like the number of articles scraped.
+
+        Args:
+            metric (str): The name of the counter.
+            value (int, optional): The increment. Defaults to 1.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._counters[metric] = self._counters.get(metric, 0) + value
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns the stages, counters and events recorded since the last reset.
+
+        Returns:
+            Dict[str, Any]: The count, total, mean and maximum duration of each stage, the counters,
+                and the events, ready to be serialized as JSON.
+        """
+        with self._lock:
+            stages = {
+                stage: {
+                    "count": stats["count"],
+                    "total_s": round(stats["total_s"], 4),
+                    "mean_ms": round(stats["total_s"] / stats["count"] * 1000, 3),
+                    "max_ms": round(stats["max_s"] * 1000, 3),
+                }
+                for stage, stats in self._stages.items()
+            }
+            return {"stages": stages, "counters": dict(self._counters), "events": list(self._events)}
+
+    def reset(self):
+        """
+        Clears the stages, counters and events, before a new scrape.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._stages: Dict[str, Dict[str, float]] = {}
+            self._counters: Dict[str, int] = {}
+            self._events: List[Dict[str, Any]] = []
+
+
+class NullTracer(Tracer):
+    """
+    A tracer that records nothing, used while tracing is disabled. Its spans are a shared no-op
+    context manager, so instrumented code pays one method call per span.
+    """
+
+    enabled = False
+
+    def span(self, stage: str, **attributes) -> _NullSpan:
+        return _NULL_SPAN
+
+    def record(self, stage: str, seconds: float, **attributes):
+        pass
+
+    def count(self, metric: str, value: int = 1):
+        pass
+
+
+_tracer: Tracer = NullTracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Returns the tracer of the process, a NullTracer until `set_tracer` is called.
+
+    Returns:
+        Tracer: The current tracer.
+    """
+    return _tracer
+
+
+def set_tracer(tracer: Tracer):
+    """
+    Sets the tracer used by every instrumented stage of the process.
+
+    Args:
+        tracer (Tracer): The tracer, or a NullTracer to disable tracing.
+
+    Returns:
+        None
+    """
+    global _tracer
+    _tracer = tracer
@@ -1,12 +1,34 @@
 import json
 import logging
+from dataclasses import asdict
 from os import getenv
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from uuid import uuid4
 from robocorp.tasks import get_output_dir, task
-from robocorp.workitems import inputs
+from robocorp.workitems import inputs, outputs
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+from adapters.persistence.jsonl_repository import JsonLinesRepository
+from adapters.scraping.reuters import PAGE_SIZE
 from core.application.scrape_news import ScrapeNews
-from core.domain.interfaces import Respository, Scraper
+from core.application.sharded_scrape import merge_shards, plan_shards
+from core.domain.interfaces import (
+    Checkpoint,
+    DuplicateIndex,
+    Enricher,
+    Respository,
+    ScrapeInterrupted,
+    Scraper,
+    SeenIndex,
+)
+from core.domain.term_matcher import TermMatcher
+from core.domain.tracing import NullTracer, Tracer, get_tracer, set_tracer
 from robocorp import log
 
+if TYPE_CHECKING:
+    from adapters.http.http_cache import HttpCache
+    from adapters.scraping.thumbnail_normalizer import ThumbnailNormalizer
+
 logging.basicConfig(
     filename=f"{get_output_dir()}/app.log",
     level=logging.INFO,
@@ -14,10 +36,102 @@ logging.basicConfig(
 )
 
 
-def get_scraper() -> Scraper:
+def getenv_bool(name: str, default: bool) -> bool:
+    """
+    Reads a boolean flag from the environment, accepting "1", "true" and "yes" as true.
+
+    Args:
+        name (str): The environment variable name.
+        default (bool): The value used when the variable is not set.
+
+    Returns:
+        bool: The flag value.
+    """
+    value = getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """
+    Factory function to return the adaptive rate limiter shared by page loads and thumbnail downloads,
+    starting from the RATE_LIMIT_* environment variables.
+
+    Returns:
+        AdaptiveRateLimiter: The limiter, which then adapts the pace of each host on its own.
+    """
+    return AdaptiveRateLimiter(
+        rate=float(getenv("RATE_LIMIT_RPS", "2.0")),
+        max_rate=float(getenv("RATE_LIMIT_MAX_RPS", "20.0")),
+        max_concurrency=int(getenv("RATE_LIMIT_MAX_CONCURRENCY", "8")),
+        target_latency=float(getenv("RATE_LIMIT_TARGET_LATENCY", "5.0")),
+        max_retries=int(getenv("RATE_LIMIT_MAX_RETRIES", "3")),
+    )
+
+
+def get_http_cache() -> Optional["HttpCache"]:
+    """
+    Factory function to return the on-disk cache of HTTP responses, enabled with the HTTP_CACHE
+    environment variable and kept across runs in HTTP_CACHE_DIR.
+
+    It is disabled by default, as it only pays off on machines that keep it between runs, and it is kept
+    out of the output directory, which is uploaded as the artifacts of every run.
+
+    Returns:
+        Optional[HttpCache]: The cache, or None if it is disabled.
+    """
+    if not getenv_bool("HTTP_CACHE", False):
+        return None
+
+    from adapters.http.http_cache import HttpCache
+
+    cache_home = Path(getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return HttpCache(
+        Path(getenv("HTTP_CACHE_DIR", cache_home / "news-scrape" / "http")),
+        max_bytes=int(getenv("HTTP_CACHE_MAX_MB", "512")) * 2**20,
+        default_max_age=int(getenv("HTTP_CACHE_MAX_AGE", "0")),
+    )
+
+
+def get_thumbnail_normalizer() -> Optional["ThumbnailNormalizer"]:
+    """
+    Factory function to return the stage resizing and re-encoding the downloaded thumbnails in a process pool,
+    enabled with the THUMBNAIL_NORMALIZE environment variable.
+    Its worker processes are started here, before the scraper starts any download thread.
+
+    Returns:
+        Optional[ThumbnailNormalizer]: The normalizer configured with the THUMBNAIL_* environment variables,
+            or None if thumbnails are stored as downloaded.
+    """
+    if not getenv_bool("THUMBNAIL_NORMALIZE", True):
+        return None
+
+    from adapters.scraping.thumbnail_normalizer import ThumbnailNormalizer
+
+    return ThumbnailNormalizer(
+        max_size=int(getenv("THUMBNAIL_MAX_SIZE", "320")),
+        image_format=getenv("THUMBNAIL_FORMAT", "webp"),
+        quality=int(getenv("THUMBNAIL_QUALITY", "80")),
+        workers=int(getenv("THUMBNAIL_WORKERS", "0")) or None,
+    ).start()
+
+
+def get_scraper(
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    cache: Optional["HttpCache"] = None,
+    normalizer: Optional["ThumbnailNormalizer"] = None,
+) -> Scraper:
     """
     Factory function to return an instance of a Scraper based on the SCRAPER_TYPE environment variable.
 
+    Args:
+        limiter (Optional[AdaptiveRateLimiter], optional): The rate limiter shared with the other HTTP stages.
+            Defaults to a new one.
+        cache (Optional[HttpCache], optional): The HTTP cache shared with the other HTTP stages. Defaults to None.
+        normalizer (Optional[ThumbnailNormalizer], optional): The stage resizing and re-encoding the thumbnails.
+            Defaults to None.
+
     Returns:
         Scraper: An instance of a Scraper implementation.
 
@@ -28,7 +142,29 @@ def get_scraper() -> Scraper:
     if scraper_type == "selenium":
         from adapters.scraping.selenium_scraper import SeleniumScraper
 
-        return SeleniumScraper()
+        return SeleniumScraper(
+            download_workers=int(getenv("IMAGE_DOWNLOAD_WORKERS", "8")),
+            batch_extraction=getenv_bool("SCRAPER_BATCH_EXTRACTION", True),
+            page_workers=int(getenv("SCRAPER_PAGE_WORKERS", "1")),
+            plan_offsets=getenv_bool("SCRAPER_PLAN_OFFSETS", False),
+            archive_images=getenv("IMAGE_STORE", "files") == "archive",
+            recycle_pages=int(getenv("SCRAPER_RECYCLE_PAGES", "0")),
+            limiter=limiter or get_rate_limiter(),
+            cache=cache,
+            normalizer=normalizer,
+        )
+    elif scraper_type == "http":
+        from adapters.scraping.http_scraper import HttpScraper
+        from adapters.scraping.reuters import SEARCH_URL
+
+        return HttpScraper(
+            base_url=getenv("SEARCH_URL", SEARCH_URL),
+            download_workers=int(getenv("IMAGE_DOWNLOAD_WORKERS", "8")),
+            archive_images=getenv("IMAGE_STORE", "files") == "archive",
+            limiter=limiter or get_rate_limiter(),
+            cache=cache,
+            normalizer=normalizer,
+        )
     else:
         raise NotImplementedError(f"{scraper_type} not implemented yet.")
 
@@ -48,10 +184,201 @@ def get_repository() -> Respository:
         from adapters.persistence.excel_repository import ExcelRepository
 
         return ExcelRepository()
+    elif repository_type == "parquet":
+        from adapters.persistence.parquet_repository import ParquetRepository
+
+        return ParquetRepository(row_group_size=int(getenv("PARQUET_ROW_GROUP_SIZE", "10000")))
+    elif repository_type == "csv":
+        from adapters.persistence.csv_repository import CsvRepository
+
+        return CsvRepository()
+    elif repository_type == "sqlite":
+        from adapters.persistence.sqlite_repository import SqliteRepository
+
+        return SqliteRepository(Path(getenv("SQLITE_PATH", f"{get_output_dir()}/news.sqlite3")))
     else:
         raise NotImplementedError(f"{repository_type} not implemented yet.")
 
 
+def get_seen_index() -> Optional[SeenIndex]:
+    """
+    Factory function to return the seen-URL index used by incremental scrapes, enabled with the
+    INCREMENTAL_SCRAPE environment variable.
+
+    Returns:
+        Optional[SeenIndex]: The index stored in SEEN_INDEX_PATH, or None if incremental scrapes are disabled.
+    """
+    if not getenv_bool("INCREMENTAL_SCRAPE", False):
+        return None
+
+    from adapters.persistence.sqlite_seen_index import SqliteSeenIndex
+
+    return SqliteSeenIndex(Path(getenv("SEEN_INDEX_PATH", f"{get_output_dir()}/seen_articles.sqlite3")))
+
+
+def get_duplicate_index() -> Optional[DuplicateIndex]:
+    """
+    Factory function to return the index of saved articles used to find near-duplicates across sections and
+    runs, enabled with the DEDUP_ARTICLES environment variable.
+
+    Returns:
+        Optional[DuplicateIndex]: The index stored in DUPLICATE_INDEX_PATH, or None if duplicates are not detected.
+    """
+    if not getenv_bool("DEDUP_ARTICLES", False):
+        return None
+
+    from adapters.persistence.sqlite_duplicate_index import SqliteDuplicateIndex
+
+    return SqliteDuplicateIndex(
+        Path(getenv("DUPLICATE_INDEX_PATH", f"{get_output_dir()}/duplicate_index.sqlite3")),
+        threshold=float(getenv("DUPLICATE_THRESHOLD", "0.7")),
+    )
+
+
+def get_checkpoint() -> Optional[Checkpoint]:
+    """
+    Factory function to return the checkpoint store of resumable scrapes, enabled with the
+    SCRAPE_CHECKPOINTS environment variable.
+
+    Returns:
+        Optional[Checkpoint]: The store in CHECKPOINT_DIR, or None if checkpoints are disabled.
+    """
+    if not getenv_bool("SCRAPE_CHECKPOINTS", True):
+        return None
+
+    from adapters.persistence.json_checkpoint import JsonCheckpointStore
+
+    return JsonCheckpointStore(Path(getenv("CHECKPOINT_DIR", f"{get_output_dir()}/checkpoints")))
+
+
+def get_enricher(
+    limiter: Optional[AdaptiveRateLimiter] = None, cache: Optional["HttpCache"] = None
+) -> Optional[Enricher]:
+    """
+    Factory function to return the enrichment stage that fetches article descriptions, enabled with the
+    ENRICH_DESCRIPTIONS environment variable.
+
+    Args:
+        limiter (Optional[AdaptiveRateLimiter], optional): The rate limiter shared with the scraper. Defaults to None.
+        cache (Optional[HttpCache], optional): The HTTP cache shared with the scraper. Defaults to None.
+
+    Returns:
+        Optional[Enricher]: The enricher with ENRICH_WORKERS concurrent fetches, or None if enrichment is disabled.
+    """
+    if not getenv_bool("ENRICH_DESCRIPTIONS", False):
+        return None
+
+    from adapters.http.article_enricher import HttpArticleEnricher
+
+    return HttpArticleEnricher(workers=int(getenv("ENRICH_WORKERS", "16")), limiter=limiter, cache=cache)
+
+
+def get_matcher(search_phrase: str, tracked_phrases: Optional[List[str]] = None) -> TermMatcher:
+    """
+    Factory function to return the matcher of tracked phrases and currencies. The phrases come from the
+    work item, then from the comma-separated TRACKED_PHRASES environment variable, and default to the
+    search phrase.
+
+    Args:
+        search_phrase (str): The phrase of the search.
+        tracked_phrases (Optional[List[str]], optional): The phrases listed in the work item. Defaults to None.
+
+    Returns:
+        TermMatcher: The matcher with the tracked phrases and the default currencies.
+    """
+    if not tracked_phrases:
+        tracked_phrases = [phrase for phrase in getenv("TRACKED_PHRASES", "").split(",") if phrase.strip()]
+    return TermMatcher(tracked_phrases or [search_phrase])
+
+
+def configure_tracing():
+    """
+    Sets the tracer of the process, enabled with the SCRAPE_TRACING environment variable.
+
+    Returns:
+        None
+    """
+    set_tracer(Tracer() if getenv_bool("SCRAPE_TRACING", True) else NullTracer())
+
+
+def write_trace(scrape_id: str):
+    """
+    Writes the stages, counters and page events traced for a scrape to `trace_<scrape_id>.json` in the
+    output directory, and logs the stage summary in the robocorp log.
+
+    Args:
+        scrape_id (str): The scrape ID of the traced scrape.
+
+    Returns:
+        None
+    """
+    tracer = get_tracer()
+    if not tracer.enabled:
+        return
+    summary = tracer.summary()
+    trace_path = Path(get_output_dir()) / f"trace_{scrape_id}.json"
+    trace_path.write_text(json.dumps({"scrape_id": scrape_id, **summary}, indent=2), encoding="utf-8")
+    log.info(f"Scrape {scrape_id} stages: {json.dumps(summary['stages'])}")
+    log.info(f"Scrape {scrape_id} counters: {json.dumps(summary['counters'])}")
+    logging.info(f"Trace saved in: {trace_path}")
+
+
+def scrape_query(
+    scraper: Scraper,
+    repository: Respository,
+    seen_index: Optional[SeenIndex],
+    payload: dict,
+    checkpoint: Optional[Checkpoint] = None,
+    enricher: Optional[Enricher] = None,
+    offset_range: Optional[Tuple[int, int]] = None,
+    duplicate_index: Optional[DuplicateIndex] = None,
+) -> Optional[ScrapeNews]:
+    """
+    Scrapes and saves one query of a work item with an already started scraper.
+
+    Args:
+        scraper (Scraper): The scraper, shared by every query of the run.
+        repository (Respository): The repository, shared by every query of the run.
+        seen_index (Optional[SeenIndex]): The seen-URL index of incremental scrapes.
+        payload (dict): The query, with `search_phrase`, `date_option`, `section`, optional `tracked_phrases`
+            and an optional `scrape_id` to resume an interrupted scrape.
+        checkpoint (Optional[Checkpoint], optional): The checkpoint store of resumable scrapes. Defaults to None.
+        enricher (Optional[Enricher], optional): The stage fetching article descriptions. Defaults to None.
+        offset_range (Optional[Tuple[int, int]], optional): The start and end result offsets to scrape, for
+            a shard. Defaults to every result.
+        duplicate_index (Optional[DuplicateIndex], optional): The index of saved articles, whose near-duplicates
+            are dropped, or flagged with FLAG_DUPLICATES. Defaults to None.
+
+    Returns:
+        Optional[ScrapeNews]: The finished scrape, with the scrape ID of the query outputs, or None if the
+            search phrase is not defined.
+    """
+    search_phrase = payload['search_phrase'].lower()
+    date_option = int(payload['date_option'])
+    section = payload['section']
+
+    if not search_phrase:
+        logging.error('Search phrase not defined. Breaking scrape.')
+        return None
+
+    get_tracer().reset()
+    scrape_app = ScrapeNews(
+        scraper=scraper,
+        repositoy=repository,
+        seen_index=seen_index,
+        matcher=get_matcher(search_phrase, payload.get("tracked_phrases")),
+        checkpoint=checkpoint,
+        scrape_id=payload.get("scrape_id"),
+        enricher=enricher,
+        offset_range=offset_range,
+        duplicate_index=duplicate_index,
+        drop_duplicates=not getenv_bool("FLAG_DUPLICATES", False),
+    )
+    scrape_app.scrape_and_save(search_phrase, date_option, section)
+    write_trace(scrape_app.scrape_id)
+    return scrape_app
+
+
 @task
 def robot_scrape_news():
     """
@@ -63,14 +390,255 @@ def robot_scrape_news():
     # mocked payload
     # payload = {'search_phrase': 'gemini', 'date_option': 0, 'section': 'all'}
 
-    search_phrase = payload['search_phrase'].lower()
-    date_option = int(payload['date_option'])
-    section = payload['section']
+    configure_tracing()
+    limiter = get_rate_limiter()
+    cache = get_http_cache()
+    normalizer = get_thumbnail_normalizer()
+    scraper = get_scraper(limiter, cache, normalizer)
+    enricher = get_enricher(limiter, cache)
+    repository = get_repository()
+    seen_index = get_seen_index()
+    duplicate_index = get_duplicate_index()
+    try:
+        scrape_query(
+            scraper,
+            repository,
+            seen_index,
+            payload,
+            get_checkpoint(),
+            enricher,
+            duplicate_index=duplicate_index,
+        )
+    finally:
+        scraper.close()
+        repository.close_connection()
+        if seen_index is not None:
+            seen_index.close()
+        if duplicate_index is not None:
+            duplicate_index.close()
+        if normalizer is not None:
+            normalizer.close()
+        if enricher is not None:
+            enricher.close()
+        if cache is not None:
+            log.info(f"HTTP cache: {cache.stats()}")
+            cache.close()
 
-    if not search_phrase:
-        logging.error('Search phrase not defined. Breaking scrape.')
-    else:
-        scraper = get_scraper()
-        repository = get_repository()
-        scrape_app = ScrapeNews(scraper=scraper, repositoy=repository)
-        scrape_app.scrape_and_save(search_phrase, date_option, section)
+
+@task
+def robot_scrape_news_batch():
+    """
+    Function to scrape every query of every input work item through one long-lived scraper, so the
+    browser starts once per batch. A work item holds either one query or a `queries` list of them.
+    """
+    configure_tracing()
+    limiter = get_rate_limiter()
+    cache = get_http_cache()
+    normalizer = get_thumbnail_normalizer()
+    scraper = get_scraper(limiter, cache, normalizer)
+    enricher = get_enricher(limiter, cache)
+    repository = get_repository()
+    seen_index = get_seen_index()
+    checkpoint = get_checkpoint()
+    duplicate_index = get_duplicate_index()
+    try:
+        for item in inputs:
+            queries = item.payload.get("queries", [item.payload])
+            log.info(f"Work item with {len(queries)} queries.")
+            try:
+                for query in queries:
+                    scrape_app = scrape_query(
+                        scraper, repository, seen_index, query, checkpoint, enricher, duplicate_index=duplicate_index
+                    )
+                    if scrape_app is None:
+                        continue
+                    if scrape_app.interrupted:
+                        raise ScrapeInterrupted(
+                            f"Query {query['search_phrase']!r} was interrupted, "
+                            f"only partial results were saved with scrape ID: {scrape_app.scrape_id}"
+                        )
+                    log.info(f"Query {query['search_phrase']!r} saved with scrape ID: {scrape_app.scrape_id}")
+            except Exception as error:
+                logging.exception("Work item failed.")
+                item.fail(exception_type="APPLICATION", message=str(error))
+            else:
+                item.done()
+    finally:
+        scraper.close()
+        repository.close_connection()
+        if seen_index is not None:
+            seen_index.close()
+        if duplicate_index is not None:
+            duplicate_index.close()
+        if normalizer is not None:
+            normalizer.close()
+        if enricher is not None:
+            enricher.close()
+        if cache is not None:
+            log.info(f"HTTP cache: {cache.stats()}")
+            cache.close()
+
+
+@task
+def robot_plan_shards():
+    """
+    Producer of a sharded scrape: counts the results of every query of the input work items and plans them
+    into shards of SHARD_PAGES result pages, emitted as output work items for the consumers.
+    """
+    limiter = get_rate_limiter()
+    cache = get_http_cache()
+    scraper = get_scraper(limiter, cache)
+    shard_size = int(getenv("SHARD_PAGES", "25")) * PAGE_SIZE
+    try:
+        for item in inputs:
+            queries = item.payload.get("queries", [item.payload])
+            try:
+                for query in queries:
+                    scrape_id = query.get("scrape_id") or str(uuid4()).split("-")[0]
+                    total_results = scraper.count_results(query["search_phrase"].lower(), query["section"])
+                    shards = plan_shards(scrape_id, total_results, shard_size)
+                    for shard in shards:
+                        outputs.create({**query, **asdict(shard)})
+                    log.info(f"Query {query['search_phrase']!r} planned into {len(shards)} shards: {scrape_id}")
+            except Exception as error:
+                logging.exception("Work item failed.")
+                item.fail(exception_type="APPLICATION", message=str(error))
+            else:
+                item.done()
+    finally:
+        scraper.close()
+        if cache is not None:
+            cache.close()
+
+
+@task
+def robot_scrape_shard():
+    """
+    Consumer of a sharded scrape: scrapes the offset range of every input shard under its shard ID into a
+    JSON lines file, emitted with its thumbnails as an output work item for the reducer. An interrupted
+    shard fails its work item, and with checkpoints a retry on the same worker resumes it.
+    """
+    configure_tracing()
+    limiter = get_rate_limiter()
+    cache = get_http_cache()
+    normalizer = get_thumbnail_normalizer()
+    scraper = get_scraper(limiter, cache, normalizer)
+    enricher = get_enricher(limiter, cache)
+    repository = JsonLinesRepository()
+    checkpoint = get_checkpoint()
+    try:
+        for item in inputs:
+            shard = item.payload
+            offset_range = (shard["start_offset"], shard["end_offset"]) if shard["end_offset"] is not None else None
+            try:
+                query = {**shard, "scrape_id": shard["shard_id"]}
+                scrape_app = scrape_query(scraper, repository, None, query, checkpoint, enricher, offset_range)
+                if scrape_app is not None and scrape_app.interrupted:
+                    raise ScrapeInterrupted(f"Shard {shard['shard_id']} was interrupted.")
+            except Exception as error:
+                logging.exception("Work item failed.")
+                item.fail(exception_type="APPLICATION", message=str(error))
+                continue
+            files = repository.files(shard["shard_id"])
+            outputs.create(shard, files=[str(path) for path in files])
+            log.info(f"Shard {shard['shard_id']} saved with {len(files)} files.")
+            item.done()
+    finally:
+        scraper.close()
+        if normalizer is not None:
+            normalizer.close()
+        if enricher is not None:
+            enricher.close()
+        if cache is not None:
+            log.info(f"HTTP cache: {cache.stats()}")
+            cache.close()
+
+
+def save_merged_scrape(
+    repository: Respository,
+    seen_index: Optional[SeenIndex],
+    query: dict,
+    scrape_shards: List[Tuple[int, Optional[Path]]],
+) -> Optional[dict]:
+    """
+    Merges the shard files of a scrape in offset order, drops the articles found by two shards, and saves the
+    result under the scrape ID.
+
+    Args:
+        repository (Respository): The configured repository.
+        seen_index (Optional[SeenIndex]): The seen-URL index of incremental scrapes.
+        query (dict): The payload of a shard of the scrape, with its `scrape_id`, `search_phrase` and `section`.
+        scrape_shards (List[Tuple[int, Optional[Path]]]): The start offset and the JSON lines file of each shard,
+            None for a shard without articles.
+
+    Returns:
+        Optional[dict]: The payload of the output work item of the merged scrape, or None if it has no articles.
+    """
+    scrape_id = query["scrape_id"]
+    scrape_shards = sorted(scrape_shards, key=lambda scrape_shard: scrape_shard[0])
+    news_list = merge_shards(JsonLinesRepository.read(path) for _, path in scrape_shards if path is not None)
+    if not news_list:
+        logging.warning(f"No news scraped in the {len(scrape_shards)} shards of scrape {scrape_id}.")
+        return None
+    repository.save(scrape_id=scrape_id, news_list=news_list)
+    if seen_index is not None:
+        seen_index.mark_seen(query["search_phrase"].lower(), query["section"], news_list)
+    log.info(f"Scrape {scrape_id} merged from {len(scrape_shards)} shards: {len(news_list)} articles")
+    return {"scrape_id": scrape_id, "shards": len(scrape_shards), "articles": len(news_list)}
+
+
+@task
+def robot_merge_shards():
+    """
+    Reducer of a sharded scrape: collects the shard files of every input work item, and once the last shard of
+    a scrape arrives, merges its shards in offset order, drops the articles found by two shards, and saves the
+    result with the configured repository under the scrape ID.
+
+    Only one input work item can be reserved at a time, so the other shards of a scrape are released once their
+    files are collected, and the work item of its last shard is kept until the scrape is saved: it is done once
+    the save succeeds, and failed otherwise, with the shard files kept in the `shards` output directory. It is
+    also the parent of the output work item of the scrape. Scrapes still missing shards at the end of the run are
+    not saved and fail the run, with the files of the shards that arrived kept in the `shards` output directory,
+    as their work items are already released and can no longer be failed one by one.
+    """
+    shards_dir = Path(get_output_dir()) / "shards"
+    shards: Dict[str, Dict[str, Tuple[int, Optional[Path]]]] = {}
+    queries: Dict[str, dict] = {}
+    repository = get_repository()
+    seen_index = get_seen_index()
+    try:
+        for item in inputs:
+            shard = item.payload
+            scrape_id = shard["scrape_id"]
+            try:
+                shard_dir = shards_dir / shard["shard_id"]
+                shard_dir.mkdir(parents=True, exist_ok=True)
+                paths = [item.get_file(name, shard_dir / name) for name in item.files]
+                shard_file = next((path for path in paths if path.suffix == ".jsonl"), None)
+                # keyed by shard ID, so a shard delivered twice by a retried consumer is only merged once
+                scrape_shards = shards.setdefault(scrape_id, {})
+                scrape_shards[shard["shard_id"]] = (shard["start_offset"], shard_file)
+                queries[scrape_id] = shard
+                if len(scrape_shards) == shard["shard_count"]:
+                    merged = save_merged_scrape(repository, seen_index, shard, list(shards.pop(scrape_id).values()))
+                    if merged is not None:
+                        outputs.create(merged)
+            except Exception as error:
+                logging.exception("Work item failed.")
+                item.fail(exception_type="APPLICATION", message=str(error))
+            else:
+                item.done()
+
+        # a partial merge would pass for the full scrape, so scrapes still missing shards are not saved
+        for scrape_id, scrape_shards in shards.items():
+            shard_count = queries[scrape_id]["shard_count"]
+            logging.error(
+                f"Scrape {scrape_id} not merged: {len(scrape_shards)} of its {shard_count} shards arrived, "
+                f"their files are kept in {shards_dir}."
+            )
+        if shards:
+            raise ScrapeInterrupted(f"Scrapes with missing shards were not merged: {', '.join(shards)}")
+    finally:
+        repository.close_connection()
+        if seen_index is not None:
+            seen_index.close()
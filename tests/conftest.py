@@ -0,0 +1,72 @@
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from time import sleep
+from typing import Callable, Dict, Optional, Tuple, Union
+import pytest
+
+# the robot runs with src on its PYTHONPATH (robot.yaml), the tests import the modules the same way
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+Response = Union[Tuple[bytes, str], Tuple[bytes, str, Dict[str, str]]]
+Route = Callable[[str], Optional[Response]]
+
+
+@pytest.fixture
+def serve():
+    """
+    Starts local HTTP servers in daemon threads and stops them after the test.
+
+    The returned function takes a route, called with the request path and returning the body, the
+    content type and optionally the extra headers of the response, or None for a 404, and the delay in
+    seconds added to every response. It returns the base URL of the server. A conditional request
+    matching the ETag or the Last-Modified header of the response gets a 304.
+    """
+    servers = []
+
+    def start(route: Route, latency: float = 0.0) -> str:
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive, like the servers the pooled sessions talk to
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                sleep(latency)
+                response = route(self.path)
+                if response is None:
+                    self.send_error(404)
+                    return
+                body, content_type, headers = response if len(response) == 3 else (*response, {})
+                if (
+                    "ETag" in headers and self.headers.get("If-None-Match") == headers["ETag"]
+                ) or (
+                    "Last-Modified" in headers and self.headers.get("If-Modified-Since") == headers["Last-Modified"]
+                ):
+                    self.send_response(304)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,45 @@
+from datetime import date
+from adapters.http.article_enricher import HttpArticleEnricher
+from core.domain.entities import NewsArticle
+
+ARTICLE_PAGE = b"""<html><head>
+<meta name="description" content="Shares rose as investors weighed a $1.5 billion facility."/>
+</head><body><article><p>Shares rose in early trading.</p></article></body></html>"""
+
+
+def article_route(path: str):
+    if path == "/article/":
+        return ARTICLE_PAGE, "text/html; charset=utf-8"
+    if path == "/empty/":
+        return b"", "text/html; charset=utf-8"
+    if path == "/blank/":
+        return b"   \n", "text/html; charset=utf-8"
+    return None
+
+
+def make_article(url: str) -> NewsArticle:
+    return NewsArticle(
+        article_id=url,
+        title="Markets weigh central bank outlook",
+        date=date.today(),
+        url=url,
+        image_path="",
+        selected_section="all",
+    )
+
+
+def test_unparsable_pages_leave_the_description_empty(serve):
+    base_url = serve(article_route)
+    articles = [make_article(f"{base_url}/{path}/") for path in ("article", "empty", "blank", "missing")]
+    enricher = HttpArticleEnricher(workers=4)
+    try:
+        assert enricher.enrich(articles) == 1
+    finally:
+        enricher.close()
+
+    assert [article.description for article in articles] == [
+        "Shares rose as investors weighed a $1.5 billion facility.",
+        "",
+        "",
+        "",
+    ]
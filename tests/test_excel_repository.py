@@ -0,0 +1,54 @@
+from datetime import date
+from openpyxl import load_workbook
+from adapters.persistence.excel_repository import ExcelRepository
+from adapters.persistence.schema import NEWS_COLUMNS
+from core.domain.batch import NewsBatch
+from core.domain.entities import NewsArticle
+
+
+def make_article(i: int) -> NewsArticle:
+    return NewsArticle(
+        article_id=str(i),
+        title=f"Markets weigh central bank outlook {i}",
+        date=date(2024, 7, 1),
+        url=f"https://www.reuters.com/markets/article-{i}-2024-07-01/",
+        image_path=f"output/{i}.jpg",
+        selected_section="all",
+        count_phrases=i,
+        contains_money=i % 2 == 0,
+    )
+
+
+def read_rows(path):
+    workbook = load_workbook(path, read_only=True)
+    rows = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+    workbook.close()
+    return rows
+
+
+def test_save_writes_the_same_workbook_as_the_streaming_path(tmp_path):
+    articles = [make_article(i) for i in range(5)]
+    (tmp_path / "saved").mkdir()
+    (tmp_path / "streamed").mkdir()
+
+    ExcelRepository(output_dir=tmp_path / "saved").save("scrape", NewsBatch.from_articles(articles))
+    streaming = ExcelRepository(output_dir=tmp_path / "streamed")
+    streaming.append("scrape", articles[:3])
+    streaming.append("scrape", articles[3:])
+    streaming.close("scrape")
+
+    saved = read_rows(tmp_path / "saved" / "news_scrape_result_scrape.xlsx")
+    assert saved == read_rows(tmp_path / "streamed" / "news_scrape_result_scrape.xlsx")
+    assert saved[0] == NEWS_COLUMNS
+    assert [row[NEWS_COLUMNS.index("title")] for row in saved[1:]] == [article.title for article in articles]
+    assert not (tmp_path / "saved" / "news_scrape_result_scrape.jsonl").exists()
+
+
+def test_save_ignores_a_stale_spool(tmp_path):
+    repository = ExcelRepository(output_dir=tmp_path)
+    repository.append("scrape", [make_article(0)])
+
+    repository.save("scrape", [make_article(1), make_article(2)])
+
+    rows = read_rows(tmp_path / "news_scrape_result_scrape.xlsx")
+    assert [row[NEWS_COLUMNS.index("article_id")] for row in rows[1:]] == ["1", "2"]
@@ -0,0 +1,147 @@
+import importlib
+from datetime import date
+from itertools import count
+from requests.adapters import HTTPAdapter
+from adapters.http import http_cache
+from adapters.http.article_enricher import HttpArticleEnricher
+from adapters.http.http_cache import CachingAdapter, HttpCache
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+from adapters.http.session import build_session
+from core.domain.entities import NewsArticle
+
+ARTICLE_PAGE = b"""<html><head>
+<meta name="description" content="Shares rose as investors weighed a $1.5 billion facility."/>
+</head><body></body></html>"""
+ETAG = '"v1"'
+LAST_MODIFIED = "Thu, 18 Jul 2024 10:00:00 GMT"
+
+
+def counting_route(headers: dict):
+    """
+    Serves the article page with the given headers, counting the requests that reach the server.
+    """
+    served = []
+
+    def route(path: str):
+        served.append(path)
+        return ARTICLE_PAGE, "text/html; charset=utf-8", headers
+
+    return route, served
+
+
+def make_article(url: str) -> NewsArticle:
+    return NewsArticle(
+        article_id=url,
+        title="Markets weigh central bank outlook",
+        date=date.today(),
+        url=url,
+        image_path="",
+        selected_section="all",
+    )
+
+
+def test_stale_responses_are_revalidated_with_their_etag(serve, tmp_path):
+    route, served = counting_route({"ETag": ETAG})
+    url = f"{serve(route)}/article/"
+    cache = HttpCache(tmp_path)
+    session = build_session(cache=cache)
+    try:
+        first = session.get(url)
+        second = session.get(url)
+    finally:
+        session.close()
+        cache.close()
+
+    assert len(served) == 2
+    assert first.content == second.content == ARTICLE_PAGE
+    assert second.status_code == 200
+    assert second.headers["ETag"] == ETAG
+    stats = cache.stats()
+    assert (stats["misses"], stats["revalidated"], stats["fresh"]) == (1, 1, 0)
+
+
+def test_stale_responses_are_revalidated_with_their_last_modified_date(serve, tmp_path):
+    route, served = counting_route({"Last-Modified": LAST_MODIFIED})
+    url = f"{serve(route)}/article/"
+    cache = HttpCache(tmp_path)
+    session = build_session(cache=cache)
+    try:
+        session.get(url)
+        revalidated = session.get(url)
+    finally:
+        session.close()
+        cache.close()
+
+    assert len(served) == 2
+    assert revalidated.content == ARTICLE_PAGE
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_fresh_hits_skip_the_rate_limiter(serve, tmp_path):
+    route, served = counting_route({"Cache-Control": "max-age=600"})
+    url = f"{serve(route)}/article/"
+    cache = HttpCache(tmp_path)
+    limiter = AdaptiveRateLimiter()
+    enricher = HttpArticleEnricher(workers=2, limiter=limiter, cache=cache)
+    try:
+        enricher.enrich([make_article(url)])
+        rate = next(iter(limiter.stats().values()))["rate"]
+        article = make_article(url)
+        enricher.enrich([article])
+    finally:
+        enricher.close()
+        cache.close()
+
+    assert article.description.startswith("Shares rose")
+    assert len(served) == 1
+    assert cache.stats()["fresh"] == 1
+    host = next(iter(limiter.stats().values()))
+    assert host["requests"] == 1
+    assert host["rate"] == rate
+
+
+def test_least_recently_used_responses_are_evicted(monkeypatch, tmp_path):
+    monkeypatch.setattr(http_cache, "time", count(1000).__next__)
+    cache = HttpCache(tmp_path, max_bytes=2500)
+    body = bytes(1000)
+    try:
+        cache.store("https://example.com/a", body, {"ETag": '"a"'})
+        cache.store("https://example.com/b", body, {"ETag": '"b"'})
+        # reading a makes b the least recently used response
+        assert cache.lookup("https://example.com/a") is not None
+        cache.store("https://example.com/c", body, {"ETag": '"c"'})
+
+        assert cache.lookup("https://example.com/b") is None
+        assert cache.lookup("https://example.com/a") is not None
+        assert cache.lookup("https://example.com/c") is not None
+        assert cache.stats()["evicted"] == 1
+        assert cache.stats()["bytes"] == 2000
+        assert not (tmp_path / http_cache.hashlib.sha256(b"https://example.com/b").hexdigest()).exists()
+    finally:
+        cache.close()
+
+
+def test_the_cache_is_off_by_default(monkeypatch, serve, tmp_path):
+    monkeypatch.setenv("ROBOT_ARTIFACTS", str(tmp_path))
+    monkeypatch.delenv("HTTP_CACHE", raising=False)
+    tasks = importlib.import_module("tasks")
+    assert tasks.get_http_cache() is None
+
+    route, served = counting_route({"Cache-Control": "max-age=600"})
+    url = f"{serve(route)}/article/"
+    enricher = HttpArticleEnricher(workers=2, cache=tasks.get_http_cache())
+    try:
+        assert type(enricher.session.get_adapter(url)) is HTTPAdapter
+        enricher.enrich([make_article(url)])
+        enricher.enrich([make_article(url)])
+    finally:
+        enricher.close()
+    assert len(served) == 2
+
+    monkeypatch.setenv("HTTP_CACHE", "true")
+    monkeypatch.setenv("HTTP_CACHE_DIR", str(tmp_path / "http"))
+    cache = tasks.get_http_cache()
+    try:
+        assert isinstance(build_session(cache=cache).get_adapter(url), CachingAdapter)
+    finally:
+        cache.close()
@@ -0,0 +1,99 @@
+from datetime import date
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+from adapters.scraping.http_scraper import HttpScraper
+from core.domain.interfaces import ScrapeInterrupted
+from conftest import FIXTURES_DIR
+
+SEARCH_PATH = "/site-search/?query={}&section={}&offset={}&date=any_time&sort=newest"
+JPEG = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00" + bytes(1024)
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(1024)
+
+
+class SavedPages:
+    """
+    Serves the saved Reuters result pages of `fixtures/reuters` and their thumbnails, recording the
+    requested search offsets.
+    """
+
+    def __init__(self) -> None:
+        self.offsets = []
+
+    def __call__(self, path: str):
+        url = urlsplit(path)
+        if url.path.startswith("/resizer/"):
+            return (PNG, "image/png") if url.path.endswith(".png") else (JPEG, "image/jpeg")
+        if url.path.startswith("/site-search/"):
+            offset = int(parse_qs(url.query)["offset"][0])
+            self.offsets.append(offset)
+            page = FIXTURES_DIR / "reuters" / f"search_{offset}.html"
+            return (page.read_bytes(), "text/html; charset=utf-8") if page.exists() else None
+        return None
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    def build(base_url: str) -> HttpScraper:
+        return HttpScraper(
+            base_url=base_url + SEARCH_PATH,
+            limiter=AdaptiveRateLimiter(rate=100, burst=100, max_retries=0),
+            output_dir=tmp_path,
+        )
+
+    return build
+
+
+def test_parses_saved_result_pages(serve, scraper):
+    pages = SavedPages()
+    base_url = serve(pages)
+    http_scraper = scraper(base_url)
+    try:
+        articles = http_scraper.scrape_news("scrape", "central bank", date(2024, 7, 1), "all")
+    finally:
+        http_scraper.close()
+
+    # the second page ends with an article older than the earliest date, so the scrape stops there
+    assert pages.offsets == [0, 20]
+    assert [article.title for article in articles] == [
+        "ECB holds rates steady as inflation cools",
+        "Banks brace for central bank stress test",
+        "Yields fall after Fed minutes",
+        "Central banks weigh climate risks",
+    ]
+    assert [article.date for article in articles] == [
+        date(2024, 7, 18),
+        date(2024, 7, 17),
+        date(2024, 7, 16),
+        date(2024, 7, 10),
+    ]
+    assert articles[0].url == f"{base_url}/world/europe/ecb-holds-rates-steady-as-inflation-cools-2024-07-18/"
+    assert articles[2].url == "https://www.reuters.com/markets/rates-bonds/yields-fall-after-fed-minutes-2024-07-16/"
+    assert [article.extracted_section for article in articles] == ["World", "Business", "Markets", "Sustainability"]
+    assert {article.selected_section for article in articles} == {"all"}
+    assert len({article.article_id for article in articles}) == len(articles)
+
+    ecb, banks, yields, climate = articles
+    assert Path(ecb.image_path).read_bytes() == JPEG
+    assert ecb.image_path.endswith(".jpg")
+    assert yields.image_path.endswith(".png")
+    assert Path(climate.image_path).exists()
+    assert banks.image_path == ""
+
+
+def test_unreachable_results_page_interrupts_the_scrape(serve, scraper):
+    http_scraper = scraper(serve(lambda path: None))
+    try:
+        with pytest.raises(ScrapeInterrupted):
+            list(http_scraper.iter_news("scrape", "central bank", date(2024, 7, 1)))
+    finally:
+        http_scraper.close()
+
+
+def test_empty_results_page_ends_the_scrape(serve, scraper):
+    http_scraper = scraper(serve(lambda path: (b"", "text/html") if path.startswith("/site-search/") else None))
+    try:
+        assert http_scraper.scrape_news("scrape", "central bank", date(2024, 7, 1), "all") == []
+    finally:
+        http_scraper.close()
@@ -0,0 +1,59 @@
+from datetime import date
+from adapters.persistence.json_checkpoint import JsonCheckpointStore
+from core.domain.entities import NewsArticle
+
+
+def make_article(i: int) -> NewsArticle:
+    return NewsArticle(
+        article_id=str(i),
+        title=f"Markets weigh central bank outlook {i} – €",
+        date=date(2024, 7, 1 + i),
+        url=f"https://www.reuters.com/markets/article-{i}/",
+        image_path=f"output/{i}.jpg",
+        selected_section="business",
+        contains_money=True,
+        phrase_matches={"central bank": 1},
+        currencies=["EUR"],
+    )
+
+
+def test_load_without_checkpoint(tmp_path):
+    assert JsonCheckpointStore(tmp_path).load("scrape") is None
+
+
+def test_pages_round_trip(tmp_path):
+    store = JsonCheckpointStore(tmp_path)
+
+    store.save_page("scrape", 20, [make_article(0), make_article(1)])
+    store.save_page("scrape", 40, [make_article(2)])
+
+    progress = JsonCheckpointStore(tmp_path).load("scrape")
+    assert progress.next_offset == 40
+    assert progress.articles == [make_article(0), make_article(1), make_article(2)]
+    assert store.load("other") is None
+
+
+def test_articles_written_after_the_last_completed_page_are_ignored(tmp_path):
+    store = JsonCheckpointStore(tmp_path)
+    store.save_page("scrape", 20, [make_article(0)])
+    # a crash while writing the next page leaves part of its articles behind the progress file
+    with open(tmp_path / "scrape" / "articles.jsonl", "a", encoding="utf-8") as file:
+        file.write('{"article_id": "1", "tit')
+
+    assert store.load("scrape").articles == [make_article(0)]
+
+    store.save_page("scrape", 40, [make_article(1)])
+    assert store.load("scrape").articles == [make_article(0), make_article(1)]
+
+
+def test_clear_removes_the_checkpoint(tmp_path):
+    store = JsonCheckpointStore(tmp_path)
+    store.save_page("scrape", 20, [make_article(0)])
+    store.save_page("other", 20, [make_article(1)])
+
+    store.clear("scrape")
+    store.clear("missing")
+
+    assert store.load("scrape") is None
+    assert not (tmp_path / "scrape").exists()
+    assert store.load("other").articles == [make_article(1)]
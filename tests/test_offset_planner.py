@@ -0,0 +1,54 @@
+from datetime import date, timedelta
+from core.domain.offset_planner import OffsetPlanner
+
+PAGE_SIZE = 20
+LATEST = date(2024, 7, 31)
+# 100 pages, each one day older than the previous one
+DATES = [LATEST - timedelta(days=offset // PAGE_SIZE) for offset in range(100 * PAGE_SIZE)]
+
+
+class Probe:
+    """
+    Returns the date of the oldest article of a page of DATES, recording the probed offsets.
+    """
+
+    def __init__(self) -> None:
+        self.offsets = []
+
+    def __call__(self, offset: int):
+        self.offsets.append(offset)
+        page = DATES[offset : offset + PAGE_SIZE]
+        return page[-1] if page else None
+
+
+def test_plans_every_page_up_to_the_cutoff_page():
+    probe = Probe()
+    planner = OffsetPlanner(probe, PAGE_SIZE)
+
+    # page 40 is the first page with an article older than the earliest date
+    offsets = planner.plan(len(DATES), LATEST - timedelta(days=39))
+
+    assert offsets == list(range(0, 40 * PAGE_SIZE + 1, PAGE_SIZE))
+    assert planner.probes == len(probe.offsets) <= 7
+
+
+def test_plans_the_last_page_when_no_page_crosses_the_earliest_date():
+    planner = OffsetPlanner(Probe(), PAGE_SIZE)
+
+    assert planner.cutoff_offset(len(DATES), date(2020, 1, 1)) == 99 * PAGE_SIZE
+
+
+def test_resumed_plan_does_not_probe_the_pages_already_passed():
+    probe = Probe()
+    planner = OffsetPlanner(probe, PAGE_SIZE)
+
+    offsets = planner.plan(len(DATES), LATEST - timedelta(days=59), start_offset=50 * PAGE_SIZE)
+
+    assert offsets == list(range(50 * PAGE_SIZE, 60 * PAGE_SIZE + 1, PAGE_SIZE))
+    assert min(probe.offsets) >= 50 * PAGE_SIZE
+
+
+def test_start_offset_past_the_cutoff_plans_only_the_start_page():
+    planner = OffsetPlanner(Probe(), PAGE_SIZE)
+
+    assert planner.plan(len(DATES), LATEST - timedelta(days=5), start_offset=80 * PAGE_SIZE) == [80 * PAGE_SIZE]
@@ -0,0 +1,37 @@
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from adapters.persistence.parquet_repository import ParquetRepository  # noqa: E402
+from adapters.persistence.schema import NEWS_COLUMNS  # noqa: E402
+from core.domain.batch import NewsBatch  # noqa: E402
+from test_excel_repository import make_article  # noqa: E402
+
+
+def test_every_append_is_written_as_row_groups(tmp_path):
+    repository = ParquetRepository(row_group_size=2, output_dir=tmp_path)
+    output_path = tmp_path / "news_scrape_result_scrape.parquet"
+
+    repository.append("scrape", [make_article(0)])
+    size = output_path.stat().st_size
+    repository.append("scrape", NewsBatch.from_articles(make_article(i) for i in range(1, 4)))
+    assert output_path.stat().st_size > size
+    repository.close("scrape")
+
+    parquet_file = pq.ParquetFile(output_path)
+    assert [parquet_file.metadata.row_group(i).num_rows for i in range(parquet_file.num_row_groups)] == [1, 2, 1]
+    table = parquet_file.read()
+    assert table.column_names == NEWS_COLUMNS
+    assert table.column("article_id").to_pylist() == ["0", "1", "2", "3"]
+
+
+def test_discard_removes_the_partial_output(tmp_path):
+    repository = ParquetRepository(output_dir=tmp_path)
+    repository.append("scrape", [make_article(0), make_article(1)])
+
+    repository.discard("scrape")
+    repository.append("scrape", [make_article(2)])
+    repository.close("scrape")
+
+    table = pq.read_table(tmp_path / "news_scrape_result_scrape.parquet")
+    assert table.column("article_id").to_pylist() == ["2"]
@@ -0,0 +1,171 @@
+from threading import Event, Thread
+import pytest
+from adapters.http.rate_limiter import AdaptiveRateLimiter
+
+URL = "https://www.reuters.com/site-search/?query=bank"
+OTHER_URL = "https://cdn.reuters.com/image.jpg"
+
+
+class FakeClock:
+    """
+    A clock that only moves when the limiter sleeps or a request takes time, recording the sleeps.
+    """
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class HighestRandom:
+    """
+    Draws the upper bound of every jitter range.
+    """
+
+    def uniform(self, low: float, high: float) -> float:
+        return high
+
+
+class Throttled(Exception):
+    pass
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def limiter(clock: FakeClock, **kwargs) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep, rng=HighestRandom(), **kwargs)
+
+
+def test_token_bucket_grants_the_burst_then_paces_at_the_rate(clock):
+    rate_limiter = limiter(clock, rate=2.0, burst=3)
+
+    for _ in range(5):
+        rate_limiter.acquire(URL)
+    assert clock.sleeps == [0.5, 0.5]
+
+    clock.now += 10
+    for _ in range(3):
+        rate_limiter.acquire(URL)
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_every_host_has_its_own_bucket(clock):
+    rate_limiter = limiter(clock, rate=1.0, burst=1)
+
+    rate_limiter.acquire(URL)
+    rate_limiter.acquire(OTHER_URL)
+    assert clock.sleeps == []
+
+    rate_limiter.acquire(URL)
+    assert clock.sleeps == [1.0]
+
+
+def test_errors_halve_the_rate_and_concurrency_down_to_their_floors(clock):
+    rate_limiter = limiter(clock, rate=2.0, concurrency=4, min_rate=0.5)
+
+    rate_limiter.record(URL, 1.0, ok=False)
+    stats = rate_limiter.stats()["www.reuters.com"]
+    assert (stats["rate"], stats["concurrency"], stats["requests"], stats["errors"]) == (1.0, 2.0, 1, 1)
+
+    for _ in range(3):
+        rate_limiter.record(URL, 1.0, ok=False)
+    stats = rate_limiter.stats()["www.reuters.com"]
+    assert (stats["rate"], stats["concurrency"], stats["errors"]) == (0.5, 1.0, 4)
+
+
+def test_fast_successes_raise_the_pace_additively_up_to_the_maximum(clock):
+    rate_limiter = limiter(clock, rate=2.0, concurrency=2, max_rate=2.5, max_concurrency=3, target_latency=1.0)
+
+    rate_limiter.record(URL, 0.2, ok=True)
+    stats = rate_limiter.stats()["www.reuters.com"]
+    assert (stats["rate"], stats["concurrency"]) == (2.2, 2.5)
+
+    for _ in range(20):
+        rate_limiter.record(URL, 0.2, ok=True)
+    stats = rate_limiter.stats()["www.reuters.com"]
+    assert (stats["rate"], stats["concurrency"]) == (2.5, 3)
+
+
+def test_slow_successes_lower_the_concurrency_only(clock):
+    rate_limiter = limiter(clock, rate=2.0, concurrency=4, target_latency=1.0)
+
+    rate_limiter.record(URL, 3.0, ok=True)
+
+    stats = rate_limiter.stats()["www.reuters.com"]
+    assert (stats["rate"], stats["concurrency"], stats["latency"]) == (2.0, 3.6, 3.0)
+
+
+def test_backoff_is_jittered_below_an_exponential_cap(clock):
+    rate_limiter = limiter(clock, backoff_base=0.5, backoff_max=10)
+
+    assert [rate_limiter.backoff(attempt) for attempt in range(7)] == [0.5, 1, 2, 4, 8, 10, 10]
+
+    seeded = AdaptiveRateLimiter(backoff_base=0.5, backoff_max=10)
+    assert all(0 <= seeded.backoff(attempt) <= min(10, 0.5 * 2**attempt) for attempt in range(50))
+
+
+def test_call_retries_retryable_errors_after_the_backoff(clock):
+    rate_limiter = limiter(clock, rate=100, burst=100, max_retries=3, backoff_base=1.0)
+    outcomes = [Throttled("429"), Throttled("429"), "page"]
+
+    def request():
+        clock.now += 0.25
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert rate_limiter.call(URL, request, lambda error: isinstance(error, Throttled)) == "page"
+    assert clock.sleeps == [1.0, 2.0]
+    stats = rate_limiter.stats()["www.reuters.com"]
+    assert (stats["requests"], stats["errors"], stats["retries"]) == (3, 2, 2)
+
+
+def test_call_raises_once_the_retries_are_exhausted(clock):
+    rate_limiter = limiter(clock, rate=100, burst=100, max_retries=2)
+    attempts = []
+
+    def request():
+        attempts.append(clock.now)
+        raise Throttled("503")
+
+    with pytest.raises(Throttled):
+        rate_limiter.call(URL, request, lambda error: True)
+    assert len(attempts) == 3
+    assert clock.sleeps == [1.0, 2.0]
+
+
+def test_call_raises_other_errors_at_once(clock):
+    rate_limiter = limiter(clock, rate=100, burst=100)
+
+    with pytest.raises(ValueError):
+        rate_limiter.call(URL, lambda: int("not a number"), lambda error: isinstance(error, Throttled))
+    assert clock.sleeps == []
+    assert rate_limiter.stats()["www.reuters.com"]["requests"] == 0
+
+
+def test_slots_bound_the_concurrent_requests_of_a_host(clock):
+    rate_limiter = limiter(clock, rate=100, burst=100, concurrency=2)
+    entered = Event()
+
+    def third_request():
+        with rate_limiter.slot(URL):
+            entered.set()
+
+    with rate_limiter.slot(URL), rate_limiter.slot(URL):
+        with rate_limiter.slot(OTHER_URL):
+            pass
+        thread = Thread(target=third_request)
+        thread.start()
+        assert not entered.wait(0.2)
+    assert entered.wait(5)
+    thread.join()
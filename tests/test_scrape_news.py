@@ -0,0 +1,174 @@
+from datetime import date
+from typing import Iterator, List, Optional
+import pytest
+from adapters.persistence.csv_repository import CsvRepository
+from adapters.persistence.json_checkpoint import JsonCheckpointStore
+from adapters.persistence.sqlite_duplicate_index import SqliteDuplicateIndex
+from core.application.scrape_news import ScrapeNews
+from core.domain.entities import NewsArticle
+from core.domain.interfaces import ScrapeInterrupted, StreamingRespository, StreamingScraper
+
+
+def make_article(i: int) -> NewsArticle:
+    return NewsArticle(
+        article_id=str(i),
+        title=f"Markets weigh central bank outlook {i}",
+        date=date.today(),
+        url=f"https://www.reuters.com/markets/article-{i}/",
+        image_path="",
+        selected_section="all",
+    )
+
+
+class ListScraper(StreamingScraper):
+    """
+    Yields a fixed list of articles, then raises `error` if given.
+    """
+
+    def __init__(self, articles: List[NewsArticle], error: Optional[Exception] = None) -> None:
+        self.articles = articles
+        self.error = error
+
+    def iter_news(self, scrape_id, search_phrase, earliest_date, section="all", **kwargs) -> Iterator[NewsArticle]:
+        yield from self.articles
+        if self.error is not None:
+            raise self.error
+
+
+class MemoryRepository(StreamingRespository):
+    """
+    Keeps the appended chunks in memory, failing the appends whose number is in `failing`.
+    """
+
+    def __init__(self, failing=()) -> None:
+        self.failing = set(failing)
+        self.chunks: List[List[str]] = []
+        self.appends = 0
+        self.closed = False
+
+    def append(self, scrape_id, news_list):
+        self.appends += 1
+        if self.appends in self.failing:
+            raise OSError("disk full")
+        self.chunks.append([article.article_id for article in news_list])
+
+    def close(self, scrape_id):
+        self.closed = True
+
+
+def scrape(scraper: StreamingScraper, repository: MemoryRepository) -> ScrapeNews:
+    scrape_app = ScrapeNews(scraper, repository, chunk_size=2, scrape_id="scrape")
+    scrape_app.scrape_and_save("central bank", 1)
+    return scrape_app
+
+
+def test_streams_every_chunk_and_the_leftovers():
+    repository = MemoryRepository()
+    scrape(ListScraper([make_article(i) for i in range(5)]), repository)
+
+    assert repository.chunks == [["0", "1"], ["2", "3"], ["4"]]
+    assert repository.closed
+
+
+def test_saves_the_leftovers_of_an_interrupted_scrape():
+    repository = MemoryRepository()
+    scrape_app = scrape(ListScraper([make_article(i) for i in range(3)], ScrapeInterrupted("page 2")), repository)
+
+    assert scrape_app.interrupted
+    assert repository.chunks == [["0", "1"], ["2"]]
+
+
+def test_failed_chunk_is_not_saved_again():
+    repository = MemoryRepository(failing={2})
+    with pytest.raises(OSError, match="disk full"):
+        scrape(ListScraper([make_article(i) for i in range(5)]), repository)
+
+    assert repository.appends == 2
+    assert repository.chunks == [["0", "1"]]
+    assert repository.closed
+
+
+def test_scrape_failure_does_not_save_the_leftovers():
+    repository = MemoryRepository()
+    with pytest.raises(RuntimeError):
+        scrape(ListScraper([make_article(i) for i in range(3)], RuntimeError("browser crashed")), repository)
+
+    assert repository.chunks == [["0", "1"]]
+
+
+class DedupScraper(ListScraper):
+    """
+    Checks every article against the duplicate index before yielding it, like the real scrapers.
+    """
+
+    def iter_news(self, scrape_id, search_phrase, earliest_date, section="all", **kwargs) -> Iterator[NewsArticle]:
+        for article in super().iter_news(scrape_id, search_phrase, earliest_date, section):
+            kwargs["duplicate_index"].find_duplicate(scrape_id, article)
+            yield article
+
+
+def test_failed_scrape_releases_its_unsaved_reservations(tmp_path):
+    duplicate_index = SqliteDuplicateIndex(tmp_path / "duplicates.sqlite3")
+    scrape_app = ScrapeNews(
+        DedupScraper([make_article(i) for i in range(3)], RuntimeError("browser crashed")),
+        MemoryRepository(),
+        chunk_size=2,
+        scrape_id="scrape",
+        duplicate_index=duplicate_index,
+    )
+    with pytest.raises(RuntimeError):
+        scrape_app.scrape_and_save("central bank", 1)
+
+    assert not duplicate_index._reserved
+    indexed = duplicate_index._connection.execute("SELECT url FROM indexed_articles ORDER BY id").fetchall()
+    assert [url for (url,) in indexed] == [make_article(0).url, make_article(1).url]
+    duplicate_index.close()
+
+
+class PagedScraper(StreamingScraper):
+    """
+    Yields pages of two articles, checkpointing them like the real scrapers, and is interrupted before
+    the page at `interrupt_at` until it is cleared.
+    """
+
+    def __init__(self, pages: int, interrupt_at: Optional[int] = None) -> None:
+        self.pages = pages
+        self.interrupt_at = interrupt_at
+        self.fetched: List[int] = []
+
+    def iter_news(self, scrape_id, search_phrase, earliest_date, section="all", checkpoint=None, **kwargs):
+        offset = 0
+        progress = checkpoint.load(scrape_id) if checkpoint is not None else None
+        if progress is not None:
+            yield from progress.articles
+            offset = progress.next_offset
+        while offset < self.pages * 20:
+            if offset == self.interrupt_at:
+                raise ScrapeInterrupted(f"Results page in offset {offset} did not load.")
+            self.fetched.append(offset)
+            page_articles = [make_article(offset + i) for i in range(2)]
+            if checkpoint is not None:
+                checkpoint.save_page(scrape_id, offset + 20, page_articles)
+            yield from page_articles
+            offset += 20
+
+
+def test_resumes_an_interrupted_scrape_from_its_checkpoint(tmp_path):
+    checkpoint = JsonCheckpointStore(tmp_path / "checkpoints")
+    repository = CsvRepository(output_dir=tmp_path)
+    scraper = PagedScraper(pages=4, interrupt_at=40)
+
+    interrupted = ScrapeNews(scraper, repository, chunk_size=3, checkpoint=checkpoint, scrape_id="scrape")
+    interrupted.scrape_and_save("central bank", 1)
+    assert interrupted.interrupted
+    assert checkpoint.load("scrape").next_offset == 40
+
+    scraper.interrupt_at = None
+    resumed = ScrapeNews(scraper, repository, chunk_size=3, checkpoint=checkpoint, scrape_id="scrape")
+    resumed.scrape_and_save("central bank", 1)
+
+    assert not resumed.interrupted
+    assert scraper.fetched == [0, 20, 40, 60]
+    assert checkpoint.load("scrape") is None
+    rows = (tmp_path / "news_scrape_result_scrape.csv").read_text(encoding="utf-8").splitlines()
+    assert [row.split(",")[0] for row in rows[1:]] == ["0", "1", "20", "21", "40", "41", "60", "61"]
@@ -0,0 +1,91 @@
+import json
+from datetime import date
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+import pytest
+
+pytest.importorskip("RPA.Browser.Selenium")
+
+from adapters.http.rate_limiter import AdaptiveRateLimiter  # noqa: E402
+from adapters.persistence.json_checkpoint import JsonCheckpointStore  # noqa: E402
+from adapters.scraping import browser_session  # noqa: E402
+from adapters.scraping.selenium_scraper import SeleniumScraper  # noqa: E402
+from adapters.scraping.thumbnail_downloader import ThumbnailDownloader  # noqa: E402
+
+TOTAL_RESULTS = 100
+
+
+class FakeDriver:
+    """
+    Serves two results per search page, recording the offset of every page load.
+    """
+
+    loaded = []
+
+    def __init__(self) -> None:
+        self.current_url = ""
+
+    def get(self, url: str):
+        self.current_url = url
+        FakeDriver.loaded.append(self.offset)
+
+    @property
+    def offset(self) -> int:
+        return int(parse_qs(urlsplit(self.current_url).query)["offset"][0])
+
+    def find_element(self, by, value):
+        return object()
+
+    def execute_script(self, script, *args):
+        items = [
+            {
+                "title": f"Story {self.offset} {i}",
+                "href": f"https://www.reuters.com/world/story-{self.offset}-{i}-2024-07-18/",
+                "section": "World",
+                "date": None,
+                "image": None,
+            }
+            for i in range(2)
+        ]
+        return json.dumps(items)
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def scraper(monkeypatch, tmp_path):
+    FakeDriver.loaded = []
+    monkeypatch.setattr(browser_session, "ensure_display", lambda: None)
+    monkeypatch.setattr(browser_session, "new_chrome_driver", FakeDriver)
+
+    main = FakeDriver()
+    monkeypatch.setattr(SeleniumScraper, "driver", property(lambda self: main))
+    selenium_scraper = SeleniumScraper(page_workers=3, limiter=AdaptiveRateLimiter(rate=100, burst=100))
+    selenium_scraper.browser = SimpleNamespace(driver=main, execute_javascript=lambda script: None)
+    selenium_scraper._navigate = main.get
+    selenium_scraper._await_results = lambda url, offset: None
+    selenium_scraper._total_results = lambda: TOTAL_RESULTS
+    selenium_scraper._downloader = ThumbnailDownloader(tmp_path)
+    yield selenium_scraper
+    selenium_scraper.close()
+
+
+def test_resume_after_parallel_pages_does_not_scrape_them_again(scraper, tmp_path):
+    checkpoint = JsonCheckpointStore(tmp_path / "checkpoints")
+    articles = scraper.iter_news("scrape", "central bank", date(2024, 7, 1), checkpoint=checkpoint)
+    # the consumer fails after the first articles, once every page is in the checkpoint
+    first = [next(articles) for _ in range(3)]
+    articles.close()
+    assert sorted(FakeDriver.loaded) == [0, 20, 40, 60, 80]
+
+    progress = checkpoint.load("scrape")
+    assert progress.next_offset == TOTAL_RESULTS
+    assert len(progress.articles) == 10
+
+    FakeDriver.loaded = []
+    resumed = list(scraper.iter_news("scrape", "central bank", date(2024, 7, 1), checkpoint=checkpoint))
+
+    assert FakeDriver.loaded == [TOTAL_RESULTS]
+    assert [article.url for article in resumed[:3]] == [article.url for article in first]
+    assert len({article.url for article in resumed}) == len(resumed) == 10
@@ -0,0 +1,65 @@
+from datetime import date
+from typing import List
+import pytest
+from core.application.sharded_scrape import merge_shards, plan_shards
+from core.domain.entities import NewsArticle, ScrapeShard
+
+
+def make_articles(*numbers: int) -> List[NewsArticle]:
+    return [
+        NewsArticle(
+            article_id=f"id-{number}",
+            title=f"Story {number}",
+            date=date(2024, 7, 1),
+            url=f"https://www.reuters.com/world/story-{number}-2024-07-01/",
+            image_path="",
+            selected_section="all",
+        )
+        for number in numbers
+    ]
+
+
+def test_plans_contiguous_shards_covering_every_result():
+    shards = plan_shards("scrape", 1050, 500)
+
+    assert shards == [
+        ScrapeShard("scrape", "scrape-000", 0, 500, 3),
+        ScrapeShard("scrape", "scrape-001", 500, 1000, 3),
+        ScrapeShard("scrape", "scrape-002", 1000, 1050, 3),
+    ]
+
+
+def test_plans_one_shard_for_an_empty_or_unknown_search():
+    assert plan_shards("scrape", 0, 500) == [ScrapeShard("scrape", "scrape-000", 0, 0, 1)]
+    assert plan_shards("scrape", None, 500) == [ScrapeShard("scrape", "scrape-000", 0, None, 1)]
+
+
+def test_rejects_a_shard_size_that_is_not_positive():
+    with pytest.raises(ValueError):
+        plan_shards("scrape", 100, 0)
+
+
+def test_merges_overlapping_shards_keeping_the_first_article_of_each_url():
+    # articles published during the scrape shift the results, so the second shard starts with 3 and 4 again
+    first, second, third = make_articles(1, 2, 3, 4), make_articles(3, 4, 5, 6), make_articles(6, 7)
+    second[0].article_id = "id-3-again"
+
+    merged = merge_shards([first, second, third])
+
+    assert [article.title for article in merged] == [f"Story {number}" for number in range(1, 8)]
+    assert merged[2] is first[2]
+    assert "id-3-again" not in {article.article_id for article in merged}
+
+
+def test_drops_duplicate_urls_within_a_shard():
+    articles = make_articles(1, 2, 2, 3)
+
+    assert [article.title for article in merge_shards([articles])] == ["Story 1", "Story 2", "Story 3"]
+
+
+def test_merges_the_shards_that_arrived_without_filling_the_missing_one():
+    # the middle shard never arrived, its results are not made up from its neighbours
+    merged = merge_shards([make_articles(1, 2), [], make_articles(5, 6)])
+
+    assert [article.title for article in merged] == ["Story 1", "Story 2", "Story 5", "Story 6"]
+    assert merge_shards([]) == []
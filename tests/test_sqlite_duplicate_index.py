@@ -0,0 +1,60 @@
+from datetime import date
+import pytest
+from adapters.persistence.sqlite_duplicate_index import SqliteDuplicateIndex
+from core.domain.entities import NewsArticle
+
+
+def make_article(url: str, title: str) -> NewsArticle:
+    return NewsArticle(
+        article_id=url,
+        title=title,
+        date=date(2024, 7, 1),
+        url=f"https://www.reuters.com/{url}/",
+        image_path="",
+        selected_section="all",
+    )
+
+
+STORY = "Central bank holds rates steady as inflation cools across the euro zone"
+EDITED = "Central bank holds rates steady as inflation cools across euro zone"
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SqliteDuplicateIndex(tmp_path / "duplicates.sqlite3")
+    yield index
+    index.close()
+
+
+def test_finds_copies_reserved_by_the_same_scrape(index):
+    assert index.find_duplicate("s1", make_article("world/a", STORY)) is None
+
+    assert index.find_duplicate("s1", make_article("business/b", EDITED)) == "https://www.reuters.com/world/a/"
+    assert index.find_duplicate("s1", make_article("world/a", STORY)) is None
+
+
+def test_ignores_the_reservations_of_other_scrapes(index):
+    index.find_duplicate("s1", make_article("world/a", STORY))
+
+    assert index.find_duplicate("s2", make_article("world/a", STORY)) is None
+    assert index.find_duplicate("s3", make_article("business/b", EDITED)) is None
+
+
+def test_released_articles_are_not_indexed(index):
+    index.find_duplicate("s1", make_article("world/a", STORY))
+    index.release("s1")
+    index.add("s1", [])
+
+    assert index.find_duplicate("s2", make_article("business/b", EDITED)) is None
+    assert not index._reserved.get("s1")
+
+
+def test_saved_articles_are_duplicates_for_later_scrapes(index):
+    article = make_article("world/a", STORY)
+    index.find_duplicate("s1", article)
+    index.add("s1", [article])
+    index.release("s1")
+
+    assert index.find_duplicate("s2", make_article("business/b", EDITED)) == "https://www.reuters.com/world/a/"
+    assert index.find_duplicate("s2", make_article("world/a", STORY)) == "https://www.reuters.com/world/a/"
+    assert index.find_duplicate("s1", make_article("world/a", STORY)) is None
@@ -0,0 +1,81 @@
+import sqlite3
+from dataclasses import replace
+from datetime import date
+import pytest
+from adapters.persistence.sqlite_repository import SqliteRepository
+from core.domain.batch import NewsBatch
+from core.domain.entities import NewsArticle
+
+
+def make_article(i: int, section: str = "business", contains_money: bool = False) -> NewsArticle:
+    return NewsArticle(
+        article_id=str(i),
+        title=f"Markets weigh central bank outlook {i}",
+        date=date(2024, 7, 1 + i),
+        url=f"https://www.reuters.com/markets/article-{i}/",
+        image_path=f"output/{i}.jpg",
+        selected_section=section,
+        contains_money=contains_money,
+        phrase_matches={"central bank": i},
+        currencies=["USD"] if contains_money else [],
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = SqliteRepository(tmp_path / "news.sqlite3")
+    yield repository
+    repository.close_connection()
+
+
+def test_upserts_articles_by_url(repository):
+    repository.append("first", [make_article(0), make_article(1)])
+    repository.append("second", NewsBatch.from_articles([replace(make_article(1), title="Updated title")]))
+
+    articles = repository.query()
+
+    assert [(article.article_id, article.title) for article in articles] == [
+        ("1", "Updated title"),
+        ("0", "Markets weigh central bank outlook 0"),
+    ]
+    assert [article.article_id for article in repository.query(scrape_id="first")] == ["0"]
+    assert [article.article_id for article in repository.query(scrape_id="second")] == ["1"]
+
+
+def test_queries_filter_and_order_newest_first(repository):
+    repository.save(
+        "scrape",
+        [
+            make_article(0, "business", contains_money=True),
+            make_article(1, "world", contains_money=True),
+            make_article(2, "business"),
+            make_article(3, "business", contains_money=True),
+        ],
+    )
+
+    money = repository.query(section="business", contains_money=True)
+    assert [article.article_id for article in money] == ["3", "0"]
+    assert money[0] == make_article(3, "business", contains_money=True)
+    assert [article.article_id for article in repository.query(contains_money=False)] == ["2"]
+    assert [article.article_id for article in repository.query(since=date(2024, 7, 2), until=date(2024, 7, 3))] == [
+        "2",
+        "1",
+    ]
+    assert [article.article_id for article in repository.query(limit=2)] == ["3", "2"]
+
+
+def test_query_batch_reads_the_same_articles(repository):
+    repository.save("scrape", [make_article(i, contains_money=i % 2 == 0) for i in range(5)])
+
+    batch = repository.query_batch(since=date(2024, 7, 2))
+
+    assert isinstance(batch, NewsBatch)
+    assert list(batch) == repository.query(since=date(2024, 7, 2))
+
+
+def test_close_connection_closes_the_database(tmp_path):
+    repository = SqliteRepository(tmp_path / "news.sqlite3")
+    repository.close_connection()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        repository.query()
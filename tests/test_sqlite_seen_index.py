@@ -0,0 +1,51 @@
+from datetime import date
+from adapters.persistence.image_archive import ImageArchive
+from adapters.persistence.sqlite_seen_index import SqliteSeenIndex
+from core.domain.entities import NewsArticle
+
+JPEG = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00" + bytes(64)
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(64)
+
+
+def make_article(url: str, image_path: str) -> NewsArticle:
+    return NewsArticle(
+        article_id=url,
+        title="Markets weigh central bank outlook",
+        date=date.today(),
+        url=url,
+        image_path=image_path,
+        selected_section="all",
+    )
+
+
+def test_reuses_thumbnails_saved_as_files_and_in_archives(tmp_path):
+    archive = ImageArchive(tmp_path, "first")
+    archived = archive.add(JPEG)
+    archive.close()
+    image_file = tmp_path / "thumbnail.jpg"
+    image_file.write_bytes(JPEG)
+
+    seen_index = SqliteSeenIndex(tmp_path / "seen.sqlite3")
+    seen_index.mark_seen(
+        "central bank",
+        "all",
+        [
+            make_article("archived", archived),
+            make_article("file", str(image_file)),
+            make_article("missing-member", f"{archive.path}/missing.jpg"),
+            make_article("missing-archive", str(tmp_path / "images_gone.tar" / "missing.jpg")),
+        ],
+    )
+
+    assert seen_index.image_path("archived") == archived
+    assert seen_index.image_path("file") == str(image_file)
+    assert seen_index.image_path("missing-member") is None
+    assert seen_index.image_path("missing-archive") is None
+
+    # a resumed scrape appends to the same archive, its new members are found too
+    archive = ImageArchive(tmp_path, "first")
+    appended = archive.add(PNG)
+    archive.close()
+    seen_index.mark_seen("central bank", "all", [make_article("appended", appended)])
+    assert seen_index.image_path("appended") == appended
+    seen_index.close()
@@ -0,0 +1,91 @@
+from datetime import date
+import pytest
+from core.domain.batch import NewsBatch
+from core.domain.entities import NewsArticle
+from core.domain.term_matcher import TermMatcher
+
+
+@pytest.mark.parametrize(
+    "text, currencies",
+    [
+        ("The fund raised EUR 5 million", ["EUR"]),
+        ("The fund raised 5 million EUR", ["EUR"]),
+        ("A USD 1.2 billion bond", ["USD"]),
+        ("A 1.2 billion USD bond", ["USD"]),
+        ("Fined GBP 300,000", ["GBP"]),
+        ("Costs JPY 10 bln", ["JPY"]),
+        ("Exports of CNY 2 trillion", ["CNY"]),
+        ("A BRL 40 million deal", ["BRL"]),
+        ("Shares hit $11.50", ["USD"]),
+        ("Sold for US$ 3 million", ["USD"]),
+        ("Raised €40m and £2.5bn", ["EUR", "GBP"]),
+        ("Priced at ¥1,200 and R$ 15", ["BRL", "JPY"]),
+        ("Worth 20 euros or 5 million dollars", ["EUR", "USD"]),
+        ("Billions of dollars", ["USD"]),
+    ],
+)
+def test_detects_currencies_on_either_side_of_the_amount(text, currencies):
+    assert TermMatcher().scan(text) == ({}, currencies)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "EUR weakens against the dollar",
+        "The USD index rose",
+        "Euro zone growth slows in 2024",
+        "Macron meets 27 EU leaders",
+    ],
+)
+def test_ignores_codes_and_numbers_without_an_amount(text):
+    assert TermMatcher().scan(text) == ({}, [])
+
+
+def test_counts_whole_word_phrases_ignoring_case_and_whitespace():
+    matcher = TermMatcher(["Central Bank", "rates"])
+
+    assert matcher.scan("central  bank holds RATES; rates-setters and central\nbank watchers") == (
+        {"Central Bank": 2, "rates": 2},
+        [],
+    )
+    assert matcher.scan("Centralbank firates") == ({}, [])
+
+
+def test_overlapping_phrases_count_the_longest_match():
+    matcher = TermMatcher(["bank", "central bank", "central bank digital currency"])
+
+    counts, _ = matcher.scan("The central bank digital currency, a central bank and a bank")
+
+    assert counts == {"central bank digital currency": 1, "central bank": 1, "bank": 1}
+
+
+def test_amount_wins_over_a_phrase_inside_it():
+    matcher = TermMatcher(["dollars", "oil"])
+
+    assert matcher.scan("Oil deal worth 5 million dollars, paid in dollars") == ({"oil": 1, "dollars": 1}, ["USD"])
+
+
+def test_matches_articles_and_batches_alike():
+    articles = [
+        NewsArticle(
+            article_id=str(i),
+            title="Central bank sells EUR 5 million of bonds",
+            date=date(2024, 7, 1),
+            url=f"https://www.reuters.com/markets/article-{i}/",
+            image_path="",
+            selected_section="all",
+            description="The central bank said" if i else "",
+        )
+        for i in range(2)
+    ]
+    matcher = TermMatcher(["central bank"])
+    batch = NewsBatch.from_articles(articles)
+
+    matcher.match_batch(articles)
+    matcher.match_batch(batch)
+
+    assert [article.phrase_matches for article in articles] == [{"central bank": 1}, {"central bank": 2}]
+    assert [article.currencies for article in articles] == [["EUR"], ["EUR"]]
+    assert [(article.phrase_matches, article.currencies) for article in batch] == [
+        (article.phrase_matches, article.currencies) for article in articles
+    ]
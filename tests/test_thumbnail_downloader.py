@@ -0,0 +1,79 @@
+from datetime import date
+from pathlib import Path
+from time import perf_counter
+from typing import List
+from uuid import uuid4
+from adapters.scraping.thumbnail_downloader import ThumbnailDownloader
+from core.domain.entities import NewsArticle
+
+# a JPEG signature followed by padding, so the thumbnails are saved with their sniffed extension
+THUMBNAIL = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00" + bytes(8 * 1024)
+LATENCY = 0.05
+ARTICLES = 24
+
+
+def thumbnail_route(path: str):
+    if path.startswith("/images/"):
+        return THUMBNAIL, "image/jpeg"
+    return None
+
+
+def make_articles(size: int) -> List[NewsArticle]:
+    return [
+        NewsArticle(
+            article_id=str(uuid4()),
+            title=f"Article {i}",
+            date=date(2024, 7, 1),
+            url=f"https://www.reuters.com/world/article-{i}-2024-07-01/",
+            image_path="",
+            selected_section="world",
+        )
+        for i in range(size)
+    ]
+
+
+def articles_per_second(base_url: str, output_dir: Path, workers: int) -> float:
+    downloader = ThumbnailDownloader(output_dir, workers=workers)
+    articles = make_articles(ARTICLES)
+    try:
+        start = perf_counter()
+        for i, article in enumerate(articles):
+            downloader.submit(article, f"{base_url}/images/{i}.jpg")
+        downloaded = downloader.wait()
+        elapsed = perf_counter() - start
+    finally:
+        downloader.close()
+
+    assert downloaded == ARTICLES
+    for article in articles:
+        assert Path(article.image_path).read_bytes() == THUMBNAIL
+        assert article.image_path.endswith(".jpg")
+        assert article.image_bytes == len(THUMBNAIL)
+    return ARTICLES / elapsed
+
+
+def test_pooled_downloads_raise_articles_per_second(serve, tmp_path):
+    base_url = serve(thumbnail_route, latency=LATENCY)
+    (tmp_path / "sequential").mkdir()
+    (tmp_path / "pooled").mkdir()
+
+    sequential = articles_per_second(base_url, tmp_path / "sequential", workers=1)
+    pooled = articles_per_second(base_url, tmp_path / "pooled", workers=8)
+
+    # 8 workers overlap the server latency, far more than the pool and thread overhead costs
+    assert pooled > 3 * sequential, f"pooled {pooled:.1f}/s, sequential {sequential:.1f}/s"
+
+
+def test_failed_download_leaves_image_path_empty(serve, tmp_path):
+    base_url = serve(thumbnail_route)
+    downloader = ThumbnailDownloader(tmp_path, workers=2)
+    found, missing = make_articles(2)
+    try:
+        downloader.submit(found, f"{base_url}/images/found.jpg")
+        downloader.submit(missing, f"{base_url}/missing.jpg")
+        assert downloader.wait() == 1
+    finally:
+        downloader.close()
+
+    assert Path(found.image_path).exists()
+    assert missing.image_path == ""
@@ -0,0 +1,35 @@
+import io
+from pathlib import Path
+from PIL import Image
+from adapters.scraping.thumbnail_downloader import ThumbnailDownloader
+from adapters.scraping.thumbnail_normalizer import ThumbnailNormalizer
+from test_thumbnail_downloader import make_articles
+
+
+def png(width: int, height: int) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 40, 40)).save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_download_threads_normalize_in_spawned_workers(serve, tmp_path):
+    large = png(1280, 720)
+    base_url = serve(lambda path: (large, "image/png") if path.startswith("/images/") else None)
+    normalizer = ThumbnailNormalizer(max_size=320, image_format="webp", workers=2).start()
+    assert normalizer.executor._mp_context.get_start_method() == "spawn"
+
+    downloader = ThumbnailDownloader(tmp_path, workers=4, normalizer=normalizer)
+    articles = make_articles(8)
+    try:
+        for i, article in enumerate(articles):
+            downloader.submit(article, f"{base_url}/images/{i}.png")
+        assert downloader.wait() == len(articles)
+    finally:
+        downloader.close()
+        normalizer.close()
+
+    for article in articles:
+        assert article.image_path.endswith(".webp")
+        assert (article.image_width, article.image_height) == (320, 180)
+        with Image.open(Path(article.image_path)) as image:
+            assert image.size == (320, 180)